@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
-from discord import Attachment, Bot, Interaction, Role, User, TextChannel
+from discord import Attachment, Bot, Interaction, InteractionType, Role, User, TextChannel
 
+from Classes.EntityResolver import EntityResolver
 from Classes.Jobs import JobManager
 from Classes.Positions import PositionManager
+from Classes.Startup import StartupPipeline, annotate, phase, record
 from Classes.Training import TrainingManager
+from Utils import Utilities as U, StartupState, WarmingUpError
 from Utils.Database import Database
 
 if TYPE_CHECKING:
@@ -20,6 +27,14 @@ class PartyBusBot(Bot):
 
     __slots__ = (
         "_image_dump",
+        "_startup",
+        "_ready_gate",
+        "_load_lock",
+        "_gate_timeout",
+        "_startup_profile",
+        "_profile_path",
+        "_profile_task",
+        "resolver",
         "training_manager",
         "position_manager",
         "database",
@@ -33,32 +48,289 @@ class PartyBusBot(Bot):
 
         self._image_dump: TextChannel = None  # type: ignore
         
+        self._startup: StartupState = StartupState.Cold
+        self._ready_gate: asyncio.Event = asyncio.Event()
+        self._load_lock: asyncio.Lock = asyncio.Lock()
+        # Interactions must be answered within 3s, so don't hold one longer.
+        self._gate_timeout: float = float(os.getenv("STARTUP_GATE_TIMEOUT", 2.0))
+        
+        self._startup_profile: Optional[Dict[str, Any]] = None
+        self._profile_path: Path = Path(os.getenv("STARTUP_PROFILE_PATH", ".cache/startup_profile.json"))
+        self._profile_task: Optional[asyncio.Task] = None
+        
+        self.resolver: EntityResolver = EntityResolver(self)
         self.database: Database = Database(self)
         
+        # Both only count while a startup stage is running; see Startup.record.
+        self._count_rest_calls()
+        self.database.metrics.add_listener(lambda *_: record("db"))
+        
         self.training_manager: TrainingManager = TrainingManager(self)
         self.position_manager: PositionManager = PositionManager(self)
         self.job_manager: JobManager = JobManager(self)
 
+################################################################################
+    @property
+    def startup_state(self) -> StartupState:
+
+        return self._startup
+
+################################################################################
+    @property
+    def is_loaded(self) -> bool:
+
+        return self._startup is StartupState.Ready
+
 ################################################################################
     async def load_all(self) -> None:
+        """Loads everything exactly once. Discord fires on_ready again after
+        every reconnect, so later calls only resync what may have gone stale
+        while the bot was away. A failed load is retried on the next call."""
+
+        async with self._load_lock:
+            if self._startup is StartupState.Ready:
+                await self.resync()
+                return
+
+            self._startup = StartupState.Loading
+            try:
+                await self._load_all()
+            except Exception:
+                self._startup = StartupState.Failed
+                raise
+
+            self._startup = StartupState.Ready
+            self._ready_gate.set()
+
+################################################################################
+    async def _load_all(self) -> None:
+
+        pipeline = StartupPipeline()
+        signup = self.training_manager.trainer_signup_message
+
+        # Positions have to exist before trainings, qualifications and jobs
+        # can resolve them; everything else is independent.
+        pipeline.add("image_dump", self._load_image_dump)
+        pipeline.add("connect", self.database.connect)
+        pipeline.add("structure", self._assert_structure, after=("connect",))
+        pipeline.add("data", self._load_data, after=("structure",))
+        pipeline.add("positions", lambda: self.position_manager.load_all(pipeline["data"]), after=("data",))
+        pipeline.add("training", lambda: self.training_manager.load_all(pipeline["data"]), after=("positions",))
+        pipeline.add("jobs", lambda: self.job_manager.load_all(pipeline["data"]), after=("positions",))
+        pipeline.add(
+            "signup_message",
+            lambda: signup.load(pipeline["data"]["messages"]["trainer_message"]),
+            after=("data",)
+        )
+        pipeline.add("signup_view", self._attach_signup_view, after=("training", "signup_message"))
+        pipeline.add("hydration", self._hydrate_users, after=("training", "jobs"), background=True)
+
+        await pipeline.run()
+
+        print("Done!")
+        for line in pipeline.report():
+            print(f"  {line}")
+
+        self._profile_task = asyncio.create_task(self._save_startup_profile(pipeline))
+
+################################################################################
+    async def _load_image_dump(self) -> None:
 
         print("Fetching image dump...")
-        self._image_dump = await self.fetch_channel(991902526188302427)
+        self._image_dump = await self.resolver.channel(991902526188302427)
+
+################################################################################
+    async def _attach_signup_view(self) -> None:
+
+        self.training_manager.trainer_signup_message.attach_view()
+
+################################################################################
+    async def _assert_structure(self) -> None:
 
         print("Asserting database structure...")
-        self.database.assert_structure()
-        
-        print("Loading data from database...")
-        data = self.database.load_all()
-        
-        await self.position_manager.load_all(data)
-        print("Position Manager Loaded!")
-        await self.training_manager.load_all(data)
-        print("Training Manager Loaded!")
-        await self.job_manager.load_all(data)
-        print("Job Manager Loaded!")
+        await self.database.assert_structure()
 
-        print("Done!")
+################################################################################
+    async def _load_data(self) -> Dict[str, Any]:
+
+        data = await self.database.load_all(on_table=self._table_loaded)
+
+        if data["source"] == "database":
+            annotate(source="database", per_table_timing=data["stats"]["per_table_timing"])
+        else:
+            annotate(source="snapshot")
+
+        return data
+
+################################################################################
+    @staticmethod
+    def _table_loaded(name: str, rows: int, ms: Optional[float]) -> None:
+
+        # The bulk read bypasses the unit of work, so its statements aren't
+        # seen by the metrics listener. On Postgres every result arrives
+        # together, so ``ms`` is None and a table's wall time is only how
+        # long it took to decode.
+        record("db")
+        phase(name, ms, db=1, rows=rows)
+
+################################################################################
+    async def _hydrate_users(self) -> None:
+
+        # Users resolve lazily, so nothing waits on this; it just warms the
+        # cache so the first DM or avatar lookup for each of them is free.
+        ids = [t.user_id for t in self.training_manager.tusers]
+        for job in self.job_manager.jobs:
+            ids.append(job.requestor.id)
+            if job.applicant is not None:
+                ids.append(job.applicant.id)
+
+        users = await self.resolver.users(ids, label="users")
+        annotate(users=len(users), not_found=sum(1 for u in users.values() if u is None))
+
+################################################################################
+    def _count_rest_calls(self) -> None:
+
+        request = self.http.request
+
+        async def counted(*args, **kwargs):
+            record("rest")
+            return await request(*args, **kwargs)
+
+        self.http.request = counted
+
+################################################################################
+    async def _save_startup_profile(self, pipeline: StartupPipeline) -> None:
+
+        await pipeline.finished()
+
+        profile = pipeline.to_dict()
+        try:
+            self._startup_profile = await asyncio.to_thread(self._write_startup_profile, profile)
+        except OSError as ex:
+            self._startup_profile = profile
+            print(f"Couldn't write startup profile to {self._profile_path}: {ex!r}")
+
+################################################################################
+    def _write_startup_profile(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Appends ``profile`` to the history file, keeping the last
+        STARTUP_PROFILE_HISTORY runs, and returns it with the previous run's
+        readiness time attached for comparison."""
+
+        try:
+            runs = json.loads(self._profile_path.read_text())["runs"]
+        except (OSError, ValueError, KeyError):
+            runs = []
+
+        if runs:
+            profile["previous_ready_ms"] = runs[-1].get("ready_ms")
+
+        runs = (runs + [profile])[-int(os.getenv("STARTUP_PROFILE_HISTORY", 20)):]
+
+        self._profile_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._profile_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"runs": runs}, indent=2))
+        os.replace(tmp, self._profile_path)
+
+        return profile
+
+################################################################################
+    async def resync(self) -> None:
+        """Refreshes the Discord-side state after a reconnect. The database
+        is only ever written by this process, so the in-memory data is still
+        current and isn't reloaded."""
+
+        print("Reconnected; resyncing...")
+
+        await self.position_manager.roles.prime()
+        await self.training_manager.trainer_signup_message.resync()
+        self.training_manager.trainer_signup_message.attach_view()
+
+        print("Resync done!")
+
+################################################################################
+    async def process_application_commands(
+        self,
+        interaction: Interaction,
+        auto_sync_commands: Optional[bool] = None
+    ) -> None:
+
+        # Hold commands that arrive mid-load briefly rather than letting them
+        # run against half-populated managers.
+        if not self._ready_gate.is_set():
+            try:
+                await asyncio.wait_for(self._ready_gate.wait(), self._gate_timeout)
+            except asyncio.TimeoutError:
+                if interaction.type is InteractionType.application_command:
+                    await interaction.respond(embed=WarmingUpError(), ephemeral=True)
+                return
+
+        await super().process_application_commands(interaction, auto_sync_commands)
+
+################################################################################
+    async def close(self) -> None:
+
+        await self.database.close()
+        await super().close()
+
+################################################################################
+    async def database_stats(self, interaction: Interaction, limit: int = 10) -> None:
+
+        metrics = self.database.metrics
+        top = metrics.report(limit) or ["No statements recorded yet."]
+        slow = [
+            f"`{q.tag}` {q.ms:.0f}ms ({q.rows} rows)"
+            for q in metrics.slow_log[-5:]
+        ] or ["None."]
+
+        embed = U.make_embed(
+            title="Database Statistics",
+            description="\n".join(top)[:4000],
+            fields=[
+                (f"Recent Slow Queries (>= {metrics.slow_ms:.0f}ms)", "\n".join(slow), False),
+            ]
+        )
+
+        await interaction.respond(embed=embed, ephemeral=True)
+
+################################################################################
+    async def startup_report(self, interaction: Interaction) -> None:
+
+        profile = self._startup_profile
+        if profile is None:
+            await interaction.respond("No startup profile has been recorded yet.", ephemeral=True)
+            return
+
+        lines = []
+        for stage in profile["stages"]:
+            counters = ", ".join(f"{v} {k}" for k, v in sorted(stage["counters"].items())) or "-"
+            lines.append(
+                f"`{stage['name']:<14}` {stage['start_ms']:>8.0f} -> {stage['end_ms']:>8.0f}ms "
+                f"({stage['ms']:.0f}ms) {counters}"
+            )
+            for sub in stage.get("phases", ()):
+                counters = ", ".join(f"{v} {k}" for k, v in sorted(sub["counters"].items())) or "-"
+                measured = f", {sub['ms']:.0f}ms measured" if sub["ms"] is not None else ""
+                lines.append(
+                    f"`  {sub['name']:<12}` {'':>8}    {sub['end_ms']:>8.0f}ms "
+                    f"({sub['wall_ms']:.0f}ms{measured}) {counters}"
+                )
+
+        ready = f"{profile['ready_ms']:.0f}ms"
+        previous = profile.get("previous_ready_ms")
+        if previous is not None:
+            ready += f" ({profile['ready_ms'] - previous:+.0f}ms vs. last start)"
+
+        embed = U.make_embed(
+            title="Startup Timeline",
+            description="\n".join(lines)[:4000],
+            fields=[
+                ("Ready In", ready, True),
+                ("Peak RSS", f"{profile['peak_rss_mb']}MB" if profile["peak_rss_mb"] is not None else "n/a", True),
+                ("Critical Path", " -> ".join(profile["critical_path"]) or "n/a", False),
+            ]
+        )
+
+        await interaction.respond(embed=embed, ephemeral=True)
 
 ################################################################################
     async def dump_image(self, image: Attachment) -> str:
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from discord import Forbidden, Message, NotFound, TextChannel, User
+
+if TYPE_CHECKING:
+    from Classes import PartyBusBot
+################################################################################
+
+__all__ = ("EntityResolver",)
+
+################################################################################
+class EntityResolver:
+    """The one place Discord users, channels and messages are resolved.
+
+    Lookups try the gateway cache first, then this resolver's own bounded LRU,
+    and only then REST. Concurrent requests for the same ID share a single
+    in-flight fetch, REST fetches are capped at ``concurrency`` at a time, and
+    a NotFound/Forbidden answer is cached as None so a dead ID isn't retried
+    until its (shorter) negative TTL runs out. Other HTTP errors aren't
+    cached and propagate to the caller, who knows whether they can be
+    ignored."""
+
+    __slots__ = (
+        "_state",
+        "_cache",
+        "_inflight",
+        "_semaphore",
+        "_maxsize",
+        "_ttl",
+        "_negative_ttl",
+        "_fetches",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        state: PartyBusBot,
+        *,
+        maxsize: int = 5000,
+        ttl: float = 3600,
+        negative_ttl: float = 300,
+        concurrency: int = 8
+    ) -> None:
+
+        self._state: PartyBusBot = state
+
+        self._maxsize: int = maxsize
+        self._ttl: float = ttl
+        self._negative_ttl: float = negative_ttl
+
+        self._cache: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+        self._fetches: int = 0
+
+################################################################################
+    @property
+    def fetches(self) -> int:
+        """How many REST calls the resolver has made."""
+
+        return self._fetches
+
+################################################################################
+    def get_user(self, user_id: Optional[int]) -> Optional[User]:
+        """Cache-only lookup; never touches REST."""
+
+        if user_id is None:
+            return None
+
+        user = self._state.get_user(user_id)
+        if user is not None:
+            return user
+
+        for guild in self._state.guilds:
+            member = guild.get_member(user_id)
+            if member is not None:
+                return member
+
+        return self._cached(("user", user_id))
+
+################################################################################
+    async def user(self, user_id: Optional[int]) -> Optional[User]:
+
+        if user_id is None:
+            return None
+
+        return self.get_user(user_id) or await self._resolve(
+            ("user", user_id), lambda: self._state.fetch_user(user_id)
+        )
+
+################################################################################
+    async def users(self, user_ids: Iterable[Optional[int]], label: Optional[str] = None) -> Dict[int, Optional[User]]:
+        """Resolves many users at once; cache hits cost nothing and misses are
+        fetched concurrently. With a ``label``, progress and timing are
+        printed."""
+
+        start = perf_counter()
+        users: Dict[int, Optional[User]] = {}
+        misses = []
+
+        for user_id in dict.fromkeys(u for u in user_ids if u is not None):
+            user = self.get_user(user_id)
+            if user is not None:
+                users[user_id] = user
+            else:
+                misses.append(user_id)
+
+        step = max(len(misses) // 10, 1)
+        done = 0
+
+        async def _fetch(user_id: int) -> None:
+            nonlocal done
+            users[user_id] = await self.user(user_id)
+
+            done += 1
+            if label is not None and (done % step == 0 or done == len(misses)):
+                print(f"Fetched {done}/{len(misses)} uncached {label}...")
+
+        await asyncio.gather(*(_fetch(user_id) for user_id in misses))
+
+        if label is not None:
+            print(
+                f"Resolved {len(users)} {label} in {round((perf_counter() - start) * 1000, 2)}ms "
+                f"({len(users) - len(misses)} cached, {len(misses)} fetched, "
+                f"{sum(1 for u in users.values() if u is None)} not found)."
+            )
+
+        return users
+
+################################################################################
+    async def channel(self, channel_id: Optional[int]) -> Optional[TextChannel]:
+
+        if channel_id is None:
+            return None
+
+        return self._state.get_channel(channel_id) or await self._resolve(
+            ("channel", channel_id), lambda: self._state.fetch_channel(channel_id)
+        )
+
+################################################################################
+    async def message(self, channel: Optional[TextChannel], message_id: Optional[int]) -> Optional[Message]:
+
+        if channel is None or message_id is None:
+            return None
+
+        return self._state.get_message(message_id) or await self._resolve(
+            ("message", message_id), lambda: channel.fetch_message(message_id)
+        )
+
+################################################################################
+    def invalidate(self, kind: str, entity_id: int) -> None:
+
+        self._cache.pop((kind, entity_id), None)
+
+################################################################################
+    def _cached(self, key: Hashable) -> Any:
+
+        try:
+            value, expires = self._cache[key]
+        except KeyError:
+            return None
+
+        if expires < monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return value
+
+################################################################################
+    def _store(self, key: Hashable, value: Any) -> None:
+
+        ttl = self._ttl if value is not None else self._negative_ttl
+        self._cache[key] = (value, monotonic() + ttl)
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+################################################################################
+    async def _resolve(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+
+        if key in self._cache:
+            value, expires = self._cache[key]
+            if expires >= monotonic():
+                self._cache.move_to_end(key)
+                return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.create_task(self._fetch(key, fetch))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one caller being cancelled doesn't cancel the fetch
+        # for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+################################################################################
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+
+        async with self._semaphore:
+            self._fetches += 1
+            try:
+                value = await fetch()
+            except (NotFound, Forbidden):
+                value = None
+
+        self._store(key, value)
+        return value
+
+################################################################################
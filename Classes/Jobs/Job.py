@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from datetime import date, time
-from discord import Interaction, User, Embed, NotFound, HTTPException
+from discord import Interaction, User, Embed
 from typing import TYPE_CHECKING, List, Type, TypeVar, Optional, Tuple, Dict, Any
 
 from .Compensation import Compensation
 from .Details import JobDetails
 from .Schedule import Schedule
 from .Users import JobUsers
+from Classes.LazyUser import LazyUser
 
 from Utils import Utilities as U, CompensationType
 
@@ -59,7 +60,7 @@ class Job:
         self._id = manager.bot.database.insert.job(requester.id)
         self._manager = manager
         
-        self._users = JobUsers(self, requester)
+        self._users = JobUsers(self, LazyUser.of(manager.bot.resolver, requester))
         self._details = JobDetails(self)
         self._schedule = Schedule(self)
         self._compensation = Compensation(self)
@@ -68,29 +69,14 @@ class Job:
     
 ################################################################################    
     @classmethod
-    async def load(cls: Type[J], manager: JobManager, data: Tuple[Any, ...]) -> J:
+    def load(cls: Type[J], manager: JobManager, data: Tuple[Any, ...]) -> J:
 
-        requestor = manager.bot.get_user(data[9])
-        applicant = manager.bot.get_user(data[10])
-
-        if requestor is None:
-            try: 
-                requestor = await manager.bot.fetch_user(data[9])
-            except (NotFound, HTTPException):
-                requestor = None
-                
-        if applicant is None:
-            try:
-                applicant = await manager.bot.fetch_user(data[10])
-            except (NotFound, HTTPException):
-                applicant = None
-        
         self: J = cls.__new__(cls)
         
         self._id = data[0]
         self._manager = manager
         
-        self._users = JobUsers.load(self, requestor, applicant)
+        self._users = JobUsers.load(self, data[9], data[10])
         self._details = JobDetails.load(self, data[1:4])
         self._schedule = Schedule.load(self, data[4:7])
         self._compensation = Compensation.load(self, data[7:9])
@@ -177,13 +163,13 @@ class Job:
     
 ################################################################################    
     @property
-    def requestor(self) -> User:
+    def requestor(self) -> LazyUser:
         
         return self._users.requestor
     
 ################################################################################
     @property
-    def applicant(self) -> Optional[User]:
+    def applicant(self) -> Optional[LazyUser]:
         
         return self._users.applicant
     
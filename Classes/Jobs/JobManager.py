@@ -33,8 +33,10 @@ class JobManager:
     async def load_all(self, data: Dict[str, Any]):
         
         jobs_data = data.get("jobs", [])
+        self._jobs = []
+        
         for job_data in jobs_data:
-            job = await Job.load(self, job_data)
+            job = Job.load(self, job_data)
             self._jobs.append(job)
 
 ################################################################################
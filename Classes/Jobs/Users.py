@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Optional
 
 from discord import User
 
+from Classes.LazyUser import LazyUser
+
 if TYPE_CHECKING:
     from Classes import Job
 ################################################################################
@@ -23,43 +25,48 @@ class JobUsers:
     def __init__(
         self, 
         parent: Job, 
-        requestor: User,
-        applicant: Optional[User] = None
+        requestor: LazyUser,
+        applicant: Optional[LazyUser] = None
     ) -> None:
 
         self._parent: Job = parent
         
-        self._requestor: User = requestor
-        self._applicant: Optional[User] = applicant
+        self._requestor: LazyUser = requestor
+        self._applicant: Optional[LazyUser] = applicant
 
 ################################################################################
     @classmethod
-    def load(cls, parent: Job, requestor: User, applicant: Optional[User] = None) -> JobUsers:
+    def load(cls, parent: Job, requestor_id: int, applicant_id: Optional[int] = None) -> JobUsers:
         
-        return cls(parent, requestor, applicant)
+        resolver = parent.bot.resolver
+        return cls(
+            parent,
+            LazyUser(resolver, requestor_id),
+            LazyUser(resolver, applicant_id) if applicant_id is not None else None
+        )
     
 ################################################################################
     @property
-    def requestor(self) -> User:
+    def requestor(self) -> LazyUser:
         
         return self._requestor
     
     @requestor.setter
     def requestor(self, value: User) -> None:
         
-        self._requestor = value
+        self._requestor = LazyUser.of(self._parent.bot.resolver, value)
         self.update()
         
 ################################################################################
     @property
-    def applicant(self) -> User:
+    def applicant(self) -> Optional[LazyUser]:
         
         return self._applicant
     
     @applicant.setter
-    def applicant(self, value: User) -> None:
+    def applicant(self, value: Optional[User]) -> None:
         
-        self._applicant = value
+        self._applicant = LazyUser.of(self._parent.bot.resolver, value) if value is not None else None
         self.update()
         
 ################################################################################
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional, Type, TypeVar
+
+from discord import Asset, Message, User
+
+if TYPE_CHECKING:
+    from Classes.EntityResolver import EntityResolver
+################################################################################
+
+__all__ = ("LazyUser",)
+
+LU = TypeVar("LU", bound="LazyUser")
+
+################################################################################
+class LazyUser:
+    """Stands in for a :class:`discord.User` that is only known by ID.
+
+    ``id`` and ``mention`` never need the user at all, and ``name`` falls
+    back to the name stored alongside the entity, so rendering an embed
+    never blocks on REST. The real user is picked up from the resolver's
+    caches whenever it happens to be there, and only fetched when something
+    actually needs it, such as sending a DM."""
+
+    __slots__ = (
+        "_resolver",
+        "_id",
+        "_name",
+        "_user",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        resolver: EntityResolver,
+        user_id: int,
+        name: Optional[str] = None,
+        user: Optional[User] = None
+    ) -> None:
+
+        self._resolver: EntityResolver = resolver
+        self._id: int = user_id
+        self._name: Optional[str] = name
+        self._user: Optional[User] = user
+
+################################################################################
+    @classmethod
+    def of(cls: Type[LU], resolver: EntityResolver, user: User) -> LU:
+
+        return cls(resolver, user.id, user.name, user)
+
+################################################################################
+    def __eq__(self, other: Any) -> bool:
+
+        return self._id == getattr(other, "id", None)
+
+################################################################################
+    def __hash__(self) -> int:
+
+        return hash(self._id)
+
+################################################################################
+    def __repr__(self) -> str:
+
+        return f"<LazyUser id={self._id} resolved={self._user is not None}>"
+
+################################################################################
+    @property
+    def id(self) -> int:
+
+        return self._id
+
+################################################################################
+    @property
+    def cached(self) -> Optional[User]:
+        """The real user if any cache has it; never touches REST."""
+
+        if self._user is None:
+            self._user = self._resolver.get_user(self._id)
+
+        return self._user
+
+################################################################################
+    @property
+    def name(self) -> str:
+
+        user = self.cached
+        if user is not None:
+            return user.name
+
+        return self._name or str(self._id)
+
+################################################################################
+    @property
+    def display_name(self) -> str:
+
+        user = self.cached
+        return user.display_name if user is not None else self.name
+
+################################################################################
+    @property
+    def mention(self) -> str:
+
+        return f"<@{self._id}>"
+
+################################################################################
+    @property
+    def display_avatar(self) -> Optional[Asset]:
+
+        user = self.cached
+        return user.display_avatar if user is not None else None
+
+################################################################################
+    async def resolve(self) -> Optional[User]:
+
+        if self.cached is None:
+            self._user = await self._resolver.user(self._id)
+
+        return self._user
+
+################################################################################
+    async def send(self, *args: Any, **kwargs: Any) -> Optional[Message]:
+        """DMs the user, resolving them first. Returns None if Discord no
+        longer knows who they are."""
+
+        user = await self.resolve()
+        if user is None:
+            return None
+
+        return await user.send(*args, **kwargs)
+
+################################################################################
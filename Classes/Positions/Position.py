@@ -30,9 +30,8 @@ class Position:
         "_manager",
         "_id",
         "_name",
-        "_trainer_role",
-        "_trainee_role",
-        "_requirements"
+        "_trainer_role_id",
+        "_trainee_role_id",
     )
     
 ################################################################################
@@ -41,19 +40,20 @@ class Position:
         mgr: PositionManager,
         _id: str, 
         name: str,
-        trainer_role: Optional[Role] = None,
-        trainee_role: Optional[Role] = None,
-        reqs: Optional[List[str]] = None
+        trainer_role_id: Optional[int] = None,
+        trainee_role_id: Optional[int] = None
     ) -> None:
         
         self._manager: PositionManager = mgr
         self._id: str = _id
         self._name: str = name
         
-        self._trainer_role: Optional[Role] = trainer_role
-        self._trainee_role: Optional[Role] = trainee_role
+        # Roles are looked up through the manager's shared resolver, so only
+        # the IDs are kept here.
+        self._trainer_role_id: Optional[int] = trainer_role_id
+        self._trainee_role_id: Optional[int] = trainee_role_id
         
-        self._requirements: List[Requirement] = reqs or []
+        # Requirements live in the manager's registry, keyed by this position's ID.
         
 ################################################################################
     def __eq__(self, other: Position) -> bool:
@@ -69,30 +69,9 @@ class Position:
     
 ################################################################################
     @classmethod
-    async def load(
-        cls: Type[P], 
-        mgr: PositionManager, 
-        data: Tuple[str, str, int, int],
-        requirements: List[Tuple[str, str, str]]
-    ) -> P:
+    def load(cls: Type[P], mgr: PositionManager, data: Tuple[str, str, int, int]) -> P:
         
-        guild = mgr.bot.get_guild(GUILD_ID)
-        
-        trainer_role = trainee_role = None
-        if data[2] is not None:
-            try:
-                trainer_role = await guild._fetch_role(data[2])
-            except HTTPException:
-                trainer_role = None
-        if data[3] is not None:
-            try:
-                trainee_role = await guild._fetch_role(data[3])
-            except HTTPException:
-                trainee_role = None
-        
-        reqs = [Requirement.load(mgr.bot, r) for r in requirements]
-        
-        return cls(mgr, data[0], data[1], trainer_role, trainee_role, reqs)
+        return cls(mgr, data[0], data[1], data[2], data[3])
         
 ################################################################################
     @property
@@ -116,40 +95,60 @@ class Position:
     @name.setter
     def name(self, value: str) -> None:
         
-        self._name = value
+        old_name, self._name = self._name, value
+        self._manager.position_renamed(self, old_name)
         self.update()
         
 ################################################################################    
     @property
     def trainer_role(self) -> Optional[Role]:
         
-        return self._trainer_role
+        return self._manager.roles.get(self._trainer_role_id)
 
 ################################################################################
     @trainer_role.setter
     def trainer_role(self, value: Optional[Role]) -> None:
         
-        self._trainer_role = value
+        self._trainer_role_id = value.id if value is not None else None
         self.update()
         
+################################################################################    
+    @property
+    def trainer_role_id(self) -> Optional[int]:
+        
+        return self._trainer_role_id
+    
 ################################################################################    
     @property
     def trainee_role(self) -> Optional[Role]:
         
-        return self._trainee_role
+        return self._manager.roles.get(self._trainee_role_id)
 
 ################################################################################
     @trainee_role.setter
     def trainee_role(self, value: Optional[Role]) -> None:
         
-        self._trainee_role = value
+        self._trainee_role_id = value.id if value is not None else None
         self.update()
     
+################################################################################    
+    @property
+    def trainee_role_id(self) -> Optional[int]:
+        
+        return self._trainee_role_id
+    
 ################################################################################    
     @property
     def requirements(self) -> List[Requirement]:
         
-        return self._requirements
+        return self._manager.requirements.for_parent(self.id)
+    
+################################################################################
+    @property
+    def effective_requirements(self) -> Tuple[Requirement, ...]:
+        """This position's requirements followed by the global ones."""
+        
+        return self._manager.requirements.effective(self.id)
     
 ################################################################################
     @property
@@ -158,11 +157,9 @@ class Position:
         return SelectOption(label=self.name, value=self.id)
     
 ################################################################################
-    def get_requirement(self, req_id: str) -> Requirement:
+    def get_requirement(self, req_id: str) -> Optional[Requirement]:
             
-        for r in self.requirements:
-            if r.id == req_id:
-                return r
+        return self._manager.requirements.get(req_id, self.id)
             
 ################################################################################
     def format_qualification(self, qualifications: List[Qualification]) -> str:
@@ -253,12 +250,15 @@ class Position:
             await interaction.respond(embed=error, ephemeral=True)
             return
         
-        try:
-            role = await interaction.guild._fetch_role(role_id)
-        except HTTPException:
-            error = InvalidRoleIDError(modal.value)
-            await interaction.respond(embed=error, ephemeral=True)
-            return
+        role = self._manager.roles.get(role_id)
+        if role is None:
+            try:
+                role = await interaction.guild._fetch_role(role_id)
+            except HTTPException:
+                error = InvalidRoleIDError(modal.value)
+                await interaction.respond(embed=error, ephemeral=True)
+                return
+            self._manager.roles.store(role)
         
         if operation == "Trainer":
             self.trainer_role = role
@@ -278,7 +278,7 @@ class Position:
         if not modal.complete:
             return
         
-        self._requirements.append(Requirement.new(self.bot, self.id, modal.value))
+        self._manager.requirements.add(Requirement.new(self.bot, self.id, modal.value))
         self.update()
         
 ################################################################################
@@ -299,10 +299,14 @@ class Position:
         if not view.complete or view.value is False:
             return
         
+        # Removed by someone else while the menu was open.
         requirement = self.get_requirement(view.value)
+        if requirement is None:
+            return
+        
         requirement.delete()
         
-        self.requirements.remove(requirement)
+        self._manager.requirements.remove(requirement)
         self.update()
     
 ################################################################################    
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from Classes import Position
+################################################################################
+
+__all__ = ("PositionCatalogue",)
+
+################################################################################
+class PositionCatalogue:
+    """Every position, kept in name order and indexed by ID and case-folded
+    name.
+
+    The order is maintained on insert rather than re-sorted on read, so a
+    lookup is a dict hit and listing the positions is a copy. Renames have to
+    go through ``rename`` so the order and name index follow along."""
+
+    __slots__ = (
+        "_by_id",
+        "_by_name",
+        "_keys",
+        "_ordered",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._by_id: Dict[str, Position] = {}
+        self._by_name: Dict[str, Position] = {}
+
+        # Parallel lists: the sort key of each entry in _ordered.
+        self._keys: List[Tuple[str, str]] = []
+        self._ordered: List[Position] = []
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._ordered)
+
+################################################################################
+    def __iter__(self) -> Iterator[Position]:
+
+        return iter(self._ordered)
+
+################################################################################
+    def __contains__(self, position_id: str) -> bool:
+
+        return position_id in self._by_id
+
+################################################################################
+    @property
+    def ordered(self) -> List[Position]:
+
+        return list(self._ordered)
+
+################################################################################
+    def add(self, position: Position) -> None:
+
+        if position.id in self._by_id:
+            self.remove(position)
+
+        self._by_id[position.id] = position
+        self._by_name[position.name.casefold()] = position
+        self._insert(position, position.name)
+
+################################################################################
+    def remove(self, position: Position) -> None:
+
+        position = self._by_id.pop(position.id, None)
+        if position is None:
+            return
+
+        self._forget_name(position, position.name)
+        self._delete(position, position.name)
+
+################################################################################
+    def rename(self, position: Position, old_name: str) -> None:
+        """Re-files ``position`` under its current name. Call after the name
+        has changed."""
+
+        if position.id not in self._by_id:
+            return
+
+        self._forget_name(position, old_name)
+        self._by_name[position.name.casefold()] = position
+
+        self._delete(position, old_name)
+        self._insert(position, position.name)
+
+################################################################################
+    def clear(self) -> None:
+
+        self._by_id.clear()
+        self._by_name.clear()
+        self._keys.clear()
+        self._ordered.clear()
+
+################################################################################
+    def get(self, position_id: str) -> Optional[Position]:
+
+        return self._by_id.get(position_id)
+
+################################################################################
+    def get_by_name(self, name: str) -> Optional[Position]:
+
+        return self._by_name.get(name.casefold())
+
+################################################################################
+    def _insert(self, position: Position, name: str) -> None:
+
+        # The ID breaks ties, so positions with the same name keep a stable order.
+        key = (name, position.id)
+        index = bisect_left(self._keys, key)
+
+        self._keys.insert(index, key)
+        self._ordered.insert(index, position)
+
+################################################################################
+    def _delete(self, position: Position, name: str) -> None:
+
+        index = bisect_left(self._keys, (name, position.id))
+        if index < len(self._keys) and self._keys[index] == (name, position.id):
+            del self._keys[index]
+            del self._ordered[index]
+
+################################################################################
+    def _forget_name(self, position: Position, name: str) -> None:
+
+        # Only drop the entry if it's this position's; another may share the name.
+        if self._by_name.get(name.casefold()) is position:
+            del self._by_name[name.casefold()]
+
+################################################################################
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 from discord import Interaction, SelectOption, Embed, EmbedField
 from typing import TYPE_CHECKING, List, Tuple, Optional, Dict, Any
-from Classes.Positions.Position import Position
+from Classes.Positions.Position import Position, GUILD_ID
+from Classes.Positions.PositionCatalogue import PositionCatalogue
 from Classes.Positions.Requirement import Requirement
+from Classes.Positions.RequirementRegistry import RequirementRegistry, GLOBAL
+from Classes.Positions.RoleResolver import RoleResolver
 from UI.Positions import (
     PositionGeneralStatusView,
     PositionStatusView,
@@ -27,6 +30,7 @@ class PositionManager:
         "_state",
         "_positions",
         "_requirements",
+        "_roles",
     )
     
 ################################################################################
@@ -34,8 +38,10 @@ class PositionManager:
         
         self._state: PartyBusBot = state
         
-        self._positions: List[Position] = []
-        self._requirements: List[Requirement] = []
+        self._positions: PositionCatalogue = PositionCatalogue()
+        self._requirements: RequirementRegistry = RequirementRegistry()
+        
+        self._roles: RoleResolver = RoleResolver(state, GUILD_ID)
     
 ################################################################################
     @property
@@ -47,13 +53,24 @@ class PositionManager:
     @property
     def positions(self) -> List[Position]:
         
-        self._positions.sort(key=lambda p: p.name)
-        return self._positions
+        return self._positions.ordered
+    
+################################################################################
+    @property
+    def roles(self) -> RoleResolver:
+        
+        return self._roles
     
 ################################################################################
     @property
     def global_requirements(self) -> List[Requirement]:
         
+        return self._requirements.for_parent(GLOBAL)
+    
+################################################################################
+    @property
+    def requirements(self) -> RequirementRegistry:
+        
         return self._requirements
     
 ################################################################################
@@ -62,19 +79,16 @@ class PositionManager:
         position_data = data["positions"]
         requirement_data = data["requirements"]
         
-        requirements = {"0": []}
+        await self._roles.prime()
+        
+        self._positions.clear()
+        self._requirements.clear()
+        
         for req in requirement_data:
-            if req[1] not in requirements.keys():
-                requirements[req[1]] = []
-            requirements[req[1]].append(req)
-            
-        self._requirements.extend(
-            [Requirement.load(self.bot, r) for r in requirements["0"]]
-        )
+            self._requirements.add(Requirement.load(self.bot, req))
         
         for pos in position_data:
-            reqs = requirements.get(pos[0], [])
-            self._positions.append(await Position.load(self, pos, reqs))
+            self._positions.add(Position.load(self, pos))
         
 ################################################################################
     def select_options(self) -> List[SelectOption]:
@@ -82,11 +96,9 @@ class PositionManager:
         return [p.select_option for p in self.positions]
     
 ################################################################################
-    def get_position(self, position_id: str) -> Position:
+    def get_position(self, position_id: str) -> Optional[Position]:
         
-        for position in self.positions:
-            if position.id == position_id:
-                return position
+        return self._positions.get(position_id)
             
 ################################################################################
     def get_position_by_name(self, position_name: Optional[str]) -> Optional[Position]:
@@ -94,16 +106,24 @@ class PositionManager:
         if position_name is None:
             return None
         
-        for position in self.positions:
-            if position.name.lower() == position_name.lower():
-                return position
+        return self._positions.get_by_name(position_name)
           
 ################################################################################
-    def get_global_requirement(self, req_id: str) -> Requirement:
+    def position_renamed(self, position: Position, old_name: str) -> None:
+        
+        self._positions.rename(position, old_name)
+        
+################################################################################
+    def position_deleted(self, position: Position) -> None:
+        """Call when a position is deleted, so nothing keeps it cached."""
+        
+        self._positions.remove(position)
+        self._requirements.forget(position.id)
+        
+################################################################################
+    def get_global_requirement(self, req_id: str) -> Optional[Requirement]:
     
-        for r in self.global_requirements:
-            if r.id == req_id:
-                return r
+        return self._requirements.get(req_id, GLOBAL)
         
 ################################################################################
     async def add_position(self, interaction: Interaction, position_name: str) -> None:
@@ -115,7 +135,7 @@ class PositionManager:
             return
 
         position = Position.new(self, position_name.title())
-        self._positions.append(position)
+        self._positions.add(position)
 
         await position.menu(interaction)
         
@@ -206,8 +226,8 @@ class PositionManager:
         if not modal.complete:
             return
         
-        requirement = Requirement.new(self.bot, "0", modal.value)
-        self._requirements.append(requirement)
+        requirement = Requirement.new(self.bot, GLOBAL, modal.value)
+        self._requirements.add(requirement)
     
 ################################################################################
     async def remove_global_requirement(self, interaction: Interaction) -> None:
@@ -228,6 +248,9 @@ class PositionManager:
             return
 
         requirement = self.get_global_requirement(view.value)
+        if requirement is None:
+            return
+        
         requirement.delete()
 
         self._requirements.remove(requirement)
@@ -235,6 +258,6 @@ class PositionManager:
 ################################################################################    
     def global_requirement_select_options(self) -> List[SelectOption]:
 
-        return [r.select_option for r in self._requirements]
+        return [r.select_option for r in self.global_requirements]
     
 ################################################################################
@@ -74,9 +74,8 @@ class Requirement:
 ################################################################################
     def line_item(self, overrides: Dict[str, RequirementLevel]) -> str:
 
-        emoji = (
-            BotEmojis.Cross if self.id not in overrides else overrides[self.id].emoji
-        )
+        level = overrides.get(self.id)
+        emoji = BotEmojis.Cross if level is None else level.emoji
         
         ret = f"{emoji} | {self.description} "    
         if self.parent_id == "0":
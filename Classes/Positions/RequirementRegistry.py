@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from Classes import Requirement
+################################################################################
+
+__all__ = ("RequirementRegistry",)
+
+GLOBAL = "0"
+
+################################################################################
+class RequirementRegistry:
+    """Every requirement, global ("0") and per position, by ID and by parent.
+
+    Each parent carries a version that's bumped whenever one of its
+    requirements is added or removed. A position's effective list (its own
+    requirements, then the global ones) is cached against the versions it
+    was built from, so it's only rebuilt after one of those actually
+    changed."""
+
+    __slots__ = (
+        "_by_id",
+        "_by_parent",
+        "_versions",
+        "_effective",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._by_id: Dict[str, Requirement] = {}
+        self._by_parent: Dict[str, Dict[str, Requirement]] = {}
+
+        self._versions: Dict[str, int] = {}
+        self._effective: Dict[str, Tuple[Tuple[int, int], Tuple[Requirement, ...]]] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._by_id)
+
+################################################################################
+    def __contains__(self, req_id: str) -> bool:
+
+        return req_id in self._by_id
+
+################################################################################
+    def add(self, requirement: Requirement) -> None:
+
+        self.remove(requirement)
+
+        self._by_id[requirement.id] = requirement
+        self._by_parent.setdefault(requirement.parent_id, {})[requirement.id] = requirement
+        self._bump(requirement.parent_id)
+
+################################################################################
+    def remove(self, requirement: Requirement) -> None:
+
+        requirement = self._by_id.pop(requirement.id, None)
+        if requirement is None:
+            return
+
+        siblings = self._by_parent[requirement.parent_id]
+        del siblings[requirement.id]
+        if not siblings:
+            del self._by_parent[requirement.parent_id]
+
+        self._bump(requirement.parent_id)
+
+################################################################################
+    def clear(self) -> None:
+
+        self._by_id.clear()
+        self._by_parent.clear()
+        self._effective.clear()
+        # Versions carry on rather than reset, so nothing cached elsewhere
+        # can mistake a reload for the state it was built from.
+        for parent_id in self._versions:
+            self._bump(parent_id)
+
+################################################################################
+    def forget(self, position_id: str) -> None:
+        """Drops a deleted position's requirements and its cached effective
+        list."""
+
+        for requirement in self.for_parent(position_id):
+            self.remove(requirement)
+
+        self._effective.pop(position_id, None)
+
+################################################################################
+    def version(self, parent_id: str) -> int:
+
+        return self._versions.get(parent_id, 0)
+
+################################################################################
+    def get(self, req_id: str, parent_id: Optional[str] = None) -> Optional[Requirement]:
+        """Looks up ``req_id``, optionally only if it belongs to ``parent_id``."""
+
+        requirement = self._by_id.get(req_id)
+        if requirement is not None and parent_id is not None and requirement.parent_id != parent_id:
+            return None
+
+        return requirement
+
+################################################################################
+    def for_parent(self, parent_id: str) -> List[Requirement]:
+
+        return list(self._by_parent.get(parent_id, {}).values())
+
+################################################################################
+    def effective(self, position_id: str) -> Tuple[Requirement, ...]:
+        """The position's own requirements followed by the global ones."""
+
+        stamp = (self.version(position_id), self.version(GLOBAL))
+        cached = self._effective.get(position_id)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        requirements = (
+            *self._by_parent.get(position_id, {}).values(),
+            *self._by_parent.get(GLOBAL, {}).values(),
+        )
+        self._effective[position_id] = (stamp, requirements)
+
+        return requirements
+
+################################################################################
+    def _bump(self, parent_id: str) -> None:
+
+        self._versions[parent_id] = self._versions.get(parent_id, 0) + 1
+
+################################################################################
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Optional
+
+from discord import Role
+
+if TYPE_CHECKING:
+    from Classes import PartyBusBot
+################################################################################
+
+__all__ = ("RoleResolver",)
+
+################################################################################
+class RoleResolver:
+    """One id -> Role map for the home guild, shared by every position.
+
+    Built from the guild cache when it's warm, otherwise from a single bulk
+    roles fetch, and kept current by the guild role create/update/delete
+    events rather than by re-fetching."""
+
+    __slots__ = (
+        "_state",
+        "_guild_id",
+        "_roles",
+    )
+
+################################################################################
+    def __init__(self, state: PartyBusBot, guild_id: int) -> None:
+
+        self._state: PartyBusBot = state
+        self._guild_id: int = guild_id
+
+        self._roles: Dict[int, Role] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._roles)
+
+################################################################################
+    @property
+    def guild_id(self) -> int:
+
+        return self._guild_id
+
+################################################################################
+    async def prime(self) -> None:
+
+        guild = self._state.get_guild(self._guild_id)
+
+        # Every guild has at least @everyone, so an empty list means a cold cache.
+        if guild is not None and guild.roles:
+            roles = guild.roles
+            source = "cache"
+        else:
+            guild = guild or await self._state.fetch_guild(self._guild_id)
+            roles = await guild.fetch_roles()
+            source = "REST"
+
+        self._roles = {r.id: r for r in roles}
+        print(f"Resolved {len(self._roles)} roles from {source}.")
+
+################################################################################
+    def get(self, role_id: Optional[int]) -> Optional[Role]:
+
+        if role_id is None:
+            return None
+
+        return self._roles.get(role_id)
+
+################################################################################
+    def store(self, role: Role) -> None:
+
+        if role.guild.id == self._guild_id:
+            self._roles[role.id] = role
+
+################################################################################
+    def discard(self, role: Role) -> None:
+
+        if role.guild.id == self._guild_id:
+            self._roles.pop(role.id, None)
+
+################################################################################
@@ -1,4 +1,7 @@
 from .Position import Position
+from .PositionCatalogue import PositionCatalogue
 from .PositionMgr import PositionManager
 from .Requirement import Requirement
+from .RequirementRegistry import RequirementRegistry
+from .RoleResolver import RoleResolver
 ################################################################################
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import asyncio
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows; peak RSS just isn't reported there.
+    resource = None
+
+################################################################################
+
+__all__ = (
+    "StartupPipeline",
+    "record",
+    "annotate",
+    "phase",
+)
+
+################################################################################
+class Stage(NamedTuple):
+
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    after: Tuple[str, ...]
+    background: bool
+
+################################################################################
+# The pipeline and stage the current task is running in. Tasks copy their
+# context when created, so a task a stage starts inherits it as well. That's
+# wanted for work the stage awaits, but not for long-lived tasks that merely
+# happen to be started during startup (the snapshot and compaction loops
+# start theirs in a fresh context for that reason), so ``count`` also drops
+# anything recorded after the stage has finished.
+_current: ContextVar[Optional[Tuple[StartupPipeline, str]]] = ContextVar("startup_stage", default=None)
+
+################################################################################
+def record(counter: str, amount: int = 1) -> None:
+    """Adds ``amount`` to ``counter`` (e.g. "rest", "db") for the startup
+    stage the caller is running in. Does nothing outside of startup."""
+
+    current = _current.get()
+    if current is not None:
+        current[0].count(current[1], counter, amount)
+
+################################################################################
+def annotate(**info: Any) -> None:
+    """Attaches extra details to the current startup stage's profile."""
+
+    current = _current.get()
+    if current is not None:
+        current[0].annotate(current[1], **info)
+
+################################################################################
+def phase(name: str, ms: Optional[float] = None, **counters: int) -> None:
+    """Records a sub-phase of the current startup stage that ends now, e.g.
+    one loader table. Pass ``ms`` if the caller timed the work itself;
+    either way the wall time since the stage's previous sub-phase (or its
+    start) is kept too."""
+
+    current = _current.get()
+    if current is not None:
+        current[0].phase(current[1], name, ms, **counters)
+
+################################################################################
+def _peak_rss_mb() -> Optional[float]:
+
+    if resource is None:
+        return None
+
+    # ru_maxrss is in KiB on Linux.
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+################################################################################
+class StartupPipeline:
+    """A small dependency graph of async startup stages.
+
+    Each stage starts as soon as everything it depends on has finished, so
+    independent work runs concurrently. A stage's return value is available
+    to later stages as ``pipeline[name]``. If any stage fails, the stages
+    still running are cancelled and the error is re-raised from ``run()``.
+
+    Background stages don't hold up ``run()``; ``finished()`` waits for them.
+    Every stage is profiled: wall time, peak RSS when it ended, and whatever
+    counters were ``record()``-ed while it ran. A stage can break itself down
+    further with ``phase()``, which profiles each step the same way."""
+
+    __slots__ = (
+        "_stages",
+        "_results",
+        "_timings",
+        "_counters",
+        "_info",
+        "_phases",
+        "_began",
+        "_background",
+        "_start",
+        "_started_at",
+        "_ready_ms",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._stages: Dict[str, Stage] = {}
+        self._results: Dict[str, Any] = {}
+        self._timings: Dict[str, Tuple[float, float]] = {}
+
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._info: Dict[str, Dict[str, Any]] = {}
+        self._phases: Dict[str, List[Dict[str, Any]]] = {}
+        self._began: Dict[str, float] = {}
+
+        self._background: List[asyncio.Task] = []
+        self._start: float = 0.0
+        self._started_at: Optional[datetime] = None
+        self._ready_ms: Optional[float] = None
+
+################################################################################
+    def __getitem__(self, name: str) -> Any:
+
+        return self._results[name]
+
+################################################################################
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        *,
+        after: Iterable[str] = (),
+        background: bool = False
+    ) -> None:
+
+        if name in self._stages:
+            raise ValueError(f"Duplicate startup stage {name!r}.")
+
+        self._stages[name] = Stage(name, func, tuple(after), background)
+        self._counters[name] = {}
+        self._info[name] = {}
+        self._phases[name] = []
+
+################################################################################
+    def count(self, stage: str, counter: str, amount: int = 1) -> None:
+
+        if stage in self._timings:
+            return
+
+        counters = self._counters[stage]
+        counters[counter] = counters.get(counter, 0) + amount
+
+################################################################################
+    def annotate(self, stage: str, **info: Any) -> None:
+
+        self._info[stage].update(info)
+
+################################################################################
+    def phase(self, stage: str, name: str, ms: Optional[float] = None, **counters: int) -> None:
+
+        if stage in self._timings:
+            return
+
+        phases = self._phases[stage]
+        began = phases[-1]["end"] if phases else self._began[stage]
+        end = perf_counter() - self._start
+
+        phases.append({
+            "name": name,
+            "end": end,
+            "wall_ms": (end - began) * 1000,
+            "ms": ms,
+            "counters": counters,
+            "peak_rss_mb": _peak_rss_mb(),
+        })
+
+################################################################################
+    async def run(self) -> None:
+
+        self._started_at = datetime.now(timezone.utc)
+        self._start = start = perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def _run(stage: Stage) -> None:
+            await asyncio.gather(*(tasks[d] for d in stage.after))
+
+            _current.set((self, stage.name))
+            began = perf_counter()
+            self._began[stage.name] = began - start
+            self._results[stage.name] = await stage.func()
+            self._timings[stage.name] = (began - start, perf_counter() - start)
+            self.annotate(stage.name, peak_rss_mb=_peak_rss_mb())
+
+        # Dependencies always come first in this order, so every task a
+        # stage waits on already exists when it's created.
+        for stage in self._ordered():
+            tasks[stage.name] = asyncio.create_task(_run(stage))
+
+        foreground = [tasks[s.name] for s in self._stages.values() if not s.background]
+        self._background = [tasks[s.name] for s in self._stages.values() if s.background]
+
+        try:
+            await asyncio.gather(*foreground)
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        self._ready_ms = (perf_counter() - start) * 1000
+
+################################################################################
+    async def finished(self) -> None:
+        """Waits for the background stages. Their failures are reported in
+        the profile rather than raised, since startup has already succeeded."""
+
+        results = await asyncio.gather(*self._background, return_exceptions=True)
+        for stage, result in zip([s for s in self._stages.values() if s.background], results):
+            if isinstance(result, BaseException):
+                self.annotate(stage.name, error=repr(result))
+
+################################################################################
+    def _ordered(self) -> List[Stage]:
+
+        for stage in self._stages.values():
+            for dep in stage.after:
+                if dep not in self._stages:
+                    raise ValueError(f"Startup stage {stage.name!r} depends on unknown stage {dep!r}.")
+
+        ordered: List[Stage] = []
+        remaining = dict(self._stages)
+        done = set()
+
+        while remaining:
+            ready = [s for s in remaining.values() if all(d in done for d in s.after)]
+            if not ready:
+                raise ValueError(f"Startup stages have a dependency cycle: {', '.join(remaining)}.")
+
+            for stage in ready:
+                ordered.append(stage)
+                done.add(stage.name)
+                del remaining[stage.name]
+
+        return ordered
+
+################################################################################
+    def critical_path(self) -> List[str]:
+        """The chain of stages that determined when startup was ready: the
+        last foreground stage to finish, the dependency it waited on longest,
+        and so on back to the start."""
+
+        timed = {n: t for n, t in self._timings.items() if not self._stages[n].background}
+        if not timed:
+            return []
+
+        path = [max(timed, key=lambda n: timed[n][1])]
+        while True:
+            deps = [d for d in self._stages[path[-1]].after if d in timed]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda n: timed[n][1]))
+
+        return path[::-1]
+
+################################################################################
+    def report(self) -> List[str]:
+
+        if not self._timings:
+            return []
+
+        total = max(end for _, end in self._timings.values()) * 1000
+        busy = sum(end - began for began, end in self._timings.values()) * 1000
+
+        lines = []
+        for name, (began, end) in sorted(self._timings.items(), key=lambda i: i[1][0]):
+            counters = ", ".join(f"{v} {k}" for k, v in sorted(self._counters[name].items()))
+            lines.append(
+                f"{name:<16} {began * 1000:>9.1f}ms -> {end * 1000:>9.1f}ms ({(end - began) * 1000:.1f}ms)"
+                + (f" [{counters}]" if counters else "")
+                + (" (background)" if self._stages[name].background else "")
+            )
+            for sub in self._phases[name]:
+                counters = ", ".join(f"{v} {k}" for k, v in sorted(sub["counters"].items()))
+                own = f", {sub['ms']:.1f}ms measured" if sub["ms"] is not None else ""
+                lines.append(
+                    f"  {sub['name']:<14} {'':>9}   -> {sub['end'] * 1000:>9.1f}ms ({sub['wall_ms']:.1f}ms{own})"
+                    + (f" [{counters}]" if counters else "")
+                )
+
+        path = self.critical_path()
+        path_ms = sum(self._timings[n][1] - self._timings[n][0] for n in path) * 1000
+        lines.append(
+            f"Critical path: {' -> '.join(path)} ({path_ms:.1f}ms of {total:.1f}ms wall, "
+            f"{busy:.1f}ms of stage time overall)"
+        )
+
+        return lines
+
+################################################################################
+    def to_dict(self) -> Dict[str, Any]:
+
+        stages = []
+        for name, (began, end) in sorted(self._timings.items(), key=lambda i: i[1][0]):
+            stage = self._stages[name]
+            stages.append({
+                "name": name,
+                "after": list(stage.after),
+                "background": stage.background,
+                "start_ms": round(began * 1000, 2),
+                "end_ms": round(end * 1000, 2),
+                "ms": round((end - began) * 1000, 2),
+                "counters": dict(self._counters[name]),
+                **self._info[name],
+                "phases": [
+                    {
+                        "name": sub["name"],
+                        "end_ms": round(sub["end"] * 1000, 2),
+                        "wall_ms": round(sub["wall_ms"], 2),
+                        "ms": round(sub["ms"], 2) if sub["ms"] is not None else None,
+                        "counters": dict(sub["counters"]),
+                        "peak_rss_mb": sub["peak_rss_mb"],
+                    }
+                    for sub in self._phases[name]
+                ],
+            })
+
+        # Background stages that failed never got timings, but still belong
+        # in the profile.
+        stages.extend(
+            {"name": name, "background": True, **info}
+            for name, info in self._info.items()
+            if name not in self._timings and "error" in info
+        )
+
+        return {
+            "started_at": self._started_at.isoformat() if self._started_at else None,
+            "ready_ms": round(self._ready_ms, 2) if self._ready_ms is not None else None,
+            "total_ms": round(max((end for _, end in self._timings.values()), default=0) * 1000, 2),
+            "peak_rss_mb": _peak_rss_mb(),
+            "critical_path": self.critical_path(),
+            "stages": stages,
+        }
+
+################################################################################
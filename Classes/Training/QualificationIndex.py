@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from Utils import TrainingLevel
+
+if TYPE_CHECKING:
+    from Classes import Qualification, Trainer
+################################################################################
+
+__all__ = ("QualificationIndex",)
+
+################################################################################
+class QualificationIndex:
+    """Position ID -> the trainers qualified for it and at what level.
+
+    Each position keeps a user ID -> (Trainer, TrainingLevel) dict, so adding,
+    changing or removing a qualification is O(1). The list ranked by level is
+    built on the first lookup after a change and reused until the next one.
+    Names can change without a qualification changing (a TUser rename, or
+    the Discord name resolving), so ties are put in name order on each read
+    rather than cached."""
+
+    __slots__ = (
+        "_by_position",
+        "_sorted",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._by_position: Dict[str, Dict[int, Tuple[Trainer, TrainingLevel]]] = {}
+        self._sorted: Dict[str, List[Tuple[Trainer, TrainingLevel]]] = {}
+
+################################################################################
+    def add(self, trainer: Trainer, qualification: Qualification) -> None:
+        """Adds ``qualification`` or, if the trainer already has one for that
+        position, replaces its level."""
+
+        # Qualifications for a position that has since been deleted.
+        if qualification.position is None:
+            return
+
+        position_id = qualification.position.id
+        self._by_position.setdefault(position_id, {})[trainer.user_id] = (trainer, qualification.level)
+        self._sorted.pop(position_id, None)
+
+################################################################################
+    def remove(self, trainer: Trainer, qualification: Qualification) -> None:
+
+        if qualification.position is None:
+            return
+
+        position_id = qualification.position.id
+        trainers = self._by_position.get(position_id)
+        if trainers is None:
+            return
+
+        trainers.pop(trainer.user_id, None)
+        if not trainers:
+            del self._by_position[position_id]
+        self._sorted.pop(position_id, None)
+
+################################################################################
+    def clear(self) -> None:
+
+        self._by_position.clear()
+        self._sorted.clear()
+
+################################################################################
+    def level(self, user_id: int, position_id: str) -> Optional[TrainingLevel]:
+
+        entry = self._by_position.get(position_id, {}).get(user_id)
+        return entry[1] if entry is not None else None
+
+################################################################################
+    def trainers(self, position_id: str, min_level: Optional[TrainingLevel] = None) -> List[Trainer]:
+        """The trainers qualified for ``position_id``, best level first and
+        then by name. With ``min_level``, only those ranked at least that high
+        (see ``TrainingLevel.rank``)."""
+
+        ranked = self._sorted.get(position_id)
+        if ranked is None:
+            ranked = self._sorted[position_id] = sorted(
+                self._by_position.get(position_id, {}).values(),
+                key=lambda e: -e[1].rank
+            )
+
+        if min_level is not None:
+            # Sorted best first, so everything after the first entry below
+            # the bar is below it too.
+            cut = next((i for i, (_, level) in enumerate(ranked) if level.rank < min_level.rank), len(ranked))
+            ranked = ranked[:cut]
+
+        return [
+            trainer for trainer, _ in
+            sorted(ranked, key=lambda e: (-e[1].rank, (e[0].name or "").casefold()))
+        ]
+
+################################################################################
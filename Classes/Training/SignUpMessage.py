@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
+import os
 
 from discord import Embed, Interaction, Message, TextChannel, HTTPException, NotFound, EmbedField, SelectOption
 from discord.ui import View
 from typing import TYPE_CHECKING, Optional, Any, Tuple, List
 
 from UI import ConfirmCancelView, TrainerMessageSelectView, SelectPositionView
-from Utils import Utilities as U, TraineeMissingError, UnqualifiedError, ChannelNotSetError
+from Utils import Utilities as U, TraineeMissingError, UnqualifiedError, ChannelNotSetError, TrainerNotFoundError
 
 if TYPE_CHECKING:
     from Classes import PartyBusBot, TrainingManager
@@ -23,6 +26,9 @@ class SignUpMessage:
         "_state",
         "_channel",
         "_message",
+        "_rendered",
+        "_refresh_task",
+        "_refresh_delay",
     )
     
 ################################################################################
@@ -33,6 +39,10 @@ class SignUpMessage:
         self._channel: Optional[TextChannel] = None
         self._message: Optional[Message] = None
         
+        self._rendered: Optional[int] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_delay: float = float(os.getenv("SIGNUP_REFRESH_DELAY", 3.0))
+        
 ################################################################################
     async def load(self, data: Tuple[Any, ...]) -> None:
         
@@ -43,9 +53,11 @@ class SignUpMessage:
             return
         
         try:
-            self._channel = await self._state.fetch_channel(channel_id)
-        except (HTTPException, NotFound):
+            self._channel = await self._state.resolver.channel(channel_id)
+        except HTTPException:
             self._channel = None
+            
+        if self._channel is None:
             self._message = None
             self.update()
             return
@@ -54,13 +66,27 @@ class SignUpMessage:
             return
         
         try:
-            self._message = await self._channel.fetch_message(message_id)
-        except (HTTPException, NotFound):
+            self._message = await self._state.resolver.message(self._channel, message_id)
+        except HTTPException:
             self._message = None
+            
+        if self._message is None:
             self.update()
+        
+################################################################################
+    async def resync(self) -> None:
+        """Re-resolves the posted message after a reconnect, in case it was
+        deleted or the channel went away while the bot was offline."""
+        
+        if self._channel is None:
             return
-            
-        await self.update_components()
+        
+        channel_id, message_id = self.channel_id, self.message_id
+        self._state.resolver.invalidate("channel", channel_id)
+        if message_id is not None:
+            self._state.resolver.invalidate("message", message_id)
+        
+        await self.load((channel_id, message_id))
         
 ################################################################################
     def update(self) -> None:
@@ -132,10 +158,7 @@ class SignUpMessage:
 ################################################################################
     def status_view(self) -> View:
 
-        unmatched_trainings = [
-            t for t in self._state.training_manager.all_trainings
-            if t.trainer is None
-        ]
+        unmatched_trainings = self._state.training_manager.unmatched_trainings
         
         options = []
         for t in unmatched_trainings:
@@ -177,36 +200,104 @@ class SignUpMessage:
             await interaction.respond(embed=error, ephemeral=True)
             return
         
-        if channel is not None:
+        if channel is not None and channel != self._channel:
+            old = self._message
             self.channel = channel
-        
-        view = self.status_view() 
+            if old is not None:
+                try:
+                    await old.delete()
+                except (HTTPException, NotFound):
+                    pass
+        
+        # Still in the same channel, so bring the existing post up to date
+        # rather than deleting it and making the channel jump.
         if self._message is not None:
-            try:
-                await self.message.delete()
-            except (HTTPException, NotFound):
-                pass
-            
-        self._message = await self.channel.send(
-            embed=self.status(),
-            view=view,
-        )
+            await self.refresh(force=True)
+        else:
+            embed, view = self.status(), self.status_view()
+            self.message = await self.channel.send(embed=embed, view=view)
+            self._rendered = self._digest(embed, view)
         
         await interaction.respond("**Thinking...**", delete_after=0.1)
-        await view.wait()
-        
-        await self.handle_trainee_assignment(interaction, view.value)
 
 ################################################################################
-    async def update_components(self) -> None:
+    def schedule_refresh(self) -> None:
+        """Asks for the message to be refreshed. Every request made within
+        the refresh delay is coalesced into a single refresh."""
+        
+        if self._message is None or self._refresh_task is not None:
+            return
+        
+        # Usually called from inside a database transaction; started in a
+        # fresh context so the refresh doesn't inherit that transaction and
+        # try to write onto it after it has committed.
+        self._refresh_task = contextvars.Context().run(asyncio.create_task, self._refresh_later())
+    
+################################################################################
+    async def _refresh_later(self) -> None:
+        
+        try:
+            await asyncio.sleep(self._refresh_delay)
+        finally:
+            # Cleared before refreshing so a change made during the edit
+            # schedules another pass instead of being lost.
+            self._refresh_task = None
+        
+        try:
+            await self.refresh()
+        except HTTPException as ex:
+            print(f"Couldn't refresh the sign-up message: {ex!r}")
+    
+################################################################################
+    async def refresh(self, *, force: bool = False) -> None:
+        """Edits the posted message to match the current trainings. Nothing is
+        sent when the rendered embed and options haven't changed."""
         
         if self._message is None:
             return
         
-        view = self.status_view()
+        embed, view = self.status(), self.status_view()
+        digest = self._digest(embed, view)
+        if digest == self._rendered and not force:
+            return
         
-        await self._message.edit(embed=self.status(), view=view)
-        await view.wait()
+        try:
+            await self._message.edit(embed=embed, view=view)
+        except NotFound:
+            # Deleted out from under us; post a replacement.
+            self.message = await self._channel.send(embed=embed, view=view)
+            
+        self._rendered = digest
+    
+################################################################################
+    @staticmethod
+    def _digest(embed: Embed, view: View) -> int:
+        
+        # make_embed picks a random colour on every render, which would make
+        # every refresh look like a change.
+        data = embed.to_dict()
+        data.pop("color", None)
+        
+        options = [
+            (o.label, o.description, o.value)
+            for item in view.children
+            for o in getattr(item, "options", [])
+        ]
+        return hash(json.dumps([data, options], sort_keys=True, default=str))
+
+################################################################################
+    def attach_view(self) -> None:
+        """Registers the selector for the already-posted message so its
+        clicks are dispatched again after a restart, without editing it."""
+        
+        if self._message is None:
+            return
+        
+        # Assumed to match the posted message, so the first refresh after a
+        # restart is skipped unless something has actually changed.
+        embed, view = self.status(), self.status_view()
+        self._state.add_view(view, message_id=self._message.id)
+        self._rendered = self._digest(embed, view)
 
 ################################################################################
     async def handle_trainee_assignment(self, interaction: Interaction, value: int) -> None:
@@ -218,6 +309,10 @@ class SignUpMessage:
             return
         
         trainer = self._state.training_manager.get_trainer(interaction.user.id)
+        if trainer is None:
+            error = TrainerNotFoundError(interaction.user)
+            await self.channel.send(embed=error, delete_after=30)
+            return
         
         trainee_positions = [t.position for t in trainee.trainings]
         trainer_positions = [t.position for t in trainer.qualifications]
@@ -267,10 +362,11 @@ class SignUpMessage:
         if not view.complete or view.value is False:
             return
         
-        training = self._state.training_manager.get_training(trainee.user.id, pos_id)
-        training.set_trainer(trainer)
+        # Committed as one unit before we tell anyone about it.
+        async with self._state.database.transaction("trainee_assignment"):
+            training = self._state.training_manager.get_training(trainee.user.id, pos_id)
+            training.set_trainer(trainer)
         
         await trainee.notify_of_selection(training)
-        await self.post_signup_message(interaction)
 
 ################################################################################
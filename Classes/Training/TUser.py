@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, List, Optional, Type, TypeVar, Any, Dict
 
-from discord import Interaction, User, Embed, EmbedField, NotFound
+from discord import Interaction, User, Embed, EmbedField
 
 from Classes.Training import Trainee, Trainer
 from Classes.Training.Availability import Availability
 from Classes.Training.Training import Training
 from Classes.Training.UserConfig import UserConfiguration
+from Classes.LazyUser import LazyUser
 from UI.Common import NameModal, NotesModal
 from UI import TimeSelectView, WeekdaySelectView
 from Utils import Utilities as U, ViewType, Weekday
@@ -38,7 +39,7 @@ class TUser:
     def __init__(
         self,
         mgr: TrainingManager,
-        user: User,
+        user: LazyUser,
         trainee: Trainee,
         trainer: Trainer,
         name: Optional[str] = None,
@@ -49,8 +50,8 @@ class TUser:
         
         self._manager: TrainingManager = mgr
         
-        self._user: User = user
-        self._name: str = name or user.name
+        self._user: LazyUser = user
+        self._name: Optional[str] = name
         self._notes: Optional[str] = notes
         
         self._config: UserConfiguration = configuration or UserConfiguration(self)
@@ -74,7 +75,7 @@ class TUser:
         
         self._manager = bot.training_manager
         
-        self._user = user
+        self._user = LazyUser.of(bot.resolver, user)
         self._name = user.name
         self._notes = None
         
@@ -88,22 +89,18 @@ class TUser:
     
 ################################################################################
     @classmethod
-    async def load(cls: Type[TU], mgr: TrainingManager, data: Dict[str, Any]) -> Optional[TU]:
+    def load(cls: Type[TU], mgr: TrainingManager, data: Dict[str, Any]) -> TU:
         
         tuser = data["tuser"]
         config = data["config"]
         availability = data["availability"]
         qdata = data["qualifications"]
         
-        try:
-            user = await mgr.bot.fetch_user(tuser[0])
-        except NotFound:
-            return None
-        
         self: TU = cls.__new__(cls)
         
         self._manager = mgr
-        self._user = user
+        # Resolved on demand; nothing here waits on Discord.
+        self._user = LazyUser(mgr.bot.resolver, tuser[0], tuser[1])
         
         self._name = tuser[1]
         self._notes = tuser[2]
@@ -124,7 +121,7 @@ class TUser:
         
 ################################################################################
     @property
-    def user(self) -> User:
+    def user(self) -> LazyUser:
         
         return self._user
     
@@ -162,7 +159,7 @@ class TUser:
     @property
     def name(self) -> str:
         
-        return self._name
+        return self._name or self._user.name
     
 ################################################################################
     @name.setter
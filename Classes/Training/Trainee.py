@@ -89,7 +89,7 @@ class Trainee:
     @property
     def trainings(self) -> List[Training]:
         
-        return [t for t in self.bot.training_manager.all_trainings if t.trainee == self]
+        return self.bot.training_manager.get_trainings_by_user(self.user_id)
 
 ################################################################################
     def update(self) -> None:
@@ -121,8 +121,9 @@ class Trainee:
         if not view.complete or view.value is False:
             return
         
-        for pos_id in view.value:
-            self.bot.training_manager.add_training(Training.new(self, pos_id))
+        async with self.bot.database.transaction("add_training"):
+            for pos_id in view.value:
+                self.bot.training_manager.add_training(Training.new(self, pos_id))
     
 ################################################################################
     async def remove_training(self, interaction: Interaction) -> None:
@@ -186,8 +187,9 @@ class Trainee:
         if not view.complete or view.value is False:
             return
         
-        training = self.get_training(view.value[0])
-        training.add_requirement_override(view.value[1], RequirementLevel(view.value[2]))
+        async with self.bot.database.transaction("update_training"):
+            training = self.get_training(view.value[0])
+            training.add_requirement_override(view.value[1], RequirementLevel(view.value[2]))
         
         await self.update_training(interaction)
         
@@ -9,7 +9,7 @@ from UI.Views import AddQualificationView, ModifyQualificationView, RemoveQualif
 from Utils import Utilities as U, TrainingLevel
 
 if TYPE_CHECKING:
-    from Classes import PartyBusBot, TUser, Position
+    from Classes import PartyBusBot, TUser, Position, Training
 ################################################################################
 
 __all__ = ("Trainer", )
@@ -69,6 +69,18 @@ class Trainer:
         
         return self._parent.user
         
+################################################################################
+    @property
+    def user_id(self) -> int:
+        
+        return self._parent.user_id
+        
+################################################################################
+    @property
+    def trainings(self) -> List[Training]:
+        
+        return self.bot.training_manager.get_trainings_by_trainer(self.user_id)
+        
 ################################################################################
     @property
     def qualifications(self) -> List[Qualification]:
@@ -166,8 +178,10 @@ class Trainer:
         position = self.bot.get_position(view.value[0])
         level = TrainingLevel(int(view.value[1]))
         
-        qualification = Qualification.new(self.bot, self.user, position, level)
+        async with self.bot.database.transaction("add_qualification"):
+            qualification = Qualification.new(self.bot, self.user, position, level)
         self._qualifications.append(qualification)
+        self.bot.training_manager.qualification_changed(self, qualification)
         
         # No need to update here.
         
@@ -194,6 +208,7 @@ class Trainer:
         pos = self.bot.get_position(view.value[0])
         qualification = self.get_qualification(pos)
         qualification.update(TrainingLevel(int(view.value[1])))
+        self.bot.training_manager.qualification_changed(self, qualification)
 
 ################################################################################
     async def remove_qualification(self, interaction: Interaction) -> None:
@@ -219,6 +234,7 @@ class Trainer:
         
         qualification.delete()
         self._qualifications.remove(qualification)
+        self.bot.training_manager.qualification_removed(self, qualification)
         
         # No need to update here.
     
@@ -238,12 +254,12 @@ class Trainer:
         return options
 
 ################################################################################
-    def is_qualified(self, position_id: str) -> bool:
+    def is_qualified(self, position_id: str, min_level: Optional[TrainingLevel] = None) -> bool:
         
-        for q in self._qualifications:
-            if q.position.id == position_id:
-                return True
-            
-        return False
+        level = self.bot.training_manager.get_qualification_level(self.user_id, position_id)
+        if level is None:
+            return False
+        
+        return min_level is None or level.rank >= min_level.rank
 
 ################################################################################
@@ -120,8 +120,7 @@ class Training:
     @trainer.setter
     def trainer(self, value: Optional[Trainer]) -> None:
         
-        self._trainer = value
-        self.update()
+        self.set_trainer(value)
         
 ################################################################################
     @property
@@ -142,13 +141,10 @@ class Training:
     @property
     def embed_field(self) -> EmbedField:
 
-        all_requirements = (
-            self.position.requirements + 
-            self._trainee.bot.position_manager.global_requirements
+        field_value = "".join(
+            req.line_item(self.requirement_overrides)
+            for req in self.position.effective_requirements
         )
-        field_value = ""
-        for req in all_requirements:
-            field_value += req.line_item(self.requirement_overrides)
     
         return EmbedField(
             name=self.position.name,
@@ -192,9 +188,12 @@ class Training:
         self.update()
         
 ################################################################################
-    def set_trainer(self, trainer: Trainer) -> None:
+    def set_trainer(self, trainer: Optional[Trainer]) -> None:
         
+        previous = self._trainer
         self._trainer = trainer
+        
+        self.bot.training_manager.trainer_changed(self, previous)
         self.update()
         
 ################################################################################
@@ -206,5 +205,6 @@ class Training:
     def update(self) -> None:
         
         self.bot.database.update.training(self)
+        self.bot.training_manager.trainings_changed()
         
 ################################################################################
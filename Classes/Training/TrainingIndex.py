@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Hashable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from Classes import Trainer, Training
+################################################################################
+
+__all__ = ("TrainingIndex",)
+
+################################################################################
+class TrainingIndex:
+    """Every training, indexed by id, trainee, (trainee, position), position,
+    trainer and whether it still needs a trainer.
+
+    Each secondary index maps a key to an id -> Training dict, so adding or
+    removing one training is O(1) and every lookup is O(result size), in the
+    order the trainings were added. ``set_trainer`` must be told about
+    trainer changes so the trainer and unmatched indexes follow along."""
+
+    __slots__ = (
+        "_by_id",
+        "_by_trainee",
+        "_by_trainee_position",
+        "_by_position",
+        "_by_trainer",
+        "_unmatched",
+    )
+
+################################################################################
+    def __init__(self) -> None:
+
+        self._by_id: Dict[str, Training] = {}
+        self._by_trainee: Dict[int, Dict[str, Training]] = {}
+        self._by_trainee_position: Dict[Tuple[int, Optional[str]], Dict[str, Training]] = {}
+        self._by_position: Dict[Optional[str], Dict[str, Training]] = {}
+        self._by_trainer: Dict[int, Dict[str, Training]] = {}
+        self._unmatched: Dict[str, Training] = {}
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._by_id)
+
+################################################################################
+    def __iter__(self) -> Iterator[Training]:
+
+        return iter(self._by_id.values())
+
+################################################################################
+    def __contains__(self, training_id: str) -> bool:
+
+        return training_id in self._by_id
+
+################################################################################
+    def add(self, training: Training) -> None:
+
+        if training.id in self._by_id:
+            self.remove(training)
+
+        self._by_id[training.id] = training
+        self._by_trainee.setdefault(training.user_id, {})[training.id] = training
+        self._by_trainee_position.setdefault((training.user_id, self._position_id(training)), {})[training.id] = training
+        self._by_position.setdefault(self._position_id(training), {})[training.id] = training
+        self._add_trainer(training, training.trainer)
+
+################################################################################
+    def remove(self, training: Training) -> None:
+
+        training = self._by_id.pop(training.id, None)
+        if training is None:
+            return
+
+        self._discard(self._by_trainee, training.user_id, training)
+        self._discard(self._by_trainee_position, (training.user_id, self._position_id(training)), training)
+        self._discard(self._by_position, self._position_id(training), training)
+        self._remove_trainer(training, training.trainer)
+
+################################################################################
+    def set_trainer(self, training: Training, previous: Optional[Trainer]) -> None:
+        """Moves ``training`` from ``previous``'s entry to its current trainer's
+        (or to the unmatched set). Call after the trainer has changed."""
+
+        if training.id not in self._by_id:
+            return
+
+        self._remove_trainer(training, previous)
+        self._add_trainer(training, training.trainer)
+
+################################################################################
+    def clear(self) -> None:
+
+        for index in (
+            self._by_id,
+            self._by_trainee,
+            self._by_trainee_position,
+            self._by_position,
+            self._by_trainer,
+            self._unmatched,
+        ):
+            index.clear()
+
+################################################################################
+    def get(self, training_id: str) -> Optional[Training]:
+
+        return self._by_id.get(training_id)
+
+################################################################################
+    def get_for(self, user_id: int, position_id: str) -> Optional[Training]:
+        """The trainee's earliest-added training for the position, if any.
+        A trainee can hold more than one for the same position."""
+
+        bucket = self._by_trainee_position.get((user_id, position_id))
+        return next(iter(bucket.values())) if bucket else None
+
+################################################################################
+    def by_trainee(self, user_id: int) -> List[Training]:
+
+        return list(self._by_trainee.get(user_id, {}).values())
+
+################################################################################
+    def by_position(self, position_id: str) -> List[Training]:
+
+        return list(self._by_position.get(position_id, {}).values())
+
+################################################################################
+    def by_trainer(self, user_id: int) -> List[Training]:
+
+        return list(self._by_trainer.get(user_id, {}).values())
+
+################################################################################
+    def unmatched(self) -> List[Training]:
+
+        return list(self._unmatched.values())
+
+################################################################################
+    def _add_trainer(self, training: Training, trainer: Optional[Trainer]) -> None:
+
+        if trainer is None:
+            self._unmatched[training.id] = training
+        else:
+            self._by_trainer.setdefault(trainer.user_id, {})[training.id] = training
+
+################################################################################
+    def _remove_trainer(self, training: Training, trainer: Optional[Trainer]) -> None:
+
+        if trainer is None:
+            self._unmatched.pop(training.id, None)
+        else:
+            self._discard(self._by_trainer, trainer.user_id, training)
+
+################################################################################
+    @staticmethod
+    def _discard(index: Dict[Hashable, Dict[str, Training]], key: Hashable, training: Training) -> None:
+
+        bucket = index.get(key)
+        if bucket is None:
+            return
+
+        bucket.pop(training.id, None)
+        if not bucket:
+            del index[key]
+
+################################################################################
+    @staticmethod
+    def _position_id(training: Training) -> Optional[str]:
+
+        # A training whose position has since been deleted has none.
+        return training.position.id if training.position is not None else None
+
+################################################################################
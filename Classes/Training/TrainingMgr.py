@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Any, Dict
+from typing import TYPE_CHECKING, List, Optional, Any, Dict, ValuesView
 
 from discord import Interaction, User, TextChannel, EmbedField, SelectOption, Embed
 
@@ -8,6 +8,8 @@ from Classes.Training.SignUpMessage import SignUpMessage
 from Classes.Training.TUser import TUser
 from Classes.Training.Trainee import Trainee
 from Classes.Training.Training import Training
+from Classes.Training.TrainingIndex import TrainingIndex
+from Classes.Training.QualificationIndex import QualificationIndex
 from Classes.Training.Trainer import Trainer
 from UI import (
     TrainerStatusView,
@@ -18,10 +20,10 @@ from UI import (
     RemoveTrainerSelectView,
     CloseMessageView
 )
-from Utils import Utilities as U, TraineeExistsError, TraineeNotFoundError
+from Utils import Utilities as U, TraineeExistsError, TraineeNotFoundError, TrainingLevel
 
 if TYPE_CHECKING:
-    from Classes import PartyBusBot, Position
+    from Classes import PartyBusBot, Position, Qualification
 ################################################################################
 
 __all__ = ("TrainingManager",)
@@ -34,6 +36,7 @@ class TrainingManager:
         "_tusers",
         "_message",
         "_trainings",
+        "_qualified",
     )
 
 ################################################################################
@@ -41,8 +44,10 @@ class TrainingManager:
 
         self._state: PartyBusBot = state
         
-        self._tusers: List[TUser] = []
-        self._trainings: List[Training] = []
+        # Keyed by user ID; dicts keep insertion order, so iteration is stable.
+        self._tusers: Dict[int, TUser] = {}
+        self._trainings: TrainingIndex = TrainingIndex()
+        self._qualified: QualificationIndex = QualificationIndex()
         
         self._message: SignUpMessage = SignUpMessage(self._state)
     
@@ -52,9 +57,12 @@ class TrainingManager:
         if not isinstance(user_id, int):
             raise TypeError("TrainingManager[user_id] | user_id must be an int.")
         
-        for tuser in self._tusers:
-            if tuser.user_id == user_id:
-                return tuser
+        return self._tusers.get(user_id)
+    
+################################################################################
+    def __contains__(self, user_id: int) -> bool:
+        
+        return user_id in self._tusers
         
 ################################################################################
     @property
@@ -64,9 +72,11 @@ class TrainingManager:
     
 ################################################################################
     @property
-    def tusers(self) -> List[TUser]:
+    def tusers(self) -> ValuesView[TUser]:
+        """A live view, not a copy; take a ``list()`` of it before adding or
+        removing TUsers mid-iteration."""
         
-        return self._tusers
+        return self._tusers.values()
     
 ################################################################################
     @property
@@ -78,13 +88,13 @@ class TrainingManager:
     @property
     def all_trainings(self) -> List[Training]:
         
-        return self._trainings
+        return list(self._trainings)
     
 ################################################################################
     @property
     def unmatched_trainings(self) -> List[Training]:
 
-        return [t for t in self.all_trainings if t.trainer is None]
+        return self._trainings.unmatched()
     
 ################################################################################
     async def load_all(self, data: Dict[str, Any]) -> None:
@@ -96,7 +106,10 @@ class TrainingManager:
         trainees = data["trainees"]
         qdata = data["qualifications"]
         trainings = data["trainings"]
-        messages = data["messages"]
+        
+        self._tusers = {}
+        self._trainings.clear()
+        self._qualified.clear()
         
         user_dict: Dict[int, Dict[str, Any]] = {}
         
@@ -132,22 +145,21 @@ class TrainingManager:
             except KeyError:
                 overrides[o[1]] = [(o[2], o[3])]
              
-        for _, data in user_dict.items():
-            tuser = await TUser.load(self, data)
-            if tuser is not None:
-                self._tusers.append(tuser)
+        for user_id, data in user_dict.items():
+            tuser = self._tusers[user_id] = TUser.load(self, data)
+            for q in tuser.trainer.qualifications:
+                self._qualified.add(tuser.trainer, q)
                 
         for t in trainings:
             training = Training.load(self.get_trainee(t[1]), t, overrides.get(t[0], []))
             if training is not None:
-                self._trainings.append(training)
-                
-        await self._message.load(messages["trainer_message"])
+                self._trainings.add(training)
         
 ################################################################################
     def get_trainee(self, user_id: int) -> Optional[Trainee]:
         
-        return self[user_id].trainee if self[user_id] is not None else None
+        tuser = self._tusers.get(user_id)
+        return tuser.trainee if tuser is not None else None
         
 ################################################################################
     def get_trainer(self, user_id: Optional[int]) -> Optional[Trainer]:
@@ -155,31 +167,39 @@ class TrainingManager:
         if user_id is None:
             return
 
-        return self[user_id].trainer if self[user_id] is not None else None
+        tuser = self._tusers.get(user_id)
+        return tuser.trainer if tuser is not None else None
            
 ################################################################################
     def get_training(self, trainee_user_id: int, pos_id: str) -> Optional[Training]:
     
-        for t in self._trainings:
-            if t.trainee.user_id == trainee_user_id and t.position.id == pos_id:
-                return t
+        return self._trainings.get_for(trainee_user_id, pos_id)
     
 ################################################################################        
     def get_trainings_by_user(self, user_id: int) -> List[Training]:
         
-        return [t for t in self._trainings if t.trainee.user_id == user_id]
+        return self._trainings.by_trainee(user_id)
     
 ################################################################################
-    def get_qualified_trainers(self, position_id: str) -> List[Trainer]:
+    def get_trainings_by_trainer(self, user_id: int) -> List[Training]:
+        
+        return self._trainings.by_trainer(user_id)
+    
+################################################################################
+    def get_qualified_trainers(self, position_id: str, min_level: Optional[TrainingLevel] = None) -> List[Trainer]:
+        """Best qualification level first, then by name - ready for a select menu."""
             
-        return [t for t in [tr.trainer for tr in self._tusers] if t.is_qualified(position_id)]
+        return self._qualified.trainers(position_id, min_level)
+    
+################################################################################
+    def get_qualification_level(self, user_id: int, position_id: str) -> Optional[TrainingLevel]:
+        
+        return self._qualified.level(user_id, position_id)
     
 ################################################################################
     def get_training_by_id(self, training_id: str) -> Optional[Training]:
         
-        for t in self._trainings:
-            if t.id == training_id:
-                return t
+        return self._trainings.get(training_id)
             
 ################################################################################
     def get_positions(self, position_ids: List[str]) -> List[Position]:
@@ -195,13 +215,13 @@ class TrainingManager:
 ################################################################################
     def get_trainings_by_position(self, position_id: str) -> List[Training]:
         
-        return [t for t in self._trainings if t.position.id == position_id]
+        return self._trainings.by_position(position_id)
     
 ################################################################################        
     def add_tuser(self, user: User) -> TUser:
         
         tuser = TUser.new(self.bot, user)
-        self._tusers.append(tuser)
+        self._tusers[tuser.user_id] = tuser
         
         return tuser
     
@@ -224,7 +244,8 @@ class TrainingManager:
 
         tuser = self[interaction.user.id]
         if tuser is None:
-            tuser = self.add_tuser(interaction.user)
+            async with self.bot.database.transaction("tuser_status"):
+                tuser = self.add_tuser(interaction.user)
 
         status = tuser.trainee_status()
         view = TUserStatusView(interaction.user, tuser)
@@ -248,7 +269,8 @@ class TrainingManager:
         
         tuser = self[user.id]
         if tuser is None:
-            tuser = self.add_tuser(user)
+            async with self.bot.database.transaction("tuser_admin_status"):
+                tuser = self.add_tuser(user)
         
         status = tuser.status()
         view = TUserAdminStatusView(interaction.user, tuser)
@@ -264,16 +286,40 @@ class TrainingManager:
 ################################################################################
     def add_training(self, training: Training) -> None:
         
-        self._trainings.append(training)
+        self._trainings.add(training)
+        self.trainings_changed()
         
 ################################################################################
     def remove_training(self, training_id: str) -> None:
         
-        for t in self._trainings:
-            if t.id == training_id:
-                self._trainings.remove(t)
-                t.delete()
-                return
+        training = self._trainings.get(training_id)
+        if training is None:
+            return
+        
+        self._trainings.remove(training)
+        training.delete()
+        self.trainings_changed()
+
+################################################################################
+    def trainer_changed(self, training: Training, previous: Optional[Trainer]) -> None:
+        
+        self._trainings.set_trainer(training, previous)
+
+################################################################################
+    def qualification_changed(self, trainer: Trainer, qualification: Qualification) -> None:
+        """Call after a qualification is added or its level changes."""
+        
+        self._qualified.add(trainer, qualification)
+
+################################################################################
+    def qualification_removed(self, trainer: Trainer, qualification: Qualification) -> None:
+        
+        self._qualified.remove(trainer, qualification)
+
+################################################################################
+    def trainings_changed(self) -> None:
+        
+        self._message.schedule_refresh()
 
 ################################################################################
     async def manage_trainers(self, interaction: Interaction) -> None:
@@ -359,7 +405,7 @@ class TrainingManager:
         
         return EmbedField(
             name="Trainees",
-            value="\n".join([f"* {t.name}" for t in [tr.trainee for tr in self._tusers]]),
+            value="\n".join([f"* {t.name}" for t in [tr.trainee for tr in self._tusers.values()]]),
             inline=True
         )
     
@@ -368,7 +414,7 @@ class TrainingManager:
         
         ret = []
         
-        for t in self._tusers:
+        for t in self._tusers.values():
             ret.append(
                 SelectOption(
                     label=t.name,
@@ -88,6 +88,36 @@ class Admin(Cog):
         
         await self.bot.manage_trainers(ctx.interaction)
         
+################################################################################
+    @admin.command(
+        name="db_stats",
+        description="Show the slowest database calls and recent slow queries."
+    )
+    async def db_stats(
+        self,
+        ctx: ApplicationContext,
+        limit: Option(
+            SlashCommandOptionType.integer,
+            name="limit",
+            description="How many of the top offenders to show.",
+            required=False,
+            min_value=1,
+            max_value=25,
+            default=10
+        )
+    ) -> None:
+        
+        await self.bot.database_stats(ctx.interaction, limit)
+        
+################################################################################
+    @admin.command(
+        name="startup_report",
+        description="Show how long each phase of the last startup took."
+    )
+    async def startup_report(self, ctx: ApplicationContext) -> None:
+        
+        await self.bot.startup_report(ctx.interaction)
+        
 ################################################################################        
     @admin.command(name="test")
     async def test(self, ctx: ApplicationContext) -> None:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from discord import Cog
+from discord import Cog, Role
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +19,24 @@ class Internal(Cog):
         print("Loading internals...")
         await self.bot.load_all()
         
+################################################################################
+    @Cog.listener("on_guild_role_create")
+    async def role_created(self, role: Role) -> None:
+        
+        self.bot.position_manager.roles.store(role)
+        
+################################################################################
+    @Cog.listener("on_guild_role_update")
+    async def role_updated(self, before: Role, after: Role) -> None:
+        
+        self.bot.position_manager.roles.store(after)
+        
+################################################################################
+    @Cog.listener("on_guild_role_delete")
+    async def role_deleted(self, role: Role) -> None:
+        
+        self.bot.position_manager.roles.discard(role)
+        
 ################################################################################
 def setup(bot: PartyBusBot) -> None:
 
@@ -0,0 +1,95 @@
+"""Benchmarks TUser lookups: the old linear list scan against the user-ID dict.
+
+    Typical usage:
+    --------------
+    python Tools/BenchTUserLookup.py
+    python Tools/BenchTUserLookup.py --sizes 1000 10000 100000 --lookups 2000
+
+Mirrors what ``TrainingManager.get_trainee`` costs either way, including the
+two ``self[user_id]`` calls the list version made per lookup. Stand-in
+objects are used instead of real TUsers so the benchmark runs without a
+Discord connection or database.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from timeit import Timer
+from typing import Dict, List, Optional
+
+################################################################################
+class FakeTUser:
+
+    __slots__ = ("user_id", "trainee")
+
+    def __init__(self, user_id: int) -> None:
+
+        self.user_id: int = user_id
+        self.trainee: object = object()
+
+################################################################################
+def scan_get(tusers: List[FakeTUser], user_id: int) -> Optional[FakeTUser]:
+
+    for tuser in tusers:
+        if tuser.user_id == user_id:
+            return tuser
+
+################################################################################
+def scan_get_trainee(tusers: List[FakeTUser], user_id: int) -> Optional[object]:
+
+    return scan_get(tusers, user_id).trainee if scan_get(tusers, user_id) is not None else None
+
+################################################################################
+def dict_get_trainee(tusers: Dict[int, FakeTUser], user_id: int) -> Optional[object]:
+
+    tuser = tusers.get(user_id)
+    return tuser.trainee if tuser is not None else None
+
+################################################################################
+def bench(size: int, lookups: int, repeat: int) -> None:
+
+    rng = random.Random(size)
+    ids = rng.sample(range(10 ** 17, 10 ** 18), size)
+
+    as_list = [FakeTUser(i) for i in ids]
+    as_dict = {t.user_id: t for t in as_list}
+
+    # Mostly hits spread across the list, plus some misses (unregistered users).
+    queries = [rng.choice(ids) for _ in range(lookups * 9 // 10)]
+    queries += [rng.randrange(10 ** 17) for _ in range(lookups - len(queries))]
+
+    def run_scan() -> None:
+        for q in queries:
+            scan_get_trainee(as_list, q)
+
+    def run_dict() -> None:
+        for q in queries:
+            dict_get_trainee(as_dict, q)
+
+    scan_s = min(Timer(run_scan).repeat(repeat, 1)) / lookups
+    dict_s = min(Timer(run_dict).repeat(repeat, 1)) / lookups
+
+    print(
+        f"{size:>8} users | list scan {scan_s * 1e6:>10.2f}us | "
+        f"dict {dict_s * 1e6:>6.3f}us | {scan_s / dict_s:>9.0f}x faster"
+    )
+
+################################################################################
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"get_trainee, per lookup (best of {args.repeat}, {args.lookups} lookups, 10% misses):")
+    for size in args.sizes:
+        bench(size, args.lookups, args.repeat)
+
+################################################################################
+if __name__ == "__main__":
+    main()
+
+################################################################################
@@ -0,0 +1,244 @@
+"""Checks the unit-of-work and write-behind paths against a real database.
+
+    Typical usage:
+    --------------
+    python Tools/CheckTransactions.py
+
+Runs the real ``Database``, ``UnitOfWork``, ``WriteBehindQueue`` and branch
+classes on an in-memory SQLite backend with the migrated schema, and checks:
+
+  * nested ``transaction()``/``acquire()`` calls join the outer unit, which
+    counts every statement and commits exactly once;
+  * a block that raises rolls the whole unit back;
+  * facade writes submitted inside a unit are applied on it before commit,
+    and ones submitted from a task that outlived its unit are refused;
+  * a failed write-behind batch is replayed one write at a time without
+    deadlocking, even when a replayed write (``update_training``,
+    ``delete_training``) opens its own ordered transaction.
+
+Commits are counted from the SQLite connection's statement trace. Entities
+are plain namespaces carrying just the attributes the branches read, so no
+Discord connection is needed. Exits with status 1 if any check fails.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from Utils.Database import Database
+from Utils.Database.Backends.SQLite import SQLiteBackend
+
+################################################################################
+
+TIMEOUT = 2.0
+
+################################################################################
+class Harness:
+    """A migrated in-memory database plus a count of what it committed."""
+
+    def __init__(self) -> None:
+
+        self.bot = SimpleNamespace()
+        self.backend = SQLiteBackend(":memory:")
+        self.db = self.bot.database = Database(self.bot, backend=self.backend)  # type: ignore
+
+        self.commits: int = 0
+        self.rollbacks: int = 0
+
+    async def setup(self) -> None:
+
+        await self.db.connect()
+        await self.db.assert_structure()
+
+        # Only count what the check itself does from here on.
+        self.backend._conn.set_trace_callback(self._trace)
+
+    def _trace(self, statement: str) -> None:
+
+        keyword = statement.strip().rstrip(";").upper()
+        if keyword == "COMMIT":
+            self.commits += 1
+        elif keyword == "ROLLBACK":
+            self.rollbacks += 1
+
+    async def count(self, table: str) -> int:
+
+        async with self.db.acquire() as db:
+            await db.execute(f"SELECT COUNT(*) FROM {table};")
+            return (await db.fetchone())[0]
+
+    def reset_counts(self) -> None:
+
+        self.commits = self.rollbacks = 0
+
+################################################################################
+def training(training_id: str, user_id: int, position_id: str) -> SimpleNamespace:
+
+    return SimpleNamespace(
+        id=training_id,
+        user_id=user_id,
+        position=SimpleNamespace(id=position_id),
+        trainer=None,
+        requirement_overrides={},
+    )
+
+################################################################################
+async def check_nested_join(h: Harness, fail: Callable[[str], None]) -> None:
+
+    async with h.db.transaction("nested") as outer:
+        await h.db.aio.insert.insert_position("Bartender", new_id="p1")
+        async with h.db.transaction() as inner:
+            if inner is not outer:
+                fail("a nested transaction() didn't join the outer unit")
+            await h.db.aio.insert.insert_tuser_records(1)
+            async with h.db.acquire() as acquired:
+                if acquired is not outer:
+                    fail("acquire() inside a transaction didn't join it")
+
+    if outer.statements != 5:
+        fail(f"the unit counted {outer.statements} statements, expected 5")
+    if h.commits != 1:
+        fail(f"a nested unit of work committed {h.commits} times, expected once")
+    if await h.count("tusers") != 1 or await h.count("positions") != 1:
+        fail("rows written by the nested unit are missing")
+
+################################################################################
+async def check_rollback(h: Harness, fail: Callable[[str], None]) -> None:
+
+    try:
+        async with h.db.transaction():
+            await h.db.aio.insert.insert_position("Dancer", new_id="p2")
+            await h.db.aio.insert.insert_position("Dancer again", new_id="p2")
+    except Exception:
+        pass
+    else:
+        fail("a duplicate insert didn't raise")
+
+    if h.commits != 0 or h.rollbacks != 1:
+        fail(f"a failed unit made {h.commits} commits and {h.rollbacks} rollbacks, expected 0 and 1")
+    if await h.count("positions") != 0:
+        fail("a failed unit's first insert was committed")
+
+################################################################################
+async def check_deferred(h: Harness, fail: Callable[[str], None]) -> None:
+
+    leaked: List[asyncio.Task] = []
+    committed = asyncio.Event()
+
+    async with h.db.transaction("deferred") as unit:
+        await h.db.aio.insert.insert_position("Host", new_id="p3")
+        h.db.submit(None, h.db.aio.insert.insert_new_training, 1, "p3", new_id="t1")
+        if len(h.db.write_behind):
+            fail("a write submitted inside a unit went to the write-behind queue")
+
+        async def late_submit() -> None:
+            await committed.wait()
+            h.db.submit(None, h.db.aio.insert.insert_new_training, 1, "p3", new_id="t-late")
+
+        # Inherits the unit from this context, but only runs after commit.
+        leaked.append(asyncio.create_task(late_submit()))
+
+    committed.set()
+    if unit.statements != 2:
+        fail(f"the unit counted {unit.statements} statements with its deferred write, expected 2")
+    if h.commits != 1:
+        fail(f"a unit with a deferred write committed {h.commits} times, expected once")
+    if await h.count("trainings") != 1:
+        fail("the deferred write wasn't applied")
+
+    results = await asyncio.gather(*leaked, return_exceptions=True)
+    if not isinstance(results[0], RuntimeError):
+        fail("a task submitting onto its finished unit wasn't refused")
+
+    # Started in a fresh context instead, the same write goes to the queue.
+    await contextvars.Context().run(asyncio.create_task, late_submit())
+    if len(h.db.write_behind) != 1:
+        fail("a write from a fresh context didn't go to the write-behind queue")
+
+################################################################################
+async def check_failed_batch(h: Harness, fail: Callable[[str], None]) -> None:
+
+    async with h.db.transaction():
+        await h.db.aio.insert.insert_position("Bartender", new_id="p1")
+        await h.db.aio.insert.insert_position("Host", new_id="p3")
+        await h.db.aio.insert.insert_new_training(1, "p3", new_id="t1")
+        await h.db.aio.insert.insert_new_training(1, "p1", new_id="t2")
+
+    h.reset_counts()
+
+    # A duplicate key fails the batch, so it's replayed write by write; the
+    # two training writes each open an ordered transaction while replaying.
+    h.db.submit(None, h.db.aio.insert.insert_position, "Duplicate", new_id="p1")
+    h.db.submit(("training", "t1"), h.db.aio.update.update_training, training("t1", 1, "p1"))
+    h.db.submit(None, h.db.aio.delete.delete_training, training("t2", 1, "p1"))
+
+    try:
+        applied = await asyncio.wait_for(h.db.flush(), TIMEOUT)
+    except asyncio.TimeoutError:
+        fail("flush() hung replaying a failed batch")
+        return
+
+    if applied != 3:
+        fail(f"flush() applied {applied} writes, expected 3")
+
+    # The batch and the duplicate roll back; each training write commits on
+    # its own.
+    if h.commits != 2 or h.rollbacks != 2:
+        fail(f"replay made {h.commits} commits and {h.rollbacks} rollbacks, expected 2 and 2")
+
+    async with h.db.acquire() as db:
+        await db.execute("SELECT position FROM trainings WHERE _id = %s;", ("t1",))
+        row = await db.fetchone()
+    if row is None or row[0] != "p1":
+        fail("the replayed update_training was lost")
+    if await h.count("trainings") != 1:
+        fail("the replayed delete_training was lost")
+
+    # The queue has to stay usable afterwards (Database.close flushes it too).
+    h.db.submit(("training", "t1"), h.db.aio.update.update_training, training("t1", 1, "p3"))
+    try:
+        await asyncio.wait_for(h.db.flush(), TIMEOUT)
+    except asyncio.TimeoutError:
+        fail("a later flush() hung")
+
+################################################################################
+async def check() -> List[str]:
+
+    failures: List[str] = []
+    for step in (check_nested_join, check_rollback, check_deferred, check_failed_batch):
+        h = Harness()
+        await h.setup()
+        try:
+            await step(h, lambda message: failures.append(f"{step.__name__}: {message}"))
+        finally:
+            # Not Database.close(), which would write a snapshot to disk.
+            await h.db.flush()
+            await h.backend.close()
+
+    return failures
+
+################################################################################
+def main() -> int:
+
+    failures = asyncio.run(check())
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    if failures:
+        return 1
+
+    print("OK: units of work join, count and commit once; failed batches replay without deadlocking.")
+    return 0
+
+################################################################################
+if __name__ == "__main__":
+    sys.exit(main())
+
+################################################################################
@@ -0,0 +1,92 @@
+"""Reports the heaviest imports behind the bot and checks them against a budget.
+
+    Typical usage:
+    --------------
+    python Tools/ImportBudget.py
+    python Tools/ImportBudget.py Classes.Bot --budget-ms 1500 --top 25
+
+Runs the import in a fresh interpreter under ``-X importtime`` and exits with
+status 1 when the module's cumulative import time is over budget, so it can
+sit in a deploy check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+################################################################################
+
+ROOT = Path(__file__).resolve().parent.parent
+
+################################################################################
+class ImportTime(NamedTuple):
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+
+################################################################################
+def measure(module: str) -> List[ImportTime]:
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+    times = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times.append(ImportTime(name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    return times
+
+################################################################################
+def main() -> int:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="Classes.Bot")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_BUDGET_MS", 2000))
+    )
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    times = measure(args.module)
+    total = next((t.cumulative_ms for t in times if t.module == args.module), 0.0)
+    own = [t for t in times if t.module.split(".")[0] in {"Assets", "Classes", "Cogs", "UI", "Utils"}]
+
+    print(f"Heaviest imports by self time (of {len(times)} modules):")
+    for t in sorted(times, key=lambda t: t.self_ms, reverse=True)[:args.top]:
+        print(f"  {t.self_ms:>9.1f}ms  {t.module}")
+
+    print(f"\nHeaviest project modules by cumulative time ({len(own)} loaded):")
+    for t in sorted(own, key=lambda t: t.cumulative_ms, reverse=True)[:args.top]:
+        print(f"  {t.cumulative_ms:>9.1f}ms  {t.module}")
+
+    print(f"\n{args.module}: {total:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    if total > args.budget_ms:
+        print("Over budget!")
+        return 1
+
+    return 0
+
+################################################################################
+if __name__ == "__main__":
+    sys.exit(main())
+
+################################################################################
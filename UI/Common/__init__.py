@@ -1,8 +1,25 @@
-from .CancelContinueButtons import CancelButton, ContinueButton
-from .CloseMessage import CloseMessageButton, CloseMessageView
-from .ConfirmCancelView import ConfirmCancelView
-from .Modal import FroggeModal
-from .NameModal import NameModal
-from .NotesModal import NotesModal
-from .View import FroggeView
+from typing import TYPE_CHECKING
+
+from UI.LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .CancelContinueButtons import CancelButton, ContinueButton
+    from .CloseMessage import CloseMessageButton, CloseMessageView
+    from .ConfirmCancelView import ConfirmCancelView
+    from .Modal import FroggeModal
+    from .NameModal import NameModal
+    from .NotesModal import NotesModal
+    from .View import FroggeView
+################################################################################
+
+__all__ = lazy_exports(__name__, {
+    ".CancelContinueButtons": ("CancelButton", "ContinueButton"),
+    ".CloseMessage": ("CloseMessageButton", "CloseMessageView"),
+    ".ConfirmCancelView": ("ConfirmCancelView",),
+    ".Modal": ("FroggeModal",),
+    ".NameModal": ("NameModal",),
+    ".NotesModal": ("NotesModal",),
+    ".View": ("FroggeView",),
+})
+
 ################################################################################
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
+
+################################################################################
+
+__all__ = ("lazy_exports",)
+
+################################################################################
+class LazyPackage(ModuleType):
+    """A package whose exports are imported the first time they're used."""
+
+################################################################################
+    def __getattr__(self, name: str) -> Any:
+
+        try:
+            module = self.__dict__["_lazy_exports"][name]
+        except KeyError:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}") from None
+
+        value = getattr(import_module(module, self.__name__), name)
+        # Cached on the package, so later lookups never come back here.
+        self.__dict__[name] = value
+        return value
+
+################################################################################
+    def __setattr__(self, name: str, value: Any) -> None:
+
+        # The import system binds every submodule onto its package once it's
+        # loaded, which would hide a class exported under the same name
+        # (``UI.Views.SelectPositionView`` and the like).
+        if isinstance(value, ModuleType) and name in self.__dict__.get("_lazy_exports", ()):
+            return
+
+        super().__setattr__(name, value)
+
+################################################################################
+    def __dir__(self) -> List[str]:
+
+        return sorted({*self.__dict__, *self.__dict__.get("_lazy_exports", ())})
+
+################################################################################
+def lazy_exports(package: str, modules: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Makes ``package`` import its exports on first use and returns its
+    ``__all__``.
+
+    ``modules`` maps a module, relative to ``package``, to the names it
+    provides, so ``from UI import FroggeView`` imports just the modules that
+    name needs rather than every view in the package."""
+
+    module = sys.modules[package]
+    module._lazy_exports = {name: path for path, names in modules.items() for name in names}
+    module.__class__ = LazyPackage
+
+    return tuple(module._lazy_exports)
+
+################################################################################
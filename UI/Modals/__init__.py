@@ -1,3 +1,15 @@
-from .JobDescriptionModal import JobDescriptionModal
-from .VenueNameModal import VenueNameModal
+from typing import TYPE_CHECKING
+
+from UI.LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .JobDescriptionModal import JobDescriptionModal
+    from .VenueNameModal import VenueNameModal
+################################################################################
+
+__all__ = lazy_exports(__name__, {
+    ".JobDescriptionModal": ("JobDescriptionModal",),
+    ".VenueNameModal": ("VenueNameModal",),
+})
+
 ################################################################################
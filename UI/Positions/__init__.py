@@ -1,12 +1,33 @@
-from .GlobalRequirementModal import GlobalRequirementModal
-from .GlobalRequirementsView import GlobalRequirementsView
-from .PositionGeneralStatusView import PositionGeneralStatusView
-from .PositionNameModal import PositionNameModal
-from .PositionRequirementModal import PositionRequirementModal
-from .PositionRoleModal import PositionRoleModal
-from .MultiPositionSelectView import MultiPositionSelectView
-from .PositionStatusView import PositionStatusView
-from .RemoveRequirementView import RemoveRequirementView
-from .RequirementStatusSelectView import RequirementStatusSelectView
-from .SinglePositionSelectView import SinglePositionSelectView
+from typing import TYPE_CHECKING
+
+from UI.LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .GlobalRequirementModal import GlobalRequirementModal
+    from .GlobalRequirementsView import GlobalRequirementsView
+    from .PositionGeneralStatusView import PositionGeneralStatusView
+    from .PositionNameModal import PositionNameModal
+    from .PositionRequirementModal import PositionRequirementModal
+    from .PositionRoleModal import PositionRoleModal
+    from .MultiPositionSelectView import MultiPositionSelectView
+    from .PositionStatusView import PositionStatusView
+    from .RemoveRequirementView import RemoveRequirementView
+    from .RequirementStatusSelectView import RequirementStatusSelectView
+    from .SinglePositionSelectView import SinglePositionSelectView
+################################################################################
+
+__all__ = lazy_exports(__name__, {
+    ".GlobalRequirementModal": ("GlobalRequirementModal",),
+    ".GlobalRequirementsView": ("GlobalRequirementsView",),
+    ".PositionGeneralStatusView": ("PositionGeneralStatusView",),
+    ".PositionNameModal": ("PositionNameModal",),
+    ".PositionRequirementModal": ("PositionRequirementModal",),
+    ".PositionRoleModal": ("PositionRoleModal",),
+    ".MultiPositionSelectView": ("MultiPositionSelectView",),
+    ".PositionStatusView": ("PositionStatusView",),
+    ".RemoveRequirementView": ("RemoveRequirementView",),
+    ".RequirementStatusSelectView": ("RequirementStatusSelectView",),
+    ".SinglePositionSelectView": ("SinglePositionSelectView",),
+})
+
 ################################################################################
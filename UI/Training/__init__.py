@@ -1,5 +1,19 @@
-from .ScheduleSelectView import ScheduleSelectView
-from .TraineeStatusView import TraineeStatusView
-from .TrainerStatusView import TrainerStatusView
-from .UpdateTraineeView import UpdateTraineeView
+from typing import TYPE_CHECKING
+
+from UI.LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .ScheduleSelectView import ScheduleSelectView
+    from .TraineeStatusView import TraineeStatusView
+    from .TrainerStatusView import TrainerStatusView
+    from .UpdateTraineeView import UpdateTraineeView
+################################################################################
+
+__all__ = lazy_exports(__name__, {
+    ".ScheduleSelectView": ("ScheduleSelectView",),
+    ".TraineeStatusView": ("TraineeStatusView",),
+    ".TrainerStatusView": ("TrainerStatusView",),
+    ".UpdateTraineeView": ("UpdateTraineeView",),
+})
+
 ################################################################################
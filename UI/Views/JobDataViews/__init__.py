@@ -1,7 +1,23 @@
-from .CollectJobCompensationView import CollectJobCompensationView
-from .CollectJobDataView import _CollectJobDataView
-from .CollectJobDetailsView import CollectJobDetailsView
-from .CollectJobScheduleView import CollectJobScheduleView
-from .DateSelectView import DateSelectView
-from .TimeSelectView import TimeSelectView
+from typing import TYPE_CHECKING
+
+from UI.LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .CollectJobCompensationView import CollectJobCompensationView
+    from .CollectJobDataView import _CollectJobDataView
+    from .CollectJobDetailsView import CollectJobDetailsView
+    from .CollectJobScheduleView import CollectJobScheduleView
+    from .DateSelectView import DateSelectView
+    from .TimeSelectView import TimeSelectView
+################################################################################
+
+__all__ = lazy_exports(__name__, {
+    ".CollectJobCompensationView": ("CollectJobCompensationView",),
+    ".CollectJobDataView": ("_CollectJobDataView",),
+    ".CollectJobDetailsView": ("CollectJobDetailsView",),
+    ".CollectJobScheduleView": ("CollectJobScheduleView",),
+    ".DateSelectView": ("DateSelectView",),
+    ".TimeSelectView": ("TimeSelectView",),
+})
+
 ################################################################################
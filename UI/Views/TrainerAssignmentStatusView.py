@@ -41,7 +41,7 @@ class TrainerAssignmentStatusView(FroggeView):
         disable_remove = False
         if len(self.mgr.all_trainings) == 0:
             disable_remove = True
-        if not any(t.trainer is not None for t in self.mgr.all_trainings):
+        if len(self.mgr.unmatched_trainings) == len(self.mgr.all_trainings):
             disable_remove = True
             
         self.children[0].disabled = disable_add  # type: ignore
@@ -13,19 +13,22 @@ __all__ = ("TrainerMessageSelectView",)
 
 ################################################################################
 class TrainerMessageSelectView(View):
+    """The trainee selector on the trainer sign-up message.
+
+    Persistent: it never times out and every select has a stable custom_id,
+    so once registered with ``bot.add_view`` clicks keep being dispatched to
+    ``SignUpMessage.handle_trainee_assignment`` across restarts, without the
+    message being re-edited."""
 
     def __init__(self, msg: SignUpMessage, options: List[SelectOption]):
         
         super().__init__(timeout=None)
         
-        self.message: SignUpMessage = msg
-        
-        self.complete: bool = False
-        self.value = None
+        self.signup: SignUpMessage = msg
 
         if len(options) == 0:
             options.append(SelectOption(label="None", value="-1"))
-            self.add_item(TraineeSelect(options))
+            self.add_item(TraineeSelect(options, 0))
         else:
             # Calculate number of TraineeSelect instances needed
             num_trainee_selects = (len(options) // 25) + (1 if len(options) % 25 else 0)
@@ -34,12 +37,12 @@ class TrainerMessageSelectView(View):
                 start, end = i * 25, (i + 1) * 25
                 partition = options[start:end]
     
-                self.add_item(TraineeSelect(partition))        
+                self.add_item(TraineeSelect(partition, i))        
             
 ################################################################################
 class TraineeSelect(Select):
     
-    def __init__(self, options: List[SelectOption]):
+    def __init__(self, options: List[SelectOption], index: int):
         
         if not options:
             options.append(SelectOption(label="None", value="-1"))
@@ -49,14 +52,13 @@ class TraineeSelect(Select):
             options=options,
             min_values=1,
             max_values=1,
-            disabled=True if options[0].value == "-1" else False
+            disabled=True if options[0].value == "-1" else False,
+            custom_id=f"signup:trainee_select:{index}"
         )
         
     async def callback(self, interaction: Interaction):
-        self.view.value = int(self.values[0])
-        self.view.complete = True
 
         await interaction.edit()
-        self.view.stop()
+        await self.view.signup.handle_trainee_assignment(interaction, int(self.values[0]))
     
 ################################################################################
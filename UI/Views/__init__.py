@@ -1,17 +1,48 @@
-from .AddQualificationView import AddQualificationView
-from .AddTrainerSelectView import AddTrainerSelectView
-from .AddTrainingView import AddTrainingView
-from .JobDataViews import *
-from .ModifyQualificationView import ModifyQualificationView
-from .RemoveQualificationView import RemoveQualificationView
-from .RemoveTrainerSelectView import RemoveTrainerSelectView
-from .RemoveTrainingView import RemoveTrainingView
-from .SelectPositionView import SelectPositionView
-from .TimeSelectView import TimeSelectView
-from .TrainerAssignmentStatusView import TrainerAssignmentStatusView
-from .TrainerMessageSelectView import TrainerMessageSelectView
-from .TUserConfigView import TUserConfigView
-from .TUserStatusView import TUserAdminStatusView, TUserStatusView
-from .UpdateTrainingView import UpdateTrainingView
-from .WeekdaySelectView import WeekdaySelectView
+from typing import TYPE_CHECKING
+
+from UI.LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .AddQualificationView import AddQualificationView
+    from .AddTrainerSelectView import AddTrainerSelectView
+    from .AddTrainingView import AddTrainingView
+    from .JobDataViews import *
+    from .ModifyQualificationView import ModifyQualificationView
+    from .RemoveQualificationView import RemoveQualificationView
+    from .RemoveTrainerSelectView import RemoveTrainerSelectView
+    from .RemoveTrainingView import RemoveTrainingView
+    from .SelectPositionView import SelectPositionView
+    from .TimeSelectView import TimeSelectView
+    from .TrainerAssignmentStatusView import TrainerAssignmentStatusView
+    from .TrainerMessageSelectView import TrainerMessageSelectView
+    from .TUserConfigView import TUserConfigView
+    from .TUserStatusView import TUserAdminStatusView, TUserStatusView
+    from .UpdateTrainingView import UpdateTrainingView
+    from .WeekdaySelectView import WeekdaySelectView
+################################################################################
+
+__all__ = lazy_exports(__name__, {
+    ".AddQualificationView": ("AddQualificationView",),
+    ".AddTrainerSelectView": ("AddTrainerSelectView",),
+    ".AddTrainingView": ("AddTrainingView",),
+    ".JobDataViews": (
+        "CollectJobCompensationView",
+        "CollectJobDetailsView",
+        "CollectJobScheduleView",
+        "DateSelectView",
+    ),
+    ".ModifyQualificationView": ("ModifyQualificationView",),
+    ".RemoveQualificationView": ("RemoveQualificationView",),
+    ".RemoveTrainerSelectView": ("RemoveTrainerSelectView",),
+    ".RemoveTrainingView": ("RemoveTrainingView",),
+    ".SelectPositionView": ("SelectPositionView",),
+    ".TimeSelectView": ("TimeSelectView",),
+    ".TrainerAssignmentStatusView": ("TrainerAssignmentStatusView",),
+    ".TrainerMessageSelectView": ("TrainerMessageSelectView",),
+    ".TUserConfigView": ("TUserConfigView",),
+    ".TUserStatusView": ("TUserAdminStatusView", "TUserStatusView"),
+    ".UpdateTrainingView": ("UpdateTrainingView",),
+    ".WeekdaySelectView": ("WeekdaySelectView",),
+})
+
 ################################################################################
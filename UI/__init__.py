@@ -1,6 +1,39 @@
-from .Common import *
-from .Modals import *
-from .Positions import *
-from .Training import *
-from .Views import *
+from typing import TYPE_CHECKING
+
+from .LazyExports import lazy_exports
+################################################################################
+if TYPE_CHECKING:
+    from .Common import *
+    from .Modals import *
+    from .Positions import *
+    from .Training import *
+    from .Views import *
+################################################################################
+
+# Each subpackage is lazy too, so ``from UI import X`` only ever imports the
+# module that defines X.
+__all__ = lazy_exports(__name__, {
+    ".Common": (
+        "CancelButton", "ContinueButton", "CloseMessageButton", "CloseMessageView",
+        "ConfirmCancelView", "FroggeModal", "NameModal", "NotesModal", "FroggeView",
+    ),
+    ".Modals": ("JobDescriptionModal", "VenueNameModal"),
+    ".Positions": (
+        "GlobalRequirementModal", "GlobalRequirementsView", "PositionGeneralStatusView",
+        "PositionNameModal", "PositionRequirementModal", "PositionRoleModal",
+        "MultiPositionSelectView", "PositionStatusView", "RemoveRequirementView",
+        "RequirementStatusSelectView", "SinglePositionSelectView",
+    ),
+    ".Training": ("ScheduleSelectView", "TraineeStatusView", "TrainerStatusView", "UpdateTraineeView"),
+    ".Views": (
+        "AddQualificationView", "AddTrainerSelectView", "AddTrainingView",
+        "CollectJobCompensationView", "CollectJobDetailsView", "CollectJobScheduleView",
+        "DateSelectView", "ModifyQualificationView", "RemoveQualificationView",
+        "RemoveTrainerSelectView", "RemoveTrainingView", "SelectPositionView",
+        "TimeSelectView", "TrainerAssignmentStatusView", "TrainerMessageSelectView",
+        "TUserConfigView", "TUserAdminStatusView", "TUserStatusView",
+        "UpdateTrainingView", "WeekdaySelectView",
+    ),
+})
+
 ################################################################################
@@ -11,14 +11,14 @@ Module By Stephanie Phillips
 import random
 
 from discord import Colour
-from typing import Type, TypeVar
+from typing import Any, Dict, List, Tuple, Type, TypeVar
 ######################################################################
 
+# The colour families (RED_COLOURS ... GREY_COLOURS, ALL_COLOURS) are still
+# importable from this module, but are built on first access, so they're left
+# out of __all__ to keep star-imports from building them all.
 __all__ = (
-    "FroggeColor", "CustomColor", "ALL_COLOURS",
-    "RED_COLOURS", "PINK_COLOURS", "ORANGE_COLOURS", "YELLOW_COLOURS",
-    "PURPLE_COLOURS", "GREEN_COLOURS", "CYAN_COLOURS", "BLUE_COLOURS",
-    "BROWN_COLOURS", "WHITE_COLOURS", "GREY_COLOURS",
+    "FroggeColor", "CustomColor",
 )
 
 C = TypeVar("C", bound="FroggeColour")
@@ -1534,175 +1534,163 @@ class FroggeColor(Colour):
     @staticmethod
     def random_red() -> C:
         """A custom method that returns a random :class: `Colour` from the RED family."""
-        return random.choice(RED_COLOURS)
+        return random.choice(_family("RED_COLOURS"))
 
     @staticmethod
     def random_pink() -> C:
         """A custom method that returns a random :class: `Colour` from the PINK family."""
-        return random.choice(PINK_COLOURS)
+        return random.choice(_family("PINK_COLOURS"))
 
     @staticmethod
     def random_orange() -> C:
         """A custom method that returns a random :class: `Colour` from the ORANGE family."""
-        return random.choice(ORANGE_COLOURS)
+        return random.choice(_family("ORANGE_COLOURS"))
 
     @staticmethod
     def random_yellow() -> C:
         """A custom method that returns a random :class: `Colour` from the YELLOW family."""
-        return random.choice(YELLOW_COLOURS)
+        return random.choice(_family("YELLOW_COLOURS"))
 
     @staticmethod
     def random_purple() -> C:
         """A custom method that returns a random :class: `Colour` from the PURPLE family."""
-        return random.choice(PURPLE_COLOURS)
+        return random.choice(_family("PURPLE_COLOURS"))
 
     @staticmethod
     def random_green() -> C:
         """A custom method that returns a random :class: `Colour` from the GREEN family."""
-        return random.choice(GREEN_COLOURS)
+        return random.choice(_family("GREEN_COLOURS"))
 
     @staticmethod
     def random_cyan() -> C:
         """A custom method that returns a random :class: `Colour` from the CYAN family."""
-        return random.choice(CYAN_COLOURS)
+        return random.choice(_family("CYAN_COLOURS"))
 
     @staticmethod
     def random_blue() -> C:
         """A custom method that returns a random :class: `Colour` from the BLUE family."""
-        return random.choice(BLUE_COLOURS)
+        return random.choice(_family("BLUE_COLOURS"))
 
     @staticmethod
     def random_brown() -> C:
         """A custom method that returns a random :class: `Colour` from the BROWN family."""
-        return random.choice(BROWN_COLOURS)
+        return random.choice(_family("BROWN_COLOURS"))
 
     @staticmethod
     def random_white() -> C:
         """A custom method that returns a random :class: `Colour` from the WHITE family."""
-        return random.choice(WHITE_COLOURS)
+        return random.choice(_family("WHITE_COLOURS"))
 
     @staticmethod
     def random_grey() -> C:
         """A custom method that returns a random :class: `Colour` from the GREY family."""
-        return random.choice(GREY_COLOURS)
+        return random.choice(_family("GREY_COLOURS"))
 
     @staticmethod
     def random_all() -> C:
         """A custom method that returns a random :class: `Colour` from all families."""
 
-        # ALL_COLOURS is a list of colour lists.
-        # Randomly choose one of those first, then choose a colour.
-        return random.choice(random.choice(ALL_COLOURS))
+        # Randomly choose a family first, then a colour, so only the chosen
+        # family has to be built.
+        return random.choice(_family(random.choice(tuple(_FAMILIES))))
 
 ######################################################################
-# Colour Lists - Including original Colours
-
-RED_COLOURS = [
-    FroggeColor.amaranth(), FroggeColor.brick_red(), FroggeColor.bright_red(),
-    FroggeColor.burgundy(), FroggeColor.carmine(), FroggeColor.crimson(),
-    FroggeColor.fire_brick(), FroggeColor.indian_red(),
-    FroggeColor.light_coral(), FroggeColor.maroon(), FroggeColor.medium_red(),
-    FroggeColor.red_brown(), FroggeColor.salmon(), FroggeColor.sangria(),
-    FroggeColor.scarlet(), Colour.brand_red(), Colour.red(),
-    Colour.dark_red()
-]
-
-PINK_COLOURS = [
-    FroggeColor.apricot(), FroggeColor.blush(), FroggeColor.cherise(), FroggeColor.deep_pink(),
-    FroggeColor.hot_pink(), FroggeColor.light_pink(), FroggeColor.magenta_rose(),
-    FroggeColor.pale_violet_red(), FroggeColor.pink(), FroggeColor.puce(),
-    FroggeColor.raspberry(), FroggeColor.rose(), FroggeColor.ruby(), Colour.magenta(),
-    Colour.dark_magenta(), Colour.fuchsia(), Colour.nitro_pink()
-]
-
-ORANGE_COLOURS = [
-    FroggeColor.amber(), FroggeColor.bright_orange(), FroggeColor.bronze(),
-    FroggeColor.coral(), FroggeColor.dark_orange_red(), FroggeColor.dark_salmon(),
-    FroggeColor.darkish_orange(), FroggeColor.light_salmon(), FroggeColor.medium_orange(), FroggeColor.ochre(), FroggeColor.orange_chocolate(),
-    FroggeColor.orange_red(), FroggeColor.papaya_whip(), FroggeColor.peach_puff(),
-    FroggeColor.tomato(), Colour.orange(), Colour.dark_orange()
-]
-
-YELLOW_COLOURS = [
-    FroggeColor.bright_gold(), FroggeColor.bright_yellow(), FroggeColor.dark_goldenrod(),
-    FroggeColor.dark_khaki(), FroggeColor.goldenrod(), FroggeColor.lemon(),
-    FroggeColor.lemon_chiffon(), FroggeColor.light_goldenrod(), FroggeColor.light_yellow(), FroggeColor.moccasin(),
-    FroggeColor.olive(), FroggeColor.pale_goldenrod(), Colour.gold(), Colour.dark_gold(), Colour.yellow()
-]
-
-PURPLE_COLOURS = [
-    FroggeColor.amethyst(), FroggeColor.blue_violet(), FroggeColor.bright_violet(),
-    FroggeColor.byzantium(), FroggeColor.dark_orchid(), FroggeColor.dark_violet(), FroggeColor.darker_magenta(),
-    FroggeColor.deep_indigo(), FroggeColor.deep_purple(), FroggeColor.grape(),
-    FroggeColor.indigo(), FroggeColor.lavender(), FroggeColor.light_lavender(),
-    FroggeColor.light_plum(), FroggeColor.lilac(), FroggeColor.mauve(),
-    FroggeColor.medium_magenta(), FroggeColor.medium_orchid(), FroggeColor.medium_purple(),
-    FroggeColor.medium_violet_red(), FroggeColor.orchid(), FroggeColor.periwinkle(),
-    FroggeColor.plum(), FroggeColor.red_violet(), FroggeColor.violet(), Colour.purple(),
-    Colour.dark_purple(), FroggeColor.thistle()
-]
-
-GREEN_COLOURS = [
-    FroggeColor.bright_lime(), FroggeColor.chartreuse(), FroggeColor.dark_olive(),
-    FroggeColor.dark_sea_green(), FroggeColor.deep_green(), FroggeColor.emerald(),
-    FroggeColor.erin_green(), FroggeColor.forest_green(), FroggeColor.greenish_yellow(),
-    FroggeColor.harlequin(), FroggeColor.jade(), FroggeColor.jungle_green(),
-    FroggeColor.lawn_green(), FroggeColor.light_green(), FroggeColor.light_lime(),
-    FroggeColor.lime_green(), FroggeColor.medium_green(), FroggeColor.medium_sea_green(),
-    FroggeColor.medium_spring_green(), FroggeColor.olive_drab(), FroggeColor.pale_green(),
-    FroggeColor.pear(), FroggeColor.sea_green(), FroggeColor.spring_bud(),
-    FroggeColor.spring_green(), FroggeColor.viridian(),
-    Colour.brand_green(), Colour.green(), Colour.dark_green()
-]
-
-CYAN_COLOURS = [
-    FroggeColor.aquamarine(), FroggeColor.cadet_blue(), FroggeColor.cerulean(),
-    FroggeColor.cyan(), FroggeColor.dark_cyan(), FroggeColor.dark_turquoise(),
-    FroggeColor.deep_teal(), FroggeColor.light_cyan(), FroggeColor.light_sea_green(),
-    FroggeColor.medium_aquamarine(), FroggeColor.medium_turquoise(),
-    FroggeColor.pale_turquoise(), FroggeColor.powder_blue(), FroggeColor.turquoise(), Colour.teal(), Colour.dark_teal()
-]
-
-BLUE_COLOURS = [
-    FroggeColor.baby_blue(), FroggeColor.blue_green(), FroggeColor.cobalt_blue(),
-    FroggeColor.cornflower_blue(), FroggeColor.dark_slate_blue(), FroggeColor.deep_blue(),
-    FroggeColor.deep_sky_blue(), FroggeColor.dodger_blue(), FroggeColor.electric_blue(),
-    FroggeColor.light_blue(), FroggeColor.light_sky_blue(), FroggeColor.light_steel_blue(),
-    FroggeColor.medium_slate_blue(), FroggeColor.midnight_blue(), FroggeColor.navy_blue(),
-    FroggeColor.persian_blue(), FroggeColor.prussian_blue(), FroggeColor.royal_blue(),
-    FroggeColor.sapphire(), FroggeColor.sky_blue(), FroggeColor.slate_blue(),
-    FroggeColor.steel_blue(), FroggeColor.ultramarine(), Colour.blue(), Colour.dark_blue(),
-    Colour.blurple(), Colour.og_blurple()
-]
-
-BROWN_COLOURS = [
-    FroggeColor.blanched_almond(), FroggeColor.brown(), FroggeColor.burlywood(),
-    FroggeColor.chocolate(), FroggeColor.coffee(), FroggeColor.copper(),
-    FroggeColor.cornsilk(), FroggeColor.desert_sand(),
-    FroggeColor.khaki(),  FroggeColor.navajo_white(),
-    FroggeColor.peru(), FroggeColor.rosy_brown(), FroggeColor.saddle_brown(),
-    FroggeColor.sandy_brown(), FroggeColor.sienna(), FroggeColor.tan(), FroggeColor.wheat()
-]
-
-WHITE_COLOURS = [
-    FroggeColor.alice_blue(), FroggeColor.antique_white(), FroggeColor.beige(),
-    FroggeColor.champagne(), FroggeColor.floral_white(), FroggeColor.ghost_white(),
-    FroggeColor.ivory(), FroggeColor.lavender_blush(), FroggeColor.linen(),
-    FroggeColor.misty_rose(), FroggeColor.old_lace(), FroggeColor.peach(),
-    FroggeColor.white(), FroggeColor.white_smoke(), FroggeColor.honeydew(), FroggeColor.mint_cream()
-]
-
-GREY_COLOURS = [
-    FroggeColor.dark_slate_grey(), FroggeColor.dim_grey(), FroggeColor.gainsboro(),
-    FroggeColor.light_slate(), FroggeColor.silver(), FroggeColor.slate_grey(),
-    FroggeColor.taupe(), Colour.lighter_grey(), Colour.dark_grey(), Colour.light_grey(),
-    Colour.darker_grey(), Colour.greyple(), Colour.dark_theme()
-]
-
-ALL_COLOURS = [
-    RED_COLOURS, PINK_COLOURS, ORANGE_COLOURS, YELLOW_COLOURS, PURPLE_COLOURS, GREEN_COLOURS,
-    CYAN_COLOURS, BLUE_COLOURS, BROWN_COLOURS, WHITE_COLOURS, GREY_COLOURS
-]
+# Colour Families - Including original Colours
+#
+# Each family is kept as method names and only turned into colour objects the
+# first time it's used, through the module ``__getattr__`` below. Picking a
+# random embed colour then builds one family instead of every colour there is.
+
+_FAMILIES: Dict[str, Tuple[str, ...]] = {
+    "RED_COLOURS": (
+        "amaranth", "brick_red", "bright_red", "burgundy", "carmine", "crimson",
+        "fire_brick", "indian_red", "light_coral", "maroon", "medium_red", "red_brown",
+        "salmon", "sangria", "scarlet", "brand_red", "red", "dark_red",
+    ),
+    "PINK_COLOURS": (
+        "apricot", "blush", "cherise", "deep_pink", "hot_pink", "light_pink",
+        "magenta_rose", "pale_violet_red", "pink", "puce", "raspberry", "rose", "ruby",
+        "magenta", "dark_magenta", "fuchsia", "nitro_pink",
+    ),
+    "ORANGE_COLOURS": (
+        "amber", "bright_orange", "bronze", "coral", "dark_orange_red", "dark_salmon",
+        "darkish_orange", "light_salmon", "medium_orange", "ochre", "orange_chocolate",
+        "orange_red", "papaya_whip", "peach_puff", "tomato", "orange", "dark_orange",
+    ),
+    "YELLOW_COLOURS": (
+        "bright_gold", "bright_yellow", "dark_goldenrod", "dark_khaki", "goldenrod",
+        "lemon", "lemon_chiffon", "light_goldenrod", "light_yellow", "moccasin",
+        "olive", "pale_goldenrod", "gold", "dark_gold", "yellow",
+    ),
+    "PURPLE_COLOURS": (
+        "amethyst", "blue_violet", "bright_violet", "byzantium", "dark_orchid",
+        "dark_violet", "darker_magenta", "deep_indigo", "deep_purple", "grape",
+        "indigo", "lavender", "light_lavender", "light_plum", "lilac", "mauve",
+        "medium_magenta", "medium_orchid", "medium_purple", "medium_violet_red",
+        "orchid", "periwinkle", "plum", "red_violet", "violet", "purple",
+        "dark_purple", "thistle",
+    ),
+    "GREEN_COLOURS": (
+        "bright_lime", "chartreuse", "dark_olive", "dark_sea_green", "deep_green",
+        "emerald", "erin_green", "forest_green", "greenish_yellow", "harlequin",
+        "jade", "jungle_green", "lawn_green", "light_green", "light_lime",
+        "lime_green", "medium_green", "medium_sea_green", "medium_spring_green",
+        "olive_drab", "pale_green", "pear", "sea_green", "spring_bud", "spring_green",
+        "viridian", "brand_green", "green", "dark_green",
+    ),
+    "CYAN_COLOURS": (
+        "aquamarine", "cadet_blue", "cerulean", "cyan", "dark_cyan", "dark_turquoise",
+        "deep_teal", "light_cyan", "light_sea_green", "medium_aquamarine",
+        "medium_turquoise", "pale_turquoise", "powder_blue", "turquoise", "teal",
+        "dark_teal",
+    ),
+    "BLUE_COLOURS": (
+        "baby_blue", "blue_green", "cobalt_blue", "cornflower_blue", "dark_slate_blue",
+        "deep_blue", "deep_sky_blue", "dodger_blue", "electric_blue", "light_blue",
+        "light_sky_blue", "light_steel_blue", "medium_slate_blue", "midnight_blue",
+        "navy_blue", "persian_blue", "prussian_blue", "royal_blue", "sapphire",
+        "sky_blue", "slate_blue", "steel_blue", "ultramarine", "blue", "dark_blue",
+        "blurple", "og_blurple",
+    ),
+    "BROWN_COLOURS": (
+        "blanched_almond", "brown", "burlywood", "chocolate", "coffee", "copper",
+        "cornsilk", "desert_sand", "khaki", "navajo_white", "peru", "rosy_brown",
+        "saddle_brown", "sandy_brown", "sienna", "tan", "wheat",
+    ),
+    "WHITE_COLOURS": (
+        "alice_blue", "antique_white", "beige", "champagne", "floral_white",
+        "ghost_white", "ivory", "lavender_blush", "linen", "misty_rose", "old_lace",
+        "peach", "white", "white_smoke", "honeydew", "mint_cream",
+    ),
+    "GREY_COLOURS": (
+        "dark_slate_grey", "dim_grey", "gainsboro", "light_slate", "silver",
+        "slate_grey", "taupe", "lighter_grey", "dark_grey", "light_grey",
+        "darker_grey", "greyple", "dark_theme",
+    ),
+}
+
+_BUILT: Dict[str, List[Colour]] = {}
+
+######################################################################
+def _family(name: str) -> List[Colour]:
+
+    try:
+        return _BUILT[name]
+    except KeyError:
+        # FroggeColor subclasses Colour, so this covers the stock colours too.
+        colours = _BUILT[name] = [getattr(FroggeColor, c)() for c in _FAMILIES[name]]
+        return colours
+
+######################################################################
+def __getattr__(name: str) -> Any:
+
+    if name in _FAMILIES:
+        return _family(name)
+    if name == "ALL_COLOURS":
+        return [_family(f) for f in _FAMILIES]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 ######################################################################
 
 CustomColor = FroggeColor
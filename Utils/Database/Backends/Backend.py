@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, AsyncContextManager, AsyncIterator, Iterable, List, Optional, Tuple
+################################################################################
+
+__all__ = ("StorageBackend",)
+
+################################################################################
+class StorageBackend(ABC):
+    """What the database branches need from the thing actually storing rows.
+
+    Branches only ever see the cursor yielded by :meth:`connection`, which
+    must offer awaitable ``execute``/``executemany``/``fetchone``/``fetchall``
+    and a ``rowcount`` attribute, and accept ``%s`` placeholders. Statements
+    are written in the dialect both backends share; the few places that
+    genuinely differ (migrations) check :attr:`dialect`."""
+
+    __slots__ = ()
+
+    dialect: str = ""
+    # Name of the hidden physical row identifier, for batching deletes.
+    row_id: str = ""
+
+################################################################################
+    @abstractmethod
+    async def open(self) -> None:
+
+        raise NotImplementedError
+
+################################################################################
+    @abstractmethod
+    async def close(self) -> None:
+
+        raise NotImplementedError
+
+################################################################################
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+
+        raise NotImplementedError
+
+################################################################################
+    @property
+    def description(self) -> str:
+
+        return self.dialect
+
+################################################################################
+    @abstractmethod
+    def connection(self) -> AsyncContextManager[Any]:
+        """Yields a cursor inside a transaction that commits when the block
+        exits cleanly and rolls back if it raises."""
+
+        raise NotImplementedError
+
+################################################################################
+    @abstractmethod
+    def read_snapshot(
+        self,
+        queries: Iterable[Tuple[str, str]]
+    ) -> AsyncIterator[Tuple[str, List[Tuple[Any, ...]], Optional[float]]]:
+        """Runs every ``(name, query)`` against one consistent, read-only view
+        of the data and yields ``(name, rows, ms)`` in the order given.
+
+        ``ms`` is how long that one query took, or None if the backend sends
+        the batch in a way that can't be timed per query."""
+
+        raise NotImplementedError
+
+################################################################################
+    @abstractmethod
+    def is_missing_table(self, ex: Exception) -> bool:
+        """Whether ``ex`` is this backend's "table does not exist" error."""
+
+        raise NotImplementedError
+
+################################################################################
+    @abstractmethod
+    def row_size(self, table: str, columns: Tuple[str, ...]) -> str:
+        """SQL expression for the stored size in bytes of a row of ``table``,
+        usable in a ``RETURNING`` clause."""
+
+        raise NotImplementedError
+
+################################################################################
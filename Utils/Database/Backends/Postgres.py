@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import os
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from psycopg.errors import UndefinedTable
+from psycopg_pool import AsyncConnectionPool
+
+from .Backend import StorageBackend
+
+if TYPE_CHECKING:
+    from psycopg import AsyncCursor
+################################################################################
+
+__all__ = ("PostgresBackend",)
+
+################################################################################
+class PostgresBackend(StorageBackend):
+    """The production backend: an asyncio connection pool onto the Postgres
+    instance at ``DATABASE_URL``."""
+
+    __slots__ = (
+        "_pool",
+        "_url",
+        "_min_size",
+        "_max_size",
+        "_acquire_timeout",
+    )
+
+    dialect: str = "postgres"
+    row_id: str = "ctid"
+
+################################################################################
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        *,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        acquire_timeout: Optional[float] = None
+    ):
+
+        load_dotenv()
+        self._url: Optional[str] = url or os.getenv("DATABASE_URL")
+        self._min_size: int = min_size or int(os.getenv("DB_POOL_MIN_SIZE", 1))
+        self._max_size: int = max_size or int(os.getenv("DB_POOL_MAX_SIZE", 5))
+        self._acquire_timeout: float = acquire_timeout or float(os.getenv("DB_ACQUIRE_TIMEOUT", 10.0))
+
+        self._pool: Optional[AsyncConnectionPool] = None
+
+################################################################################
+    @property
+    def is_open(self) -> bool:
+
+        return self._pool is not None
+
+################################################################################
+    @property
+    def description(self) -> str:
+
+        return f"postgres, pool size {self._min_size}-{self._max_size}"
+
+################################################################################
+    @property
+    def pool(self) -> Optional[AsyncConnectionPool]:
+
+        return self._pool
+
+################################################################################
+    async def open(self) -> None:
+
+        self._pool = AsyncConnectionPool(
+            self._url,
+            kwargs={"sslmode": "require"},
+            min_size=self._min_size,
+            max_size=self._max_size,
+            timeout=self._acquire_timeout,
+            check=AsyncConnectionPool.check_connection,
+            open=False
+        )
+        await self._pool.open(wait=True, timeout=self._acquire_timeout)
+
+################################################################################
+    async def close(self) -> None:
+
+        await self._pool.close()
+        self._pool = None
+
+################################################################################
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncCursor]:
+        """Raises :class:`psycopg_pool.PoolTimeout` if no connection frees up
+        within the configured acquire timeout."""
+
+        async with self._pool.connection(timeout=self._acquire_timeout) as conn:
+            async with conn.cursor() as cur:
+                yield cur
+
+################################################################################
+    async def read_snapshot(
+        self,
+        queries: Iterable[Tuple[str, str]]
+    ) -> AsyncIterator[Tuple[str, List[Tuple[Any, ...]], Optional[float]]]:
+        """Sends every query in one pipelined batch inside a read-only
+        ``REPEATABLE READ`` transaction; the first query fixes the snapshot
+        the rest see. The batch is synced once, so every result is already
+        in hand before the first is yielded and no per-query time exists to
+        report; ``ms`` is always None here."""
+
+        async with self._pool.connection(timeout=self._acquire_timeout) as conn:
+            await conn.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY;")
+
+            cursors: Dict[str, AsyncCursor] = {}
+            async with conn.pipeline():
+                for name, query in queries:
+                    cursors[name] = cur = conn.cursor()
+                    await cur.execute(query)
+
+            for name, cur in cursors.items():
+                yield name, await cur.fetchall(), None
+                await cur.close()
+
+################################################################################
+    def is_missing_table(self, ex: Exception) -> bool:
+
+        return isinstance(ex, UndefinedTable)
+
+################################################################################
+    def row_size(self, table: str, columns: Tuple[str, ...]) -> str:
+
+        return f"pg_column_size({table}.*)"
+
+################################################################################
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import date, time
+from functools import lru_cache, partial
+from time import perf_counter
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+from .Backend import StorageBackend
+################################################################################
+
+__all__ = ("SQLiteBackend", "SQLiteCursor")
+
+T = TypeVar("T")
+
+# Columns come back as the Python types the managers expect, as they do
+# from Postgres. Converters are keyed by the declared column type.
+sqlite3.register_adapter(time, time.isoformat)
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_converter("TIME", lambda b: time.fromisoformat(b.decode()))
+sqlite3.register_converter("DATE", lambda b: date.fromisoformat(b.decode()))
+sqlite3.register_converter("BOOLEAN", lambda b: bool(int(b)))
+
+################################################################################
+@lru_cache(maxsize=1024)
+def translate(query: str) -> str:
+    """Rewrites the Postgres spellings the branches use into SQLite's."""
+
+    return (
+        query
+        .replace("%s", "?")
+        .replace("IS DISTINCT FROM", "IS NOT")
+    )
+
+################################################################################
+class SQLiteCursor:
+    """Awaitable wrapper around a :class:`sqlite3.Cursor`. Every call runs on
+    the backend's connection thread so a big scan doesn't stall the event
+    loop."""
+
+    __slots__ = (
+        "_cursor",
+        "_backend",
+    )
+
+################################################################################
+    def __init__(self, cursor: sqlite3.Cursor, backend: SQLiteBackend):
+
+        self._cursor: sqlite3.Cursor = cursor
+        self._backend: SQLiteBackend = backend
+
+################################################################################
+    @property
+    def rowcount(self) -> int:
+
+        return self._cursor.rowcount
+
+################################################################################
+    async def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> SQLiteCursor:
+
+        await self._backend.run(self._cursor.execute, translate(query), params or ())
+        return self
+
+################################################################################
+    async def executemany(self, query: str, params_seq: Iterable[Sequence[Any]]) -> None:
+
+        await self._backend.run(self._cursor.executemany, translate(query), params_seq)
+
+################################################################################
+    async def fetchone(self) -> Optional[Tuple[Any, ...]]:
+
+        return await self._backend.run(self._cursor.fetchone)
+
+################################################################################
+    async def fetchall(self) -> List[Tuple[Any, ...]]:
+
+        return await self._backend.run(self._cursor.fetchall)
+
+################################################################################
+class SQLiteBackend(StorageBackend):
+    """A single-connection SQLite backend, on disk or ``:memory:``.
+
+    Meant for benchmarks and offline runs rather than production: there is
+    one connection, so transactions are serialised behind a lock, which also
+    means every read already sees a consistent snapshot. Everything that
+    touches the connection, from ``BEGIN`` to ``COMMIT``, runs on one
+    dedicated thread, in the order it was issued."""
+
+    __slots__ = (
+        "_path",
+        "_conn",
+        "_lock",
+        "_executor",
+    )
+
+    dialect: str = "sqlite"
+    row_id: str = "rowid"
+
+################################################################################
+    def __init__(self, path: str = ":memory:"):
+
+        self._path: str = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+################################################################################
+    @property
+    def is_open(self) -> bool:
+
+        return self._conn is not None
+
+################################################################################
+    @property
+    def description(self) -> str:
+
+        return f"sqlite, {self._path}"
+
+################################################################################
+    async def open(self) -> None:
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._conn = await self.run(self._connect)
+
+################################################################################
+    def _connect(self) -> sqlite3.Connection:
+
+        # Transactions are managed explicitly below, hence isolation_level=None.
+        conn = sqlite3.connect(
+            self._path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        if self._path != ":memory:":
+            conn.execute("PRAGMA journal_mode = WAL;")
+            conn.execute("PRAGMA synchronous = NORMAL;")
+
+        return conn
+
+################################################################################
+    async def close(self) -> None:
+
+        async with self._lock:
+            await self.run(self._conn.close)
+            self._conn = None
+
+        self._executor.shutdown(wait=False)
+        self._executor = None
+
+################################################################################
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs ``func(*args)`` on the connection's thread."""
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(func, *args))
+
+################################################################################
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[SQLiteCursor]:
+
+        async with self._lock:
+            cur = await self.run(self._conn.cursor)
+            await self.run(cur.execute, "BEGIN;")
+            try:
+                yield SQLiteCursor(cur, self)
+            except BaseException:
+                # Queued behind whatever statement was still running, since
+                # there's only the one thread.
+                await self.run(cur.execute, "ROLLBACK;")
+                raise
+            else:
+                await self.run(cur.execute, "COMMIT;")
+            finally:
+                await self.run(cur.close)
+
+################################################################################
+    async def read_snapshot(
+        self,
+        queries: Iterable[Tuple[str, str]]
+    ) -> AsyncIterator[Tuple[str, List[Tuple[Any, ...]], Optional[float]]]:
+
+        async with self.connection() as cur:
+            for name, query in queries:
+                start = perf_counter()
+                await cur.execute(query)
+                rows = await cur.fetchall()
+                yield name, rows, (perf_counter() - start) * 1000
+
+################################################################################
+    def is_missing_table(self, ex: Exception) -> bool:
+
+        return isinstance(ex, sqlite3.OperationalError) and "no such table" in str(ex)
+
+################################################################################
+    def row_size(self, table: str, columns: Tuple[str, ...]) -> str:
+
+        return " + ".join(f"COALESCE(LENGTH(CAST({c} AS BLOB)), 0)" for c in columns)
+
+################################################################################
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+
+from dotenv import load_dotenv
+
+from .Backend import StorageBackend
+################################################################################
+
+__all__ = ("StorageBackend", "make_backend")
+
+################################################################################
+def make_backend() -> StorageBackend:
+    """Builds the backend named by ``DATABASE_BACKEND`` (``postgres`` by
+    default, or ``sqlite`` with ``SQLITE_PATH``, default ``:memory:``).
+
+    Imports are deferred so the SQLite backend runs without psycopg."""
+
+    load_dotenv()
+    name = os.getenv("DATABASE_BACKEND", "postgres").lower()
+
+    if name == "sqlite":
+        from .SQLite import SQLiteBackend
+        return SQLiteBackend(os.getenv("SQLITE_PATH", ":memory:"))
+
+    if name in ("postgres", "postgresql"):
+        from .Postgres import PostgresBackend
+        return PostgresBackend()
+
+    raise ValueError(f"Unknown DATABASE_BACKEND: {name!r}")
+
+################################################################################
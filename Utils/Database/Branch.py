@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from functools import wraps
+from inspect import iscoroutinefunction
 from uuid import uuid4
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional
+
+from .Metrics import current_tag
 
 if TYPE_CHECKING:
     from Classes.Bot import PartyBusBot
@@ -13,12 +17,40 @@ __all__ = ("DBWorkerBranch",)
 ################################################################################
 class DBWorkerBranch:
     """Common superclass for all Database-related workers. Basically just
-    holds a reference to the bot."""
+    holds a reference to the bot.
+
+    Subclasses declared with a ``tag`` (``class DatabaseUpdater(DBWorkerBranch,
+    tag="update")``) have each public coroutine wrapped so that statements
+    it runs are recorded under ``"<tag>.<name>"``. Aliases share a wrapper
+    and the shortest name wins, so ``update_job`` reports as ``update.job``."""
 
     __slots__ = (
         "_state",
     )
 
+################################################################################
+    def __init_subclass__(cls, tag: Optional[str] = None, **kwargs: Any):
+
+        super().__init_subclass__(**kwargs)
+
+        if tag is None:
+            return
+
+        names: Dict[Callable[..., Any], List[str]] = {}
+        for name, attr in vars(cls).items():
+            if not name.startswith("_") and iscoroutinefunction(attr):
+                names.setdefault(attr, []).append(name)
+
+        prefix = f"{tag}_"
+        for func, aliases in names.items():
+            short = min(
+                (n[len(prefix):] if n.startswith(prefix) else n for n in aliases),
+                key=len
+            )
+            wrapper = _tagged(f"{tag}.{short}", func)
+            for name in aliases:
+                setattr(cls, name, wrapper)
+
 ################################################################################
     def __init__(self, _state: PartyBusBot):
 
@@ -42,4 +74,26 @@ class DBWorkerBranch:
         
         return uuid4().hex
     
+################################################################################
+    @staticmethod
+    def placeholders(width: int, rows: int = 1) -> str:
+        """Returns ``rows`` comma-separated ``(%s, ...)`` groups of ``width``
+        parameters each, for building multi-row ``VALUES``/``IN`` lists."""
+        
+        group = "(" + ", ".join(["%s"] * width) + ")"
+        return ", ".join([group] * rows)
+    
+################################################################################
+def _tagged(tag: str, func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable[..., Coroutine[Any, Any, Any]]:
+
+    @wraps(func)
+    async def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = current_tag.set(tag)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            current_tag.reset(token)
+
+    return _wrapper
+
 ################################################################################
@@ -1,139 +1,86 @@
 from __future__ import annotations
 
 from .Branch import DBWorkerBranch
+from .Migrations import MIGRATIONS
 ################################################################################
 
 __all__ = ("DatabaseBuilder",)
 
 ################################################################################
-class DatabaseBuilder(DBWorkerBranch):
-    """A utility class for building and asserting elements of the database."""
-
-    def build_all(self) -> None:
-
-        self.build_positions_tables()
-        self.build_training_tables()
-        self.build_messages_table()
-        self.build_jobs_table()
-        
-        print("Database lookin' good!")
-        
-################################################################################
-    def build_positions_tables(self) -> None:
-
-        with self.database as db:
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS positions ("
-                "_id TEXT PRIMARY KEY,"
-                "name TEXT,"
-                "trainer_role BIGINT,"
-                "trainee_role BIGINT"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS requirements ("
-                "_id TEXT PRIMARY KEY,"
-                "position TEXT,"
-                "description TEXT"
-                ");"
-            )
- 
+class DatabaseBuilder(DBWorkerBranch, tag="build"):
+    """A utility class for building and asserting elements of the database.
+
+    The schema is versioned: each boot reads the recorded version from
+    ``schema_version`` and only runs the migrations newer than it. When the
+    database is already current that single read is the only statement."""
+
+    @property
+    def latest_version(self) -> int:
+
+        return MIGRATIONS[-1].version
+
 ################################################################################
-    def build_training_tables(self) -> None:
-        
-        with self.database as db:
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS tusers ("
-                "user_id BIGINT PRIMARY KEY ,"
-                "name TEXT,"
-                "notes TEXT"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS tuser_config ("
-                "user_id BIGINT PRIMARY KEY,"
-                "image_url TEXT,"
-                "job_pings BOOLEAN DEFAULT TRUE"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS availability ("
-                "user_id BIGINT,"
-                "day INTEGER,"
-                "start_time TIME,"
-                "end_time TIME"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS trainers ("
-                "user_id BIGINT PRIMARY KEY"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS trainees ("
-                "user_id BIGINT PRIMARY KEY"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS qualifications ("
-                "_id TEXT PRIMARY KEY,"
-                "user_id BIGINT,"
-                "position TEXT,"
-                "level INTEGER"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS trainings ("
-                "_id TEXT PRIMARY KEY,"
-                "user_id BIGINT,"
-                "position TEXT,"
-                "trainer BIGINT"
-                ");"
-            )
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS requirement_overrides ("
-                "user_id BIGINT,"
-                "training_id TEXT,"
-                "requirement_id TEXT,"
-                "level INTEGER"
-                ");"
-            )
-            
+    async def build_all(self) -> None:
+
+        current = await self.schema_version()
+        if current >= self.latest_version:
+            print(f"Database lookin' good! (schema v{current})")
+            return
+
+        await self.migrate(current)
+
+        print(f"Database lookin' good! (schema v{current} -> v{self.latest_version})")
+
 ################################################################################
-    def build_messages_table(self) -> None:
-        
-        with self.database as db:
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS messages ("
-                "_id TEXT PRIMARY KEY,"
-                "channel_id BIGINT,"
-                "message_id BIGINT"
-                ");"
-            )
-            
-            db.execute(
-                "INSERT INTO messages (_id) VALUES ('trainer_signup_message') "
-                "ON CONFLICT DO NOTHING;"
-            )
-            
+    async def schema_version(self) -> int:
+        """Returns the newest applied migration, or 0 for a database that
+        has never been migrated.
+
+        One statement on one connection. A database that was never migrated
+        has no ``schema_version`` table, which surfaces as the backend's
+        missing-table error rather than being checked for up front. That
+        error aborts the transaction, so this mustn't run inside one."""
+
+        if not self.database.backend.is_open:
+            await self.database.connect()
+
+        try:
+            async with self.database.acquire() as db:
+                await db.execute("SELECT MAX(version) FROM schema_version;")
+                row = await db.fetchone()
+        except Exception as ex:
+            if self.database.backend.is_missing_table(ex):
+                return 0
+            raise
+
+        return row[0] or 0
+
 ################################################################################
-    def build_jobs_table(self) -> None:
-        
-        with self.database as db:
-            db.execute(
-                "CREATE TABLE IF NOT EXISTS jobs ("
-                "_id TEXT PRIMARY KEY,"
-                "position TEXT,"
-                "venue TEXT,"
+    async def migrate(self, current: int) -> None:
+        """Applies every migration newer than ``current`` in one transaction."""
+
+        dialect = self.database.backend.dialect
+
+        async with self.database.transaction() as db:
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS schema_version ("
+                "version INTEGER PRIMARY KEY,"
                 "description TEXT,"
-                "date DATE,"
-                "start_time TIME,"
-                "end_time TIME,"
-                "pay_rate INTEGER,"
-                "pay_type INTEGER,"
-                "requester BIGINT,"
-                "applicant BIGINT"
+                "applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
                 ");"
             )
 
+            for migration in MIGRATIONS:
+                if migration.version <= current:
+                    continue
+
+                print(f"Applying migration v{migration.version}: {migration.description}...")
+                for statement in migration.for_dialect(dialect):
+                    await db.execute(statement)
+
+                await db.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (%s, %s);",
+                    (migration.version, migration.description)
+                )
+
 ################################################################################
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Tuple
+
+from .Branch import DBWorkerBranch
+
+if TYPE_CHECKING:
+    from Classes.Bot import PartyBusBot
+################################################################################
+
+__all__ = ("DatabaseCompactor", "OrphanRule", "ORPHAN_RULES")
+
+################################################################################
+class OrphanRule(NamedTuple):
+    """A child table and the anti-join that marks one of its rows (aliased
+    ``o``) as no longer reachable from live data."""
+
+    table: str
+    columns: Tuple[str, ...]
+    orphaned: str
+
+################################################################################
+ORPHAN_RULES: Tuple[OrphanRule, ...] = (
+    OrphanRule(
+        "requirement_overrides",
+        ("user_id", "training_id", "requirement_id", "level"),
+        "NOT EXISTS (SELECT 1 FROM trainings t WHERE t._id = o.training_id) "
+        "OR NOT EXISTS (SELECT 1 FROM requirements r WHERE r._id = o.requirement_id)"
+    ),
+    OrphanRule(
+        "qualifications",
+        ("_id", "user_id", "position", "level"),
+        "NOT EXISTS (SELECT 1 FROM positions p WHERE p._id = o.position) "
+        "OR NOT EXISTS (SELECT 1 FROM tusers u WHERE u.user_id = o.user_id)"
+    ),
+    OrphanRule(
+        "availability",
+        ("user_id", "day", "start_time", "end_time"),
+        "NOT EXISTS (SELECT 1 FROM tusers u WHERE u.user_id = o.user_id)"
+    ),
+)
+
+################################################################################
+class DatabaseCompactor(DBWorkerBranch, tag="compact"):
+    """Deletes rows whose parent record is gone.
+
+    Each rule is applied in batches of ``batch_size``, every batch its own
+    short transaction, with a brief pause between them so row locks are
+    never held for long and regular writes can interleave. Reclaimed bytes
+    are the stored size of the deleted rows; Postgres hands the space back
+    to the table once autovacuum has been through."""
+
+    __slots__ = (
+        "_interval",
+        "_batch_size",
+        "_pause",
+        "_task",
+    )
+
+################################################################################
+    def __init__(
+        self,
+        _state: PartyBusBot,
+        *,
+        interval: Optional[float] = None,
+        batch_size: Optional[int] = None,
+        pause: float = 0.05
+    ):
+
+        super().__init__(_state)
+
+        self._interval: float = interval or float(os.getenv("DB_COMPACT_INTERVAL", 21600))
+        self._batch_size: int = batch_size or int(os.getenv("DB_COMPACT_BATCH_SIZE", 500))
+        self._pause: float = pause
+
+        self._task: Optional[asyncio.Task] = None
+
+################################################################################
+    async def compact_all(self) -> Dict[str, Tuple[int, int]]:
+        """Runs every orphan rule and returns ``{table: (rows, bytes)}``."""
+
+        start = perf_counter()
+        results = {rule.table: await self.compact_rule(rule) for rule in ORPHAN_RULES}
+
+        rows = sum(r for r, _ in results.values())
+        size = sum(b for _, b in results.values())
+        detail = ", ".join(f"{table}: {r}" for table, (r, _) in results.items() if r)
+        print(
+            f"Compaction reclaimed {rows} orphaned rows (~{size} bytes) "
+            f"in {round((perf_counter() - start) * 1000, 2)}ms"
+            + (f" ({detail})." if detail else ".")
+        )
+
+        return results
+
+################################################################################
+    async def compact_rule(self, rule: OrphanRule) -> Tuple[int, int]:
+
+        backend = self.database.backend
+        query = (
+            f"DELETE FROM {rule.table} WHERE {backend.row_id} IN ("
+            f"SELECT o.{backend.row_id} FROM {rule.table} o "
+            f"WHERE {rule.orphaned} LIMIT %s"
+            f") RETURNING {backend.row_size(rule.table, rule.columns)};"
+        )
+
+        rows = size = 0
+        while True:
+            async with self.database.transaction() as db:
+                await db.execute(query, (self._batch_size,))
+                batch = await db.fetchall()
+
+            rows += len(batch)
+            size += sum(b or 0 for b, in batch)
+
+            if len(batch) < self._batch_size:
+                return rows, size
+
+            await asyncio.sleep(self._pause)
+
+################################################################################
+    def start(self, delay: float = 60) -> None:
+
+        if self._interval <= 0 or self._task is not None:
+            return
+
+        # Runs for the life of the process, so it shouldn't carry whatever
+        # context (startup stage, transaction) it happened to be started in.
+        self._task = contextvars.Context().run(asyncio.create_task, self._run(delay))
+
+################################################################################
+    def stop(self) -> None:
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+################################################################################
+    async def _run(self, delay: float) -> None:
+
+        await asyncio.sleep(delay)
+        while True:
+            try:
+                await self.compact_all()
+            except Exception as ex:
+                print(f"Orphan compaction failed: {ex!r}")
+
+            await asyncio.sleep(self._interval)
+
+################################################################################
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from inspect import signature
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .Branch import DBWorkerBranch
+
+if TYPE_CHECKING:
+    from .Database import Database
+################################################################################
+
+__all__ = ("LegacyBranch", "LegacyInserter")
+
+################################################################################
+class LegacyBranch:
+    """Synchronous facade over one of the awaitable database branches.
+
+    Lets the existing ``db.update.foo(...)`` style call sites keep working
+    from property setters and other non-async code. Instead of blocking the
+    event loop, each call returns immediately: inside a
+    :meth:`Database.transaction` block it joins that unit of work, otherwise
+    it is handed to the database's write-behind queue. With ``coalesce``
+    set, calls are keyed on the method and the entities passed to it, so
+    repeated updates of the same entity within the flush window collapse
+    into one write."""
+
+    __slots__ = (
+        "_database",
+        "_branch",
+        "_callers",
+        "_coalesce",
+    )
+
+################################################################################
+    def __init__(self, database: Database, branch: DBWorkerBranch, coalesce: bool = False):
+
+        self._database: Database = database
+        self._branch: DBWorkerBranch = branch
+        self._coalesce: bool = coalesce
+
+        self._callers: Dict[str, Callable[..., Any]] = {}
+
+################################################################################
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+
+        try:
+            return self._callers[name]
+        except KeyError:
+            caller = self._callers[name] = self._make_caller(getattr(self._branch, name))
+            return caller
+
+################################################################################
+    def _make_caller(self, func: Callable[..., Any]) -> Callable[..., Any]:
+
+        def _enqueue(*args: Any, **kwargs: Any) -> None:
+            self._database.submit(self._key(func, args), func, *args, **kwargs)
+
+        return _enqueue
+
+################################################################################
+    def _key(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> Optional[Hashable]:
+
+        if not self._coalesce:
+            return None
+
+        # The entity objects are held by the pending write itself, so their
+        # ids stay stable for as long as the key is in the queue.
+        return (func.__name__, *(id(a) for a in args))
+
+################################################################################
+class LegacyInserter(LegacyBranch):
+    """Compatibility facade for :class:`DatabaseInserter`.
+
+    Insert methods that hand back a record ID accept a ``new_id`` keyword, so
+    the ID is generated up front and returned synchronously while the
+    insert itself is queued like any other write."""
+
+    __slots__ = ()
+
+################################################################################
+    def _make_caller(self, func: Callable[..., Any]) -> Callable[..., Any]:
+
+        if "new_id" not in signature(func).parameters:
+            return super()._make_caller(func)
+
+        def _enqueue(*args: Any, **kwargs: Any) -> str:
+            new_id = kwargs.setdefault("new_id", DBWorkerBranch.generate_id())
+            self._database.submit(None, func, *args, **kwargs)
+            return new_id
+
+        return _enqueue
+
+################################################################################
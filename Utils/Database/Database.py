@@ -1,144 +1,306 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any, Dict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, Dict, Hashable, Optional
 
-import psycopg2
 from dotenv import load_dotenv
-from psycopg2 import InterfaceError
 
+from .Backends import StorageBackend, make_backend
+from .Compat import LegacyBranch, LegacyInserter
+from .Loader import TableCallback
+from .Metrics import QueryMetrics
+from .Snapshot import SnapshotCache
+from .UnitOfWork import UnitOfWork
 from .Worker import DatabaseWorker
+from .WriteBehind import WriteBehindQueue
 
 if TYPE_CHECKING:
-    from psycopg2.extensions import connection, cursor
-
-    from .Inserter import DatabaseInserter
-    from .Updater import DatabaseUpdater
-    from .Deleter import DatabaseDeleter
     from Classes.Bot import PartyBusBot
 ################################################################################
 
 __all__ = ("Database", )
 
+# The transaction the current task is running inside, if any.
+_active_unit: ContextVar[Optional[UnitOfWork]] = ContextVar("_active_unit", default=None)
+
 ################################################################################
 class Database:
-    """Database class for handling all database interactions."""
+    """Database class for handling all database interactions.
+
+    Storage is delegated to a :class:`StorageBackend` (a Postgres connection
+    pool in production, SQLite for benchmarks and offline runs), so a slow
+    round trip only ever parks the coroutine that issued it. The
+    ``insert``/``update``/``delete`` properties hand out synchronous
+    compatibility facades that hand their writes to a write-behind queue,
+    while ``aio`` exposes the awaitable branches directly."""
 
     __slots__ = (
         "_state",
-        "__connection",
-        "_cursor",
+        "_backend",
         "_worker",
+        "_write_behind",
+        "_snapshots",
+        "_metrics",
+        "_legacy_insert",
+        "_legacy_update",
+        "_legacy_delete",
     )
 
 ################################################################################
-    def __init__(self, bot: PartyBusBot):
+    def __init__(
+        self,
+        bot: PartyBusBot,
+        *,
+        backend: Optional[StorageBackend] = None
+    ):
 
         self._state: PartyBusBot = bot
 
-        self.__connection: connection = None  # type: ignore
-        self._connect()
-
-        self._cursor: cursor = None  # type: ignore
+        load_dotenv()
+        self._backend: StorageBackend = backend or make_backend()
         self._worker: DatabaseWorker = DatabaseWorker(bot)
 
+        self._write_behind: WriteBehindQueue = WriteBehindQueue(
+            self,
+            window=float(os.getenv("DB_WRITE_BEHIND_WINDOW", 0.5)),
+            max_batch=int(os.getenv("DB_WRITE_BEHIND_MAX_BATCH", 100))
+        )
+
+        self._metrics: QueryMetrics = QueryMetrics(
+            window=float(os.getenv("DB_METRICS_WINDOW", 3600)),
+            slow_ms=float(os.getenv("DB_SLOW_QUERY_MS", 250))
+        )
+        self._snapshots: SnapshotCache = SnapshotCache(
+            self,
+            path=os.getenv("DB_SNAPSHOT_PATH", ".cache/db_snapshot.bin"),
+            interval=float(os.getenv("DB_SNAPSHOT_INTERVAL", 3600)),
+            fold_interval=float(os.getenv("DB_CHANGE_LOG_FOLD_INTERVAL", 300))
+        )
+
+        self._legacy_insert: LegacyInserter = LegacyInserter(self, self._worker.insert)
+        self._legacy_update: LegacyBranch = LegacyBranch(self, self._worker.update, coalesce=True)
+        self._legacy_delete: LegacyBranch = LegacyBranch(self, self._worker.delete)
+
 ################################################################################
-    def _connect(self) -> None:
-        
+    async def connect(self) -> None:
+
+        if self._backend.is_open:
+            return
+
         print("Connecting to Database...")
-        
-        self.__connection = None
-        self._cursor = None
+        await self._backend.open()
+        print(f"Connected successfully! ({self._backend.description})")
 
-        load_dotenv()
-        self.__connection = psycopg2.connect(
-            os.getenv("DATABASE_URL"), sslmode="require"
-        )
+################################################################################
+    async def close(self) -> None:
+
+        if not self._backend.is_open:
+            return
+
+        # Let anything still sitting in the write-behind queue reach the
+        # database first, then capture the final state for the next boot.
+        self._worker.compact.stop()
+        await self._snapshots.stop()
+        try:
+            await self._snapshots.refresh()
+        except Exception as ex:
+            print(f"Couldn't snapshot on shutdown: {ex!r}")
+        await self._write_behind.flush()
+
+        await self._backend.close()
+
+################################################################################
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[UnitOfWork]:
+        """Yields something to run statements on.
 
-        print("Connected successfully!")
+        Inside a :meth:`transaction` block this is that transaction's unit of
+        work. Otherwise a connection is checked out of the backend for the
+        duration of the block, committed when it exits cleanly and rolled
+        back if it raises."""
+
+        active = self._current_unit()
+        if active is not None:
+            yield active
+            return
+
+        async with self._checkout() as unit:
+            yield unit
+
+################################################################################
+    @asynccontextmanager
+    async def transaction(self, label: Optional[str] = None, *, ordered: bool = True) -> AsyncIterator[UnitOfWork]:
+        """Runs every branch call made inside the block as one unit of work:
+        one connection, one commit at the end, rolled back as a whole if the
+        block raises.
+
+        Nested ``transaction()``/``acquire()`` calls join the outer unit, and
+        synchronous ``insert``/``update``/``delete`` facade calls made inside
+        the block are applied on it just before committing. Pending
+        write-behind writes are flushed first (unless ``ordered`` is False)
+        so the unit never lands ahead of older writes to the same rows. A
+        labelled unit prints how many statements it committed."""
+
+        active = self._current_unit()
+        if active is not None:
+            yield active
+            return
+
+        if ordered:
+            await self._write_behind.flush()
+
+        async with self._checkout(label) as unit:
+            token = _active_unit.set(unit)
+            try:
+                yield unit
+                await unit.apply_deferred()
+            finally:
+                _active_unit.reset(token)
+
+        unit.report()
 
 ################################################################################
-    def __enter__(self) -> cursor:
+    @asynccontextmanager
+    async def _checkout(self, label: Optional[str] = None) -> AsyncIterator[UnitOfWork]:
 
-        if not self.__connection:
-            self._connect()
+        if not self._backend.is_open:
+            await self.connect()
 
-        self._get_cursor()
-        return self._cursor
+        async with self._backend.connection() as cur:
+            unit = UnitOfWork(cur, label, self._metrics)
+            try:
+                yield unit
+            finally:
+                unit.finish()
 
 ################################################################################
-    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+    @staticmethod
+    def _current_unit() -> Optional[UnitOfWork]:
+        """The transaction the current task is running inside, if any.
+
+        Tasks copy their context when they're created, so one started inside
+        a transaction still sees it after it has committed. Joining it then
+        would run on a connection that's back in the pool, or queue writes
+        that are never applied, so that's refused outright; such tasks
+        should be started in a fresh ``contextvars.Context()``."""
+
+        active = _active_unit.get()
+        if active is not None and active.finished:
+            raise RuntimeError(
+                f"The transaction{f' [{active.label}]' if active.label else ''} this task "
+                "was started in has already finished."
+            )
 
-        self._commit()
-        self._close_cursor()
+        return active
 
 ################################################################################
-    def _commit(self) -> None:
+    def submit(
+        self,
+        key: Optional[Hashable],
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any
+    ) -> None:
+        """Routes a facade write: onto the active unit of work if there is
+        one, otherwise onto the write-behind queue."""
+
+        active = self._current_unit()
+        if active is not None:
+            active.defer(key, func, *args, **kwargs)
+        else:
+            self._write_behind.submit(key, func, *args, **kwargs)
 
-        try:
-            self.__connection.commit()
-        except InterfaceError:
-            self._connect()
-            self._commit()
+################################################################################
+    async def flush(self) -> int:
+        """Forces every write still waiting in the write-behind queue out to
+        the database. Await this on paths that must not continue until their
+        changes are persisted."""
+
+        return await self._write_behind.flush()
 
 ################################################################################
-    def _get_cursor(self) -> None:
+    @property
+    def backend(self) -> StorageBackend:
 
-        try:
-            self._cursor = self.__connection.cursor()
-        except InterfaceError:
-            self._connect()
-            self._get_cursor()
+        return self._backend
 
 ################################################################################
-    def _close_cursor(self) -> None:
+    @property
+    def metrics(self) -> QueryMetrics:
 
-        try:
-            self._cursor.close()
-        except InterfaceError:
-            pass
+        return self._metrics
+
+################################################################################
+    @property
+    def snapshots(self) -> SnapshotCache:
+
+        return self._snapshots
 
 ################################################################################
     @property
-    def connection(self) -> connection:
+    def write_behind(self) -> WriteBehindQueue:
 
-        return self.__connection
+        return self._write_behind
 
 ################################################################################
     @property
     def cursor(self) -> None:
 
         raise Exception(
-            "Cursor is not a property of Database. Use a context manager block instead."
+            "Cursor is not a property of Database. Use an `async with database.acquire()` block instead."
         )
 
 ################################################################################
     @property
-    def insert(self) -> DatabaseInserter:
+    def aio(self) -> DatabaseWorker:
 
-        return self._worker._inserter
+        return self._worker
 
 ################################################################################
     @property
-    def update(self) -> DatabaseUpdater:
+    def insert(self) -> LegacyInserter:
 
-        return self._worker._updater
+        return self._legacy_insert
 
 ################################################################################
-
     @property
-    def delete(self) -> DatabaseDeleter:
+    def update(self) -> LegacyBranch:
 
-        return self._worker._deleter
+        return self._legacy_update
 
 ################################################################################
-    def assert_structure(self) -> None:
 
-        self._worker.build_all()
+    @property
+    def delete(self) -> LegacyBranch:
+
+        return self._legacy_delete
 
 ################################################################################
-    def load_all(self) -> Dict[str, Any]:
+    async def assert_structure(self) -> None:
 
-        return self._worker.load_all()
+        await self._worker.build_all()
+
+################################################################################
+    async def load_all(self, on_table: Optional[TableCallback] = None) -> Dict[str, Any]:
+        """Loads every table, preferring the local snapshot when the
+        database hasn't changed since it was written. ``on_table`` only
+        fires for a full load; a snapshot is restored in one piece."""
+
+        # Whatever a previous run logged since its last fold is summed by
+        # every token read until it's folded, so fold it first.
+        await self._snapshots.fold()
+        data = await self._snapshots.restore(await self._worker.change_token())
+        if data is None:
+            data = await self._worker.load_all(on_table)
+            await self._snapshots.save(data)
+            data["source"] = "database"
+        else:
+            data["source"] = "snapshot"
+
+        self._snapshots.start()
+        self._worker.compact.start()
+        return data
 
 ################################################################################
@@ -12,53 +12,59 @@ if TYPE_CHECKING:
 __all__ = ("DatabaseDeleter",)
 
 ################################################################################
-class DatabaseDeleter(DBWorkerBranch):
+class DatabaseDeleter(DBWorkerBranch, tag="delete"):
     """A utility class for deleting data from the database."""
 
-    def delete_requirement(self, req: Requirement) -> None:
+    async def delete_requirement(self, req: Requirement) -> None:
 
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "DELETE FROM requirements WHERE _id = %s;",
                 (req.id,)
             )
             
 ################################################################################
-    def delete_training(self, training: Training) -> None:
+    async def delete_training(self, training: Training) -> None:
     
-        with self.database as db:
-            db.execute(
+        async with self.database.transaction() as db:
+            await db.execute(
                 "DELETE FROM trainings WHERE _id = %s;",
                 (training.id,)
             )
-            
-        # self.delete_requirement_overrides(training.id, training.requirement_overrides)
+            # Every override belongs to the training, so drop them by key
+            # rather than by whatever happens to be loaded in memory.
+            await db.execute(
+                "DELETE FROM requirement_overrides WHERE training_id = %s;",
+                (training.id,)
+            )
     
 ################################################################################
-    def delete_requirement_overrides(self, training_id: str, overrides: Dict[str, RequirementLevel]) -> None:
+    async def delete_requirement_overrides(self, training_id: str, overrides: Dict[str, RequirementLevel]) -> None:
         
-        with self.database as db:
-            for req_id, _ in overrides.items():
-                db.execute(
-                    "DELETE FROM requirement_overrides WHERE training_id = %s "
-                    "AND requirement_id = %s;",
-                    (training_id, req_id)
-                )
+        if not overrides:
+            return
+        
+        async with self.database.acquire() as db:
+            await db.execute(
+                "DELETE FROM requirement_overrides WHERE training_id = %s "
+                f"AND requirement_id IN {self.placeholders(len(overrides))};",
+                (training_id, *overrides.keys())
+            )
     
 ################################################################################
-    def delete_qualification(self, qualification: Qualification) -> None:
+    async def delete_qualification(self, qualification: Qualification) -> None:
     
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "DELETE FROM qualifications WHERE _id = %s;",
                 (qualification.id,)
             )
     
 ################################################################################        
-    def delete_availability(self, availability: Availability) -> None:
+    async def delete_availability(self, availability: Availability) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "DELETE FROM availability WHERE user_id = %s AND day = %s;",
                 (availability.parent.user_id, availability.day.value)
             )
@@ -15,16 +15,16 @@ if TYPE_CHECKING:
 __all__ = ("DatabaseInserter",)
 
 ################################################################################
-class DatabaseInserter(DBWorkerBranch):
+class DatabaseInserter(DBWorkerBranch, tag="insert"):
     """A utility class for inserting new records into the database."""
 
-    def insert_position(self, name: str) -> str:
+    async def insert_position(self, name: str, *, new_id: Optional[str] = None) -> str:
         """Inserts a new position into the database."""
 
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO positions (_id, name) VALUES (%s, %s);",
                 (new_id, name)
             )
@@ -32,12 +32,12 @@ class DatabaseInserter(DBWorkerBranch):
         return new_id
 
 ################################################################################
-    def insert_new_requirement(self, position: str, description: str) -> str:
+    async def insert_new_requirement(self, position: str, description: str, *, new_id: Optional[str] = None) -> str:
 
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
 
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO requirements (_id, position, description) "
                 "VALUES (%s, %s, %s);",
                 (new_id, position, description)
@@ -46,34 +46,34 @@ class DatabaseInserter(DBWorkerBranch):
         return new_id
     
 ################################################################################
-    def insert_tuser_records(self, user_id: int) -> None:
+    async def insert_tuser_records(self, user_id: int) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO tusers (user_id) VALUES (%s);",
                 (user_id,)
             )
-            db.execute(
+            await db.execute(
                 "INSERT INTO tuser_config (user_id) VALUES (%s);",
                 (user_id,)
             )
-            db.execute(
+            await db.execute(
                 "INSERT INTO trainers (user_id) VALUES (%s);",
                 (user_id,)
             )
-            db.execute(
+            await db.execute(
                 "INSERT INTO trainees (user_id) VALUES (%s);",
                 (user_id,)
             )
             
 ################################################################################
-    def insert_trainer(self, user_id: int) -> str:
+    async def insert_trainer(self, user_id: int, *, new_id: Optional[str] = None) -> str:
         """Inserts a new trainer into the database."""
         
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO trainers (_id, user_id, name, qualifications, trainees) "
                 "VALUES (%s, %s, %s, %s, %s);",
                 (new_id, user_id, None, [], [])
@@ -82,13 +82,13 @@ class DatabaseInserter(DBWorkerBranch):
         return new_id
 
 ################################################################################
-    def insert_trainee(self, user_id: int) -> str:
+    async def insert_trainee(self, user_id: int, *, new_id: Optional[str] = None) -> str:
         """Inserts a new trainee into the database."""
         
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO trainees (_id, user_id, name, trainings) "
                 "VALUES (%s, %s, %s, %s);",
                 (new_id, user_id, None, [])
@@ -97,12 +97,12 @@ class DatabaseInserter(DBWorkerBranch):
         return new_id
     
 ################################################################################
-    def insert_new_qualification(self, user_id: int, pos_id: str, level: int) -> str:
+    async def insert_new_qualification(self, user_id: int, pos_id: str, level: int, *, new_id: Optional[str] = None) -> str:
         
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO qualifications (_id, user_id, position, level) "
                 "VALUES (%s, %s, %s, %s);",
                 (new_id, user_id, pos_id, level)
@@ -111,12 +111,12 @@ class DatabaseInserter(DBWorkerBranch):
         return new_id
         
 ################################################################################
-    def insert_new_training(self, user_id: int, position: str) -> str:
+    async def insert_new_training(self, user_id: int, position: str, *, new_id: Optional[str] = None) -> str:
             
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO trainings (_id, user_id, position) "
                 "VALUES (%s, %s, %s);",
                 (new_id, user_id, position)
@@ -125,32 +125,34 @@ class DatabaseInserter(DBWorkerBranch):
         return new_id
     
 ################################################################################
-    def insert_requirement_override(self, training_id: str, requirement_id: str, level: int) -> None:
+    async def insert_requirement_override(self, training_id: str, requirement_id: str, level: int) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO requirement_overrides (training_id, "
-                "requirement_id, level) VALUES (%s, %s, %s);",
+                "requirement_id, level) VALUES (%s, %s, %s) "
+                "ON CONFLICT (training_id, requirement_id) DO UPDATE "
+                "SET level = EXCLUDED.level;",
                 (training_id, requirement_id, level)
             )
             
 ################################################################################
-    def insert_availability(self, user_id: int, day: int, start: time, end: Optional[time]) -> None:
+    async def insert_availability(self, user_id: int, day: int, start: time, end: Optional[time]) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "INSERT INTO availability (user_id, day, start_time, end_time) "
                 "VALUES (%s, %s, %s, %s);",
                 (user_id, day, start, end)
             )
             
 ################################################################################
-    def insert_job(self, requester: int) -> str:
+    async def insert_job(self, requester: int, *, new_id: Optional[str] = None) -> str:
         
-        new_id = self.generate_id()
+        new_id = new_id or self.generate_id()
         
-        # with self.database as db:
-        #     db.execute(
+        # async with self.database.acquire() as db:
+        #     await db.execute(
         #         "INSERT INTO jobs (_id, requester) VALUES (%s, %s);",
         #         (new_id, requester)
         #     )
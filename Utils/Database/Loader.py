@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Tuple, List, Optional
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple, List, Optional
 
 from .Branch import DBWorkerBranch
 
@@ -10,125 +11,237 @@ if TYPE_CHECKING:
 
 __all__ = ("DatabaseLoader",)
 
+# Called with (name, rows, ms) as each bulk query's results come in.
+TableCallback = Callable[[str, int, Optional[float]], None]
+
+# Explicit column lists, in the positional order the managers index rows by.
+TABLE_QUERIES: Dict[str, str] = {
+    "positions": "SELECT _id, name, trainer_role, trainee_role FROM positions;",
+    "requirements": "SELECT _id, position, description FROM requirements;",
+    "tusers": "SELECT user_id, name, notes FROM tusers;",
+    "configs": "SELECT user_id, image_url, job_pings FROM tuser_config;",
+    "availabilities": "SELECT user_id, day, start_time, end_time FROM availability;",
+    "trainers": "SELECT user_id FROM trainers;",
+    "trainees": "SELECT user_id FROM trainees;",
+    "qualifications": "SELECT _id, user_id, position, level FROM qualifications;",
+    "trainings": "SELECT _id, user_id, position, trainer FROM trainings;",
+    "requirement_overrides": (
+        "SELECT user_id, training_id, requirement_id, level FROM requirement_overrides;"
+    ),
+    "messages": (
+        "SELECT _id, channel_id, message_id FROM messages "
+        "WHERE _id = 'trainer_signup_message';"
+    ),
+    "jobs": (
+        "SELECT _id, position, venue, description, date, start_time, end_time, "
+        "pay_rate, pay_type, requester, applicant FROM jobs;"
+    ),
+}
+
+# Cheap stand-in for "has anything changed": the schema version plus the
+# number of committed writes to loaded tables (see migration v4).
+CHANGE_TOKEN_QUERY: str = (
+    "SELECT (SELECT MAX(version) FROM schema_version), "
+    "(SELECT SUM(n) FROM data_changes);"
+)
+
+# Folds the change log into row 0 without changing its sum. One statement, so
+# the rows summed are exactly the rows deleted even with writers committing
+# alongside it. SQLite has no DML in CTEs, but it has no concurrent writers
+# either, so two statements in one transaction do there.
+FOLD_CHANGES_QUERY: str = (
+    "WITH folded AS (DELETE FROM data_changes WHERE id > 0 RETURNING n) "
+    "UPDATE data_changes SET n = n + (SELECT COALESCE(SUM(n), 0) FROM folded) "
+    "WHERE id = 0;"
+)
+FOLD_CHANGES_SQLITE: Tuple[str, ...] = (
+    "UPDATE data_changes SET n = (SELECT SUM(n) FROM data_changes) WHERE id = 0;",
+    "DELETE FROM data_changes WHERE id > 0;",
+)
+
 ################################################################################
-class DatabaseLoader(DBWorkerBranch):
+class DatabaseLoader(DBWorkerBranch, tag="load"):
     """A utility class for loading data from the database."""
 
-    def load_all(self) -> Dict[str, Any]:
-        """Performs all sub-loaders and returns a dictionary of their results."""
+    async def load_all(self, bulk: bool = True, on_table: Optional[TableCallback] = None) -> Dict[str, Any]:
+        """Performs all sub-loaders and returns a dictionary of their results.
+
+        In bulk mode every table is read in a single pipelined batch inside
+        one read-only snapshot transaction. The result additionally carries
+        a ``"stats"`` entry with per-table row counts and timings and the
+        batch's total time, and a ``"change_token"`` read from that same
+        snapshot. A table's ``"ms"`` is None where the backend can't time
+        queries individually (Postgres syncs the whole pipeline at once);
+        ``"per_table_timing"`` says which case applies. ``on_table`` is
+        called as each query's results arrive, change token included."""
+
+        if bulk:
+            return await self.load_all_bulk(on_table)
+
+        return {
+            "positions": await self.load_positions(),
+            "requirements": await self.load_requirements(),
+            "tusers": await self.load_tusers(),
+            "configs": await self.load_tuser_configs(),
+            "availabilities": await self.load_availabilities(),
+            "trainers": await self.load_trainers(),
+            "trainees": await self.load_trainees(),
+            "qualifications": await self.load_qualifications(),
+            "trainings": await self.load_trainings(),
+            "requirement_overrides": await self.load_requirement_overrides(),
+            "messages": await self.load_messages(),
+            "jobs": await self.load_jobs(),
+        }
 
+################################################################################
+    async def load_all_bulk(self, on_table: Optional[TableCallback] = None) -> Dict[str, Any]:
+
+        start = perf_counter()
+        results: Dict[str, List[Tuple[Any, ...]]] = {}
+        tables: Dict[str, Dict[str, Any]] = {}
+
+        if not self.database.backend.is_open:
+            await self.database.connect()
+
+        # The token goes first so it's the statement that fixes the snapshot;
+        # it then describes exactly the rows loaded after it.
+        queries = [("change_token", CHANGE_TOKEN_QUERY), *TABLE_QUERIES.items()]
+
+        async for name, rows, ms in self.database.backend.read_snapshot(queries):
+            results[name] = rows
+            if on_table is not None:
+                on_table(name, len(rows), ms)
+            if name != "change_token":
+                tables[name] = {
+                    "rows": len(rows),
+                    "ms": round(ms, 2) if ms is not None else None,
+                }
+
+        total_ms = round((perf_counter() - start) * 1000, 2)
+        print(
+            f"Bulk loaded {sum(t['rows'] for t in tables.values())} rows "
+            f"from {len(tables)} tables in {total_ms}ms."
+        )
+
+        messages = results.pop("messages")
+        change_token = tuple(results.pop("change_token")[0])
         return {
-            "positions": self.load_positions(),
-            "requirements": self.load_requirements(),
-            "tusers": self.load_tusers(),
-            "configs": self.load_tuser_configs(),
-            "availabilities": self.load_availabilities(),
-            "trainers": self.load_trainers(),
-            "trainees": self.load_trainees(),
-            "qualifications": self.load_qualifications(),
-            "trainings": self.load_trainings(),
-            "requirement_overrides": self.load_requirement_overrides(),
-            "messages": self.load_messages(),
-            "jobs": self.load_jobs(),
+            **results,
+            "messages": self._format_messages(messages),
+            "change_token": change_token,
+            "stats": {
+                "tables": tables,
+                "per_table_timing": all(t["ms"] is not None for t in tables.values()),
+                "total_ms": total_ms,
+            },
         }
 
 ################################################################################
-    def load_positions(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def change_token(self) -> Tuple[Any, ...]:
+        """Returns the current change token without touching any data table."""
+
+        async with self.database.acquire() as db:
+            await db.execute(CHANGE_TOKEN_QUERY)
+            return tuple(await db.fetchone())
+
+################################################################################
+    async def fold_change_log(self) -> None:
+        """Collapses the change log to a single row so reading the change
+        token stays cheap. The token itself is unaffected."""
+
+        if self.database.backend.dialect == "sqlite":
+            async with self.database.transaction() as db:
+                for statement in FOLD_CHANGES_SQLITE:
+                    await db.execute(statement)
+            return
+
+        async with self.database.acquire() as db:
+            await db.execute(FOLD_CHANGES_QUERY)
+
+################################################################################
+    async def _fetch_table(self, name: str) -> List[Tuple[Any, ...]]:
+
+        async with self.database.acquire() as db:
+            await db.execute(TABLE_QUERIES[name])
+            return await db.fetchall()
+
+################################################################################
+    async def load_positions(self) -> List[Tuple[Any, ...]]:
         """Loads all positions from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM positions;")
-            return db.fetchall()
+        return await self._fetch_table("positions")
 
 ################################################################################
-    def load_requirements(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_requirements(self) -> List[Tuple[Any, ...]]:
         """Loads all requirements from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM requirements;")
-            return db.fetchall()
-        
+        return await self._fetch_table("requirements")
+
 ################################################################################
-    def load_tusers(self) -> Tuple[Tuple[Any, ...], ...]:
-    
-        with self.database as db:
-            db.execute("SELECT * FROM tusers;")
-            return db.fetchall()
+    async def load_tusers(self) -> List[Tuple[Any, ...]]:
+
+        return await self._fetch_table("tusers")
 
 ################################################################################
-    def load_tuser_configs(self) -> Tuple[Tuple[Any, ...]]:
+    async def load_tuser_configs(self) -> List[Tuple[Any, ...]]:
         """Loads all trainee configs from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM tuser_config;")
-            return db.fetchall()
+        return await self._fetch_table("configs")
 
 ################################################################################
-    def load_availabilities(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_availabilities(self) -> List[Tuple[Any, ...]]:
         """Loads all availabilities from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM availability;")
-            return db.fetchall()
-        
+        return await self._fetch_table("availabilities")
+
 ################################################################################
-    def load_trainers(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_trainers(self) -> List[Tuple[Any, ...]]:
         """Loads all trainers from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM trainers;")
-            return db.fetchall()            
-        
+        return await self._fetch_table("trainers")
+
 ################################################################################
-    def load_trainees(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_trainees(self) -> List[Tuple[Any, ...]]:
         """Loads all trainees from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM trainees;")
-            return db.fetchall()
-        
+        return await self._fetch_table("trainees")
+
 ################################################################################
-    def load_qualifications(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_qualifications(self) -> List[Tuple[Any, ...]]:
         """Loads all qualifications from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM qualifications;")
-            return db.fetchall()
-            
+        return await self._fetch_table("qualifications")
+
 ################################################################################
-    def load_trainings(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_trainings(self) -> List[Tuple[Any, ...]]:
         """Loads all trainings from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM trainings;")
-            return db.fetchall()
-        
+        return await self._fetch_table("trainings")
+
 ################################################################################
-    def load_requirement_overrides(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_requirement_overrides(self) -> List[Tuple[Any, ...]]:
         """Loads all requirement overrides from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM requirement_overrides;")
-            return db.fetchall()
-        
+        return await self._fetch_table("requirement_overrides")
+
 ################################################################################
-    def load_messages(self) -> Dict[str, Tuple[Any, ...]]:
+    async def load_messages(self) -> Dict[str, Tuple[Any, ...]]:
         """Loads all messages from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM messages;")
-            data = db.fetchall()
-            
+        return self._format_messages(await self._fetch_table("messages"))
+
+################################################################################
+    @staticmethod
+    def _format_messages(data: List[Tuple[Any, ...]]) -> Dict[str, Tuple[Any, ...]]:
+
         return {
-            "trainer_message": data[0][1:3],
+            "trainer_message": data[0][1:3] if data else (None, None),
         }
-        
+
 ################################################################################
-    def load_jobs(self) -> Tuple[Tuple[Any, ...], ...]:
+    async def load_jobs(self) -> List[Tuple[Any, ...]]:
         """Loads all jobs from the database."""
 
-        with self.database as db:
-            db.execute("SELECT * FROM jobs;")
-            return db.fetchall()
-        
+        return await self._fetch_table("jobs")
+
 ################################################################################
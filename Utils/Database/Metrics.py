@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import deque
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Tuple
+################################################################################
+
+__all__ = (
+    "QueryMetrics",
+    "QueryStats",
+    "SlowQuery",
+    "current_tag",
+)
+
+# Set by the branch method currently running, e.g. ``"update.job"``.
+current_tag: ContextVar[str] = ContextVar("current_tag", default="untagged")
+
+# Upper bounds, in milliseconds, of the latency histogram buckets. Anything
+# slower than the last bound lands in a final overflow bucket.
+BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+################################################################################
+class SlowQuery(NamedTuple):
+
+    tag: str
+    ms: float
+    rows: int
+    query: str
+    at: float
+
+################################################################################
+class QueryStats:
+    """Counters for a single tag within one window."""
+
+    __slots__ = (
+        "count",
+        "total_ms",
+        "max_ms",
+        "rows",
+        "buckets",
+    )
+
+################################################################################
+    def __init__(self):
+
+        self.count: int = 0
+        self.total_ms: float = 0.0
+        self.max_ms: float = 0.0
+        self.rows: int = 0
+        self.buckets: List[int] = [0] * (len(BUCKETS_MS) + 1)
+
+################################################################################
+    def record(self, ms: float, rows: int) -> None:
+
+        self.count += 1
+        self.total_ms += ms
+        self.rows += rows
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+        self.buckets[bisect_left(BUCKETS_MS, ms)] += 1
+
+################################################################################
+    def merge(self, other: QueryStats) -> QueryStats:
+
+        merged = QueryStats()
+        merged.count = self.count + other.count
+        merged.total_ms = self.total_ms + other.total_ms
+        merged.max_ms = max(self.max_ms, other.max_ms)
+        merged.rows = self.rows + other.rows
+        merged.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+
+        return merged
+
+################################################################################
+    @property
+    def mean_ms(self) -> float:
+
+        return self.total_ms / self.count if self.count else 0.0
+
+################################################################################
+    def percentile(self, pct: float) -> float:
+        """Estimates a percentile as the upper bound of the bucket it falls in."""
+
+        if not self.count:
+            return 0.0
+
+        target = self.count * pct / 100
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return BUCKETS_MS[i] if i < len(BUCKETS_MS) else self.max_ms
+
+        return self.max_ms
+
+################################################################################
+class QueryMetrics:
+    """Rolling per-tag latency histograms, row counts and a slow-query log.
+
+    Recording is a couple of dict lookups and integer bumps, cheap enough to
+    leave on permanently. Stats cover the current window plus the one before
+    it, so a report always spans between one and two windows of traffic."""
+
+    __slots__ = (
+        "_window",
+        "_slow_ms",
+        "_current",
+        "_previous",
+        "_rotated_at",
+        "_slow_log",
+        "_listeners",
+    )
+
+################################################################################
+    def __init__(self, window: float, slow_ms: float, slow_log_size: int = 100):
+
+        self._window: float = window
+        self._slow_ms: float = slow_ms
+
+        self._current: Dict[str, QueryStats] = {}
+        self._previous: Dict[str, QueryStats] = {}
+        self._rotated_at: float = monotonic()
+
+        self._slow_log: Deque[SlowQuery] = deque(maxlen=slow_log_size)
+        self._listeners: List[Callable[[str, float, int], None]] = []
+
+################################################################################
+    @property
+    def slow_ms(self) -> float:
+
+        return self._slow_ms
+
+################################################################################
+    @property
+    def slow_log(self) -> List[SlowQuery]:
+
+        return list(self._slow_log)
+
+################################################################################
+    def add_listener(self, listener: Callable[[str, float, int], None]) -> None:
+        """Calls ``listener(tag, ms, rows)`` for every statement recorded."""
+
+        self._listeners.append(listener)
+
+################################################################################
+    def record(self, ms: float, rows: int, query: Any) -> None:
+
+        now = monotonic()
+        self._rotate(now)
+
+        tag = current_tag.get()
+        try:
+            stats = self._current[tag]
+        except KeyError:
+            stats = self._current[tag] = QueryStats()
+
+        stats.record(ms, rows)
+
+        for listener in self._listeners:
+            listener(tag, ms, rows)
+
+        if ms >= self._slow_ms:
+            text = " ".join(str(query).split())[:200]
+            self._slow_log.append(SlowQuery(tag, round(ms, 2), rows, text, now))
+            print(f"[slow query] {tag} took {ms:.1f}ms ({rows} rows): {text}")
+
+################################################################################
+    def _rotate(self, now: float) -> None:
+
+        elapsed = now - self._rotated_at
+        if elapsed < self._window:
+            return
+
+        # After a quiet spell longer than two windows, both are stale.
+        self._previous = self._current if elapsed < self._window * 2 else {}
+        self._current = {}
+        self._rotated_at = now
+
+################################################################################
+    def snapshot(self) -> Dict[str, QueryStats]:
+        """Returns the combined stats for the current and previous windows."""
+
+        self._rotate(monotonic())
+
+        combined: Dict[str, QueryStats] = {}
+        for window in (self._previous, self._current):
+            for tag, stats in window.items():
+                combined[tag] = combined[tag].merge(stats) if tag in combined else stats.merge(QueryStats())
+
+        return combined
+
+################################################################################
+    def top(self, limit: int = 10, key: str = "total_ms") -> List[Tuple[str, QueryStats]]:
+
+        return sorted(
+            self.snapshot().items(),
+            key=lambda item: getattr(item[1], key),
+            reverse=True
+        )[:limit]
+
+################################################################################
+    def reset(self) -> None:
+
+        self._current.clear()
+        self._previous.clear()
+        self._slow_log.clear()
+        self._rotated_at = monotonic()
+
+################################################################################
+    def report(self, limit: int = 10) -> List[str]:
+        """Human-readable lines for the ``limit`` tags with the most total
+        time spent, slowest first."""
+
+        lines = []
+        for tag, stats in self.top(limit):
+            lines.append(
+                f"`{tag}`: {stats.count}x, {stats.total_ms:.0f}ms total, "
+                f"avg {stats.mean_ms:.1f}ms, p95 <= {stats.percentile(95):.0f}ms, "
+                f"max {stats.max_ms:.1f}ms, {stats.rows} rows"
+            )
+
+        return lines
+
+################################################################################
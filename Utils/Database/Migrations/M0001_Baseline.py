@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from .Migration import Migration
+################################################################################
+
+__all__ = ("MIGRATION",)
+
+################################################################################
+# The schema as it stood before migrations were introduced. Every statement is
+# idempotent so databases that predate schema_version can adopt it safely.
+MIGRATION = Migration(
+    version=1,
+    description="Baseline tables",
+    statements=(
+        "CREATE TABLE IF NOT EXISTS positions ("
+        "_id TEXT PRIMARY KEY,"
+        "name TEXT,"
+        "trainer_role BIGINT,"
+        "trainee_role BIGINT"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS requirements ("
+        "_id TEXT PRIMARY KEY,"
+        "position TEXT,"
+        "description TEXT"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS tusers ("
+        "user_id BIGINT PRIMARY KEY ,"
+        "name TEXT,"
+        "notes TEXT"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS tuser_config ("
+        "user_id BIGINT PRIMARY KEY,"
+        "image_url TEXT,"
+        "job_pings BOOLEAN DEFAULT TRUE"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS availability ("
+        "user_id BIGINT,"
+        "day INTEGER,"
+        "start_time TIME,"
+        "end_time TIME"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS trainers ("
+        "user_id BIGINT PRIMARY KEY"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS trainees ("
+        "user_id BIGINT PRIMARY KEY"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS qualifications ("
+        "_id TEXT PRIMARY KEY,"
+        "user_id BIGINT,"
+        "position TEXT,"
+        "level INTEGER"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS trainings ("
+        "_id TEXT PRIMARY KEY,"
+        "user_id BIGINT,"
+        "position TEXT,"
+        "trainer BIGINT"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS requirement_overrides ("
+        "user_id BIGINT,"
+        "training_id TEXT,"
+        "requirement_id TEXT,"
+        "level INTEGER"
+        ");",
+
+        "CREATE TABLE IF NOT EXISTS messages ("
+        "_id TEXT PRIMARY KEY,"
+        "channel_id BIGINT,"
+        "message_id BIGINT"
+        ");",
+
+        "INSERT INTO messages (_id) VALUES ('trainer_signup_message') "
+        "ON CONFLICT DO NOTHING;",
+
+        "CREATE TABLE IF NOT EXISTS jobs ("
+        "_id TEXT PRIMARY KEY,"
+        "position TEXT,"
+        "venue TEXT,"
+        "description TEXT,"
+        "date DATE,"
+        "start_time TIME,"
+        "end_time TIME,"
+        "pay_rate INTEGER,"
+        "pay_type INTEGER,"
+        "requester BIGINT,"
+        "applicant BIGINT"
+        ");",
+    )
+)
+
+################################################################################
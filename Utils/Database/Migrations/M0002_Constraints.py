@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from .Migration import Migration
+################################################################################
+
+__all__ = ("MIGRATION",)
+
+################################################################################
+# Natural keys the application already assumes but the tables never enforced.
+# Duplicates are collapsed first, keeping the most recently written row.
+MIGRATION = Migration(
+    version=2,
+    description="Unique keys for requirement_overrides and availability",
+    statements=(
+        "DELETE FROM requirement_overrides a "
+        "USING requirement_overrides b "
+        "WHERE a.training_id = b.training_id "
+        "AND a.requirement_id = b.requirement_id "
+        "AND a.ctid < b.ctid;",
+
+        "CREATE UNIQUE INDEX IF NOT EXISTS requirement_overrides_training_requirement_key "
+        "ON requirement_overrides (training_id, requirement_id);",
+
+        "DELETE FROM availability a "
+        "USING availability b "
+        "WHERE a.user_id = b.user_id "
+        "AND a.day = b.day "
+        "AND a.ctid < b.ctid;",
+
+        "CREATE UNIQUE INDEX IF NOT EXISTS availability_user_day_key "
+        "ON availability (user_id, day);",
+    ),
+    # No ctid or DELETE ... USING in SQLite; rowid plays the same role.
+    sqlite=(
+        "DELETE FROM requirement_overrides WHERE rowid NOT IN ("
+        "SELECT MAX(rowid) FROM requirement_overrides "
+        "GROUP BY training_id, requirement_id"
+        ");",
+
+        "CREATE UNIQUE INDEX IF NOT EXISTS requirement_overrides_training_requirement_key "
+        "ON requirement_overrides (training_id, requirement_id);",
+
+        "DELETE FROM availability WHERE rowid NOT IN ("
+        "SELECT MAX(rowid) FROM availability GROUP BY user_id, day"
+        ");",
+
+        "CREATE UNIQUE INDEX IF NOT EXISTS availability_user_day_key "
+        "ON availability (user_id, day);",
+    )
+)
+
+################################################################################
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from .Migration import Migration
+################################################################################
+
+__all__ = ("MIGRATION",)
+
+################################################################################
+# Secondary indexes on the columns rows are looked up by.
+# requirement_overrides.training_id and availability.user_id are already
+# served by the leading column of the unique keys added in version 2.
+MIGRATION = Migration(
+    version=3,
+    description="Secondary lookup indexes",
+    statements=(
+        "CREATE INDEX IF NOT EXISTS qualifications_user_id_idx "
+        "ON qualifications (user_id);",
+
+        "CREATE INDEX IF NOT EXISTS trainings_user_id_idx "
+        "ON trainings (user_id);",
+
+        "CREATE INDEX IF NOT EXISTS trainings_position_idx "
+        "ON trainings (position);",
+
+        "CREATE INDEX IF NOT EXISTS jobs_date_idx "
+        "ON jobs (date);",
+    )
+)
+
+################################################################################
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from .Migration import Migration
+################################################################################
+
+__all__ = ("MIGRATION",)
+
+TRACKED_TABLES = (
+    "positions",
+    "requirements",
+    "tusers",
+    "tuser_config",
+    "availability",
+    "trainers",
+    "trainees",
+    "qualifications",
+    "trainings",
+    "requirement_overrides",
+    "messages",
+    "jobs",
+)
+
+################################################################################
+# Every write statement on a table the loader reads appends a row to
+# data_changes. Appends never wait on one another, and the row's ID comes
+# from the table's sequence, which isn't held for the transaction either, so
+# writers aren't serialised behind a shared counter. The change token is
+# SUM(n): read in the same snapshot as the data, it only counts changes that
+# had committed by then. (A bare sequence value can't do that; IDs are handed
+# out in call order, not commit order.) Folding old rows into row 0 keeps the
+# sum, and therefore the token, unchanged.
+MIGRATION = Migration(
+    version=4,
+    description="Change log for the local snapshot change token",
+    statements=(
+        "CREATE TABLE IF NOT EXISTS data_changes ("
+        "id BIGSERIAL PRIMARY KEY,"
+        "n BIGINT NOT NULL DEFAULT 1"
+        ");",
+
+        "INSERT INTO data_changes (id, n) VALUES (0, 0) "
+        "ON CONFLICT DO NOTHING;",
+
+        "CREATE OR REPLACE FUNCTION log_data_change() RETURNS TRIGGER AS $$ "
+        "BEGIN "
+        "INSERT INTO data_changes DEFAULT VALUES; "
+        "RETURN NULL; "
+        "END; "
+        "$$ LANGUAGE plpgsql;",
+
+        *(
+            f"CREATE TRIGGER {table}_data_change "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION log_data_change();"
+            for table in TRACKED_TABLES
+        ),
+    ),
+    # SQLite only has row-level triggers, one event each. Writers are
+    # serialised there anyway; this just keeps both schemas alike.
+    sqlite=(
+        "CREATE TABLE IF NOT EXISTS data_changes ("
+        "id INTEGER PRIMARY KEY,"
+        "n INTEGER NOT NULL DEFAULT 1"
+        ");",
+
+        "INSERT INTO data_changes (id, n) VALUES (0, 0) "
+        "ON CONFLICT DO NOTHING;",
+
+        *(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_data_change_{event.lower()} "
+            f"AFTER {event} ON {table} "
+            "BEGIN INSERT INTO data_changes (n) VALUES (1); END;"
+            for table in TRACKED_TABLES
+            for event in ("INSERT", "UPDATE", "DELETE")
+        ),
+    )
+)
+
+################################################################################
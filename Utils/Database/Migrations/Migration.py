@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Optional, Tuple
+################################################################################
+
+__all__ = ("Migration",)
+
+################################################################################
+class Migration(NamedTuple):
+    """A single step in the schema's history.
+
+    Statements run in order inside the same transaction as every other
+    pending migration, and the step is recorded in ``schema_version`` once
+    they have all succeeded. Steps that lean on Postgres-only features carry
+    an equivalent ``sqlite`` spelling for the SQLite backend."""
+
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+    sqlite: Optional[Tuple[str, ...]] = None
+
+################################################################################
+    def for_dialect(self, dialect: str) -> Tuple[str, ...]:
+
+        if dialect == "sqlite" and self.sqlite is not None:
+            return self.sqlite
+
+        return self.statements
+
+################################################################################
@@ -0,0 +1,17 @@
+from typing import Tuple
+
+from .Migration import Migration
+from .M0001_Baseline import MIGRATION as M0001
+from .M0002_Constraints import MIGRATION as M0002
+from .M0003_LookupIndexes import MIGRATION as M0003
+from .M0004_ChangeLog import MIGRATION as M0004
+################################################################################
+
+# Applied in order. Append new migrations here; never edit one that has shipped.
+MIGRATIONS: Tuple[Migration, ...] = (
+    M0001,
+    M0002,
+    M0003,
+    M0004,
+)
+################################################################################
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+import pickle
+import zlib
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .Database import Database
+################################################################################
+
+__all__ = ("SnapshotCache",)
+
+# Bump FORMAT_VERSION whenever the shape of the loaded data changes, so stale
+# files from an older build are ignored instead of half-understood.
+MAGIC = b"PBBS"
+FORMAT_VERSION = 1
+
+################################################################################
+class SnapshotCache:
+    """Keeps a compressed copy of the rows the loader returned on local disk.
+
+    On boot the file is only trusted if the change token stored alongside it
+    matches the database's current one; any write to a loaded table since
+    the file was written bumps that token and forces a normal load.
+
+    The snapshot is rewritten on shutdown and every ``interval`` seconds,
+    but only when the token has moved. Each rewrite is a full read of every
+    loaded table, so on a busy bot it costs one full load per interval;
+    ``DB_SNAPSHOT_INTERVAL`` defaults to an hour and 0 turns it off.
+
+    The change log the token is summed from gains a row per write statement.
+    It's folded into one row every ``fold_interval`` seconds regardless of
+    snapshots, and again before the token is read on boot, so that read only
+    ever sums what a crashed run left behind since its last fold."""
+
+    __slots__ = (
+        "_database",
+        "_path",
+        "_interval",
+        "_fold_interval",
+        "_token",
+        "_task",
+        "_fold_task",
+    )
+
+################################################################################
+    def __init__(self, database: Database, path: str, interval: float, fold_interval: float):
+
+        self._database: Database = database
+        self._path: str = path
+        self._interval: float = interval
+        self._fold_interval: float = fold_interval
+
+        self._token: Optional[Tuple[Any, ...]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._fold_task: Optional[asyncio.Task] = None
+
+################################################################################
+    @property
+    def path(self) -> str:
+
+        return self._path
+
+################################################################################
+    @property
+    def token(self) -> Optional[Tuple[Any, ...]]:
+
+        return self._token
+
+################################################################################
+    async def restore(self, token: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """Returns the cached data if it was written at ``token``, else None."""
+
+        start = perf_counter()
+        payload = await asyncio.to_thread(self._read)
+        if payload is None:
+            return None
+
+        if payload["token"] != token:
+            print(f"Local snapshot is stale ({payload['token']} != {token}), doing a full load.")
+            return None
+
+        self._token = token
+        data = payload["data"]
+        data["change_token"] = token
+        data["stats"] = {
+            "source": "snapshot",
+            "total_ms": round((perf_counter() - start) * 1000, 2),
+        }
+
+        print(f"Warm start from local snapshot in {data['stats']['total_ms']}ms.")
+        return data
+
+################################################################################
+    async def save(self, data: Dict[str, Any]) -> None:
+
+        token = data.get("change_token")
+        if token is None:
+            return
+
+        payload = {
+            "token": token,
+            "data": {k: v for k, v in data.items() if k not in ("change_token", "stats", "source")},
+        }
+        try:
+            await asyncio.to_thread(self._write, payload)
+        except OSError as ex:
+            print(f"Couldn't write local snapshot to {self._path}: {ex!r}")
+            return
+
+        self._token = token
+
+################################################################################
+    async def refresh(self) -> None:
+        """Rewrites the snapshot if the database has changed since the last
+        one. Pending write-behind writes are flushed first so they're
+        included."""
+
+        await self._database.flush()
+
+        if await self._database.aio.change_token() == self._token:
+            return
+
+        await self.save(await self._database.aio.load_all())
+
+################################################################################
+    async def fold(self) -> None:
+        """Collapses the change log to a single row. The token doesn't move."""
+
+        try:
+            await self._database.aio.fold_change_log()
+        except Exception as ex:
+            print(f"Couldn't fold the change log: {ex!r}")
+
+################################################################################
+    def start(self) -> None:
+
+        # Both run for the life of the process, so they shouldn't carry
+        # whatever context (startup stage, transaction) they were started in.
+        if self._interval > 0 and self._task is None:
+            self._task = contextvars.Context().run(asyncio.create_task, self._run())
+        if self._fold_interval > 0 and self._fold_task is None:
+            self._fold_task = contextvars.Context().run(asyncio.create_task, self._run_folds())
+
+################################################################################
+    async def stop(self) -> None:
+
+        for task in (self._task, self._fold_task):
+            if task is None:
+                continue
+
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        self._task = None
+        self._fold_task = None
+
+################################################################################
+    async def _run(self) -> None:
+
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.refresh()
+            except Exception as ex:
+                print(f"Periodic snapshot failed: {ex!r}")
+
+################################################################################
+    async def _run_folds(self) -> None:
+
+        while True:
+            await asyncio.sleep(self._fold_interval)
+            await self.fold()
+
+################################################################################
+    def _read(self) -> Optional[Dict[str, Any]]:
+
+        try:
+            with open(self._path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+
+        if len(raw) <= len(MAGIC) or raw[:len(MAGIC)] != MAGIC or raw[len(MAGIC)] != FORMAT_VERSION:
+            return None
+
+        try:
+            return pickle.loads(zlib.decompress(raw[len(MAGIC) + 1:]))
+        except Exception as ex:
+            print(f"Ignoring unreadable local snapshot: {ex!r}")
+            return None
+
+################################################################################
+    def _write(self, payload: Dict[str, Any]) -> None:
+
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        body = zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+        # Write beside the target and swap it in, so a crash mid-write never
+        # leaves a truncated snapshot behind.
+        tmp = f"{self._path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(MAGIC + bytes((FORMAT_VERSION,)) + body)
+        os.replace(tmp, self._path)
+
+################################################################################
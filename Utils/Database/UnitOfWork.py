@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from itertools import count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Hashable, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    from psycopg import AsyncCursor
+
+    from .Metrics import QueryMetrics
+################################################################################
+
+__all__ = ("UnitOfWork",)
+
+DeferredWrite = Tuple[Callable[..., Coroutine[Any, Any, Any]], Tuple[Any, ...], Dict[str, Any]]
+
+################################################################################
+class UnitOfWork:
+    """One database transaction, as seen by the branches.
+
+    Stands in for the transaction's cursor: branch methods ``execute`` on it
+    exactly as they would on a raw cursor, while it counts the statements
+    issued and times each one into the database's query metrics.
+    Synchronous facade writes made while the unit is active are deferred
+    onto it instead of the write-behind queue, and are applied just before
+    the unit commits."""
+
+    __slots__ = (
+        "_cursor",
+        "_metrics",
+        "_label",
+        "_statements",
+        "_started",
+        "_deferred",
+        "_sequence",
+        "_finished",
+    )
+
+################################################################################
+    def __init__(self, cursor: AsyncCursor, label: Optional[str] = None, metrics: Optional[QueryMetrics] = None):
+
+        self._cursor: AsyncCursor = cursor
+        self._metrics: Optional[QueryMetrics] = metrics
+        self._label: Optional[str] = label
+
+        self._statements: int = 0
+        self._started: float = perf_counter()
+
+        self._deferred: Dict[Hashable, DeferredWrite] = {}
+        self._sequence: Iterator[int] = count()
+        self._finished: bool = False
+
+################################################################################
+    def __getattr__(self, name: str) -> Any:
+
+        # fetchone(), fetchall(), rowcount and friends come straight from the cursor.
+        return getattr(self._cursor, name)
+
+################################################################################
+    @property
+    def cursor(self) -> AsyncCursor:
+
+        return self._cursor
+
+################################################################################
+    @property
+    def label(self) -> Optional[str]:
+
+        return self._label
+
+################################################################################
+    @property
+    def statements(self) -> int:
+
+        return self._statements
+
+################################################################################
+    @property
+    def finished(self) -> bool:
+        """Whether the transaction has committed or rolled back."""
+
+        return self._finished
+
+################################################################################
+    def finish(self) -> None:
+
+        self._finished = True
+
+################################################################################
+    @property
+    def elapsed_ms(self) -> float:
+
+        return round((perf_counter() - self._started) * 1000, 2)
+
+################################################################################
+    async def execute(self, query: Any, params: Optional[Any] = None, **kwargs: Any) -> UnitOfWork:
+
+        self._statements += 1
+
+        start = perf_counter()
+        await self._cursor.execute(query, params, **kwargs)
+        self._record(start, query)
+
+        return self
+
+################################################################################
+    async def executemany(self, query: Any, params_seq: Any, **kwargs: Any) -> None:
+
+        self._statements += 1
+
+        start = perf_counter()
+        await self._cursor.executemany(query, params_seq, **kwargs)
+        self._record(start, query)
+
+################################################################################
+    def _record(self, start: float, query: Any) -> None:
+
+        if self._metrics is not None:
+            self._metrics.record((perf_counter() - start) * 1000, max(self._cursor.rowcount, 0), query)
+
+################################################################################
+    def defer(
+        self,
+        key: Optional[Hashable],
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any
+    ) -> None:
+        """Holds a facade write until the unit commits, coalescing keyed
+        writes the same way the write-behind queue does."""
+
+        if self._finished:
+            raise RuntimeError(
+                f"Can't defer `{func.__name__}` onto a unit of work that has already finished."
+            )
+
+        if key is None:
+            key = next(self._sequence)
+        else:
+            self._deferred.pop(key, None)
+
+        self._deferred[key] = (func, args, kwargs)
+
+################################################################################
+    async def apply_deferred(self) -> None:
+
+        while self._deferred:
+            batch = list(self._deferred.values())
+            self._deferred.clear()
+
+            for func, args, kwargs in batch:
+                await func(*args, **kwargs)
+
+################################################################################
+    def report(self) -> None:
+
+        if self._label is None:
+            return
+
+        print(f"[{self._label}] committed {self._statements} statement(s) in {self.elapsed_ms}ms.")
+
+################################################################################
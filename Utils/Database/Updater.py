@@ -12,28 +12,25 @@ if TYPE_CHECKING:
 __all__ = ("DatabaseUpdater",)
 
 ################################################################################
-class DatabaseUpdater(DBWorkerBranch):
+class DatabaseUpdater(DBWorkerBranch, tag="update"):
     """A utility class for updating records in the database."""
 
-    def update_position(self, position: Position) -> None:
+    async def update_position(self, position: Position) -> None:
         
-        trainer_role_id = position.trainer_role.id if position.trainer_role else None
-        trainee_role_id = position.trainee_role.id if position.trainee_role else None
-
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE positions SET name = %s, trainer_role = %s, trainee_role = %s "
                 "WHERE _id = %s;",
                 (
-                    position.name, trainer_role_id, trainee_role_id, position.id
+                    position.name, position.trainer_role_id, position.trainee_role_id, position.id
                 )
             )
     
 ################################################################################
-    def update_trainer(self, trainer: Trainer) -> None:
+    async def update_trainer(self, trainer: Trainer) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE trainers SET qualifications = %s WHERE user_id = %s;",
                 (
                     [q.id for q in trainer.qualifications], trainer.user.id
@@ -41,10 +38,10 @@ class DatabaseUpdater(DBWorkerBranch):
             )
     
 ################################################################################
-    def update_trainee(self, trainee: Trainee) -> None:
+    async def update_trainee(self, trainee: Trainee) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE trainees SET name = %s, trainings = %s, notes = %s "
                 "WHERE _id = %s;",
                 (
@@ -54,19 +51,20 @@ class DatabaseUpdater(DBWorkerBranch):
             )
             
 ################################################################################
-    def update_qualification(self, q: Qualification) -> None:
+    async def update_qualification(self, q: Qualification) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE qualifications SET level = %s WHERE _id = %s;",
                 (q.level.value, q.id)
             )
     
 ################################################################################
-    def update_training(self, training: Training) -> None:
-                
-        with self.database as db:
-            db.execute(
+    async def update_training(self, training: Training) -> None:
+        
+        # The overrides ride along in the same transaction as the row itself.
+        async with self.database.transaction() as db:
+            await db.execute(
                 "UPDATE trainings SET position = %s, trainer = %s WHERE _id = %s;",
                 (
                     training.position.id, training.trainer.user.id if training.trainer else None,
@@ -74,61 +72,64 @@ class DatabaseUpdater(DBWorkerBranch):
                 )
             )
             
-        self.update_requirement_overrides(training)
+            await self.update_requirement_overrides(training)
     
 ################################################################################        
-    def update_requirement_overrides(self, training: Training) -> None:
+    async def update_requirement_overrides(self, training: Training) -> None:
+        """Upserts all of a training's overrides in a single statement.
         
-        with self.database as db:
-            for requirement_id, level in training.requirement_overrides.items():
-                db.execute(
-                    "SELECT * FROM requirement_overrides WHERE training_id = %s "
-                    "AND requirement_id = %s;",
-                    (training.id, requirement_id)
-                )
-                match = db.fetchone()
-                
-                if match:
-                    db.execute(
-                        "UPDATE requirement_overrides SET level = %s "
-                        "WHERE training_id = %s AND requirement_id = %s;",
-                        (level.value, training.id, requirement_id)
-                    )
-                else:
-                    db.execute(
-                        "INSERT INTO requirement_overrides VALUES (%s, %s, %s, %s);",
-                        (training.user_id, training.id, requirement_id, level.value)
-                    )
+        Rows whose level hasn't changed are matched by the conflict target
+        but filtered out by the ``WHERE`` clause, so only overrides that
+        actually changed are written."""
+        
+        overrides = training.requirement_overrides
+        if not overrides:
+            return
+        
+        params = []
+        for requirement_id, level in overrides.items():
+            params.extend((training.user_id, training.id, requirement_id, level.value))
+        
+        async with self.database.acquire() as db:
+            await db.execute(
+                "INSERT INTO requirement_overrides "
+                "(user_id, training_id, requirement_id, level) "
+                f"VALUES {self.placeholders(4, len(overrides))} "
+                "ON CONFLICT (training_id, requirement_id) DO UPDATE "
+                "SET level = EXCLUDED.level "
+                "WHERE requirement_overrides.level IS DISTINCT FROM EXCLUDED.level;",
+                params
+            )
 
 ################################################################################
-    def update_tuser(self, tuser: TUser) -> None:
+    async def update_tuser(self, tuser: TUser) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE tusers SET name = %s, notes = %s WHERE user_id = %s;",
                 (tuser.name, tuser.notes, tuser.user_id)
             )
-            db.execute(
+            await db.execute(
                 "UPDATE tuser_config SET image_url = %s, job_pings = %s "
                 "WHERE user_id = %s;",
                 (tuser.config.image, tuser.config.job_pings, tuser.user_id)
             )
     
 ################################################################################      
-    def update_trainer_signup_message(self, message: SignUpMessage) -> None:
+    async def update_trainer_signup_message(self, message: SignUpMessage) -> None:
     
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE messages SET channel_id = %s, message_id = %s "
                 "WHERE _id = 'trainer_signup_message';",
                 (message.channel_id, message.message_id)
             )
     
 ################################################################################
-    def update_job(self, job: Job) -> None:
+    async def update_job(self, job: Job) -> None:
         
-        with self.database as db:
-            db.execute(
+        async with self.database.acquire() as db:
+            await db.execute(
                 "UPDATE jobs SET position = %s, venue = %s, description = %s, "
                 "date = %s, start_time = %s, end_time = %s, pay_rate = %s,"
                 "pay_type = %s, applicant = %s, requester = %s WHERE _id = %s;",
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from .Builder import DatabaseBuilder
+from .Compactor import DatabaseCompactor
 from .Deleter import DatabaseDeleter
 from .Inserter import DatabaseInserter
-from .Loader import DatabaseLoader
+from .Loader import DatabaseLoader, TableCallback
 from .Updater import DatabaseUpdater
 
 if TYPE_CHECKING:
@@ -29,6 +30,7 @@ class DatabaseWorker:
         "_deleter",
         "_builder",
         "_loader",
+        "_compactor",
     )
 
 ################################################################################
@@ -41,15 +43,50 @@ class DatabaseWorker:
         self._updater: DatabaseUpdater = DatabaseUpdater(bot)
         self._deleter: DatabaseDeleter = DatabaseDeleter(bot)
         self._loader: DatabaseLoader = DatabaseLoader(bot)
+        self._compactor: DatabaseCompactor = DatabaseCompactor(bot)
 
 ################################################################################
-    def build_all(self) -> None:
+    @property
+    def insert(self) -> DatabaseInserter:
 
-        self._builder.build_all()
+        return self._inserter
 
 ################################################################################
-    def load_all(self) -> Dict[str, Any]:
+    @property
+    def update(self) -> DatabaseUpdater:
 
-        return self._loader.load_all()
+        return self._updater
+
+################################################################################
+    @property
+    def delete(self) -> DatabaseDeleter:
+
+        return self._deleter
+
+################################################################################
+    @property
+    def compact(self) -> DatabaseCompactor:
+
+        return self._compactor
+
+################################################################################
+    async def build_all(self) -> None:
+
+        await self._builder.build_all()
+
+################################################################################
+    async def load_all(self, on_table: Optional[TableCallback] = None) -> Dict[str, Any]:
+
+        return await self._loader.load_all(on_table=on_table)
+
+################################################################################
+    async def change_token(self) -> Tuple[Any, ...]:
+
+        return await self._loader.change_token()
+
+################################################################################
+    async def fold_change_log(self) -> None:
+
+        await self._loader.fold_change_log()
 
 ################################################################################
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .Database import Database
+################################################################################
+
+__all__ = ("WriteBehindQueue",)
+
+PendingWrite = Tuple[Callable[..., Coroutine[Any, Any, Any]], Tuple[Any, ...], Dict[str, Any]]
+
+################################################################################
+class WriteBehindQueue:
+    """Sits between the entities and the awaitable database branches.
+
+    Writes are held for a short window and then applied together in a single
+    transaction. A write submitted with a key marks that row dirty: if a write
+    with the same key is still pending, it is replaced rather than repeated,
+    so a burst of setter calls on one entity collapses into one statement
+    that runs against the entity's latest state."""
+
+    __slots__ = (
+        "_database",
+        "_pending",
+        "_window",
+        "_max_batch",
+        "_timer",
+        "_lock",
+        "_flusher",
+        "_sequence",
+        "_tasks",
+    )
+
+################################################################################
+    def __init__(self, database: Database, window: float, max_batch: int):
+
+        self._database: Database = database
+
+        self._window: float = window
+        self._max_batch: int = max_batch
+
+        self._pending: Dict[Hashable, PendingWrite] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        # The task currently applying a batch, while it holds the lock.
+        self._flusher: Optional[asyncio.Task] = None
+
+        self._sequence: Iterator[int] = count()
+        self._tasks: Set[asyncio.Task] = set()
+
+################################################################################
+    def __len__(self) -> int:
+
+        return len(self._pending)
+
+################################################################################
+    @property
+    def window(self) -> float:
+
+        return self._window
+
+################################################################################
+    def submit(
+        self,
+        key: Optional[Hashable],
+        func: Callable[..., Coroutine[Any, Any, Any]],
+        *args: Any,
+        **kwargs: Any
+    ) -> None:
+        """Queues a branch call.
+
+        Writes without a key (inserts, deletes) are never coalesced. A keyed
+        write replaces any pending write with the same key and moves to the
+        back of the queue, so it still runs after everything submitted
+        before it."""
+
+        if key is None:
+            key = next(self._sequence)
+        else:
+            self._pending.pop(key, None)
+
+        self._pending[key] = (func, args, kwargs)
+
+        if len(self._pending) >= self._max_batch:
+            self._spawn_flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._spawn_flush)
+
+################################################################################
+    def _spawn_flush(self) -> None:
+
+        task = asyncio.create_task(self.flush())
+
+        # Hold a reference so the task isn't collected mid-flight.
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+################################################################################
+    async def flush(self) -> int:
+        """Applies every pending write in one transaction and returns how many
+        writes were applied. Safe to await from critical paths that need their
+        changes persisted before continuing.
+
+        Re-entrant calls from a write the flush itself is applying (an
+        ordered ``transaction()`` opened while a batch is being replayed)
+        return 0 straight away: everything older than that write is already
+        part of the batch, and waiting on the lock would never finish."""
+
+        if self._flusher is not None and self._flusher is asyncio.current_task():
+            return 0
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        async with self._lock:
+            if not self._pending:
+                return 0
+
+            batch: List[PendingWrite] = list(self._pending.values())
+            self._pending.clear()
+
+            self._flusher = asyncio.current_task()
+            try:
+                await self._apply(batch)
+            finally:
+                self._flusher = None
+
+            return len(batch)
+
+################################################################################
+    async def _apply(self, batch: List[PendingWrite]) -> None:
+
+        try:
+            async with self._database.transaction(ordered=False):
+                for func, args, kwargs in batch:
+                    await func(*args, **kwargs)
+        except Exception as ex:
+            # One bad write shouldn't take the rest of the batch down
+            # with it, so fall back to applying them one at a time.
+            print(f"Write-behind batch of {len(batch)} failed ({ex!r}), replaying individually.")
+            for func, args, kwargs in batch:
+                try:
+                    await func(*args, **kwargs)
+                except Exception as ex:
+                    print(f"Queued database write `{func.__name__}` failed: {ex!r}")
+
+################################################################################
@@ -18,6 +18,7 @@ __all__ = (
     "Minutes",
     "Days",
     "ViewType",
+    "StartupState",
 )
 
 ################################################################################
@@ -108,6 +109,19 @@ class TrainingLevel(FroggeEnum):
                
         return "On Hold" if self.value == 2 else self.name
     
+################################################################################
+    @property
+    def rank(self) -> int:
+        """How far along a trainer at this level is, for "at least this level"
+        comparisons. The values themselves are only storage IDs."""
+
+        return {
+            TrainingLevel.Active: 4,
+            TrainingLevel.OnHold: 3,
+            TrainingLevel.Pending: 2,
+            TrainingLevel.Inactive: 1,
+        }.get(self, 0)
+    
 ################################################################################    
     @property
     def emoji(self) -> PartialEmoji:
@@ -594,4 +608,12 @@ class ViewType(Enum):
     EndTimeSelect = 2
     
 ################################################################################
-    
\ No newline at end of file
+    
+class StartupState(Enum):
+    
+    Cold = 0
+    Loading = 1
+    Ready = 2
+    Failed = 3
+    
+################################################################################
@@ -21,6 +21,7 @@ __all__ = (
     "TraineeMissingError",
     "UnqualifiedError",
     "ChannelNotSetError",
+    "WarmingUpError",
 )
 
 ################################################################################
@@ -190,3 +191,14 @@ class ChannelNotSetError(ErrorMessage):
         )
         
 ################################################################################
+class WarmingUpError(ErrorMessage):
+    
+    def __init__(self):
+        
+        super().__init__(
+            title="Warming Up",
+            message=f"The bot has only just started and is still loading its data.",
+            solution=f"Try the command again in a few seconds."
+        )
+        
+################################################################################